@@ -1,205 +1,749 @@
-import re
-
-# ==================================================
-# PART 1 – REGULAR EXPRESSION UTILITIES
-# ==================================================
-
-STUDENT_PATTERN = re.compile(
-    r"""
-    ID:\s*(?P<id>\d{4}-\d{3})\s*\|\s*
-    Name:\s*(?P<name>[A-Za-z\s]+)\s*\|\s*
-    Email:\s*(?P<email>[^\s|]+)\s*\|\s*
-    Age:\s*(?P<age>\d+)
-    """,
-    re.VERBOSE
-)
-
-EMAIL_PATTERN = re.compile(
-    r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-)
-
-ID_PATTERN = re.compile(r'^\d{4}-\d{3}$')
-NAME_PATTERN = re.compile(r'^[A-Za-z\s]+$')
-
-
-def extract_student_data(data: str) -> dict | None:
-    """Extract student data using named regex groups."""
-    match = STUDENT_PATTERN.search(data)
-    return match.groupdict() if match else None
-
-
-def validate_email(email: str) -> bool:
-    """Validate email format."""
-    return EMAIL_PATTERN.fullmatch(email) is not None
-
-
-def validate_student_id(student_id: str) -> bool:
-    """Validate student ID format (YYYY-XXX)."""
-    return ID_PATTERN.fullmatch(student_id) is not None
-
-
-def validate_name(name: str) -> bool:
-    """Validate name (letters and spaces only)."""
-    return NAME_PATTERN.fullmatch(name.strip()) is not None
-
-
-def mask_email(email: str) -> str:
-    """Mask email username while keeping domain."""
-    return re.sub(r'^[^@]+', '*****', email)
-
-
-def find_all_words(text: str) -> list:
-    """Find all words using regex."""
-    return re.findall(r'[A-Za-z]+', text)
-
-
-# ==================================================
-# PART 2 – OBJECT-ORIENTED PROGRAMMING
-# ==================================================
-
-class Student:
-    """Represents a student."""
-
-    def __init__(self, student_id: str, name: str, email: str, age: int):
-        if not validate_student_id(student_id):
-            raise ValueError("Invalid student ID format")
-        if not validate_name(name):
-            raise ValueError("Invalid name format")
-        if not validate_email(email):
-            raise ValueError("Invalid email format")
-        if age <= 0:
-            raise ValueError("Invalid age")
-
-        self.student_id = student_id
-        self.name = name
-        self._email = email
-        self._age = age
-
-    @property
-    def email(self):
-        return self._email
-
-    @email.setter
-    def email(self, value):
-        if not validate_email(value):
-            raise ValueError("Invalid email format")
-        self._email = value
-
-    @property
-    def age(self):
-        return self._age
-
-    @age.setter
-    def age(self, value):
-        if not isinstance(value, int) or value <= 0:
-            raise ValueError("Invalid age")
-        self._age = value
-
-    def display_info(self):
-        """Display student information."""
-        print(f"Student ID : {self.student_id}")
-        print(f"Name       : {self.name}")
-        print(f"Email      : {self.email}")
-        print(f"Age        : {self.age}")
-
-
-class Scholar(Student):
-    """Represents a scholar student."""
-
-    def __init__(self, student_id, name, email, age, scholarship_type):
-        super().__init__(student_id, name, email, age)
-        self.scholarship_type = scholarship_type
-
-    def display_info(self):
-        super().display_info()
-        print(f"Scholarship: {self.scholarship_type}")
-
-
-# ==================================================
-# PART 3 – INTEGRATION & PROCESSING
-# ==================================================
-
-def process_students(students_raw: list) -> list:
-    """Convert raw text entries into Student / Scholar objects."""
-    students = []
-
-    for entry in students_raw:
-        data = extract_student_data(entry)
-
-        if not data:
-            print(f"❌ Failed to parse entry:\n{entry}\n")
-            continue
-
-        student_id = data['id']
-        name = data['name'].strip()
-        email = data['email']
-        age = int(data['age'])
-
-        scholarship_match = re.search(r'Scholarship:\s*(\w+)', entry)
-
-        try:
-            if scholarship_match:
-                student = Scholar(
-                    student_id, name, email, age,
-                    scholarship_match.group(1)
-                )
-            else:
-                student = Student(student_id, name, email, age)
-
-            students.append(student)
-
-        except ValueError as error:
-            print(f"❌ Error processing student: {error}")
-
-    return students
-
-
-# ==================================================
-# MAIN PROGRAM – DEMONSTRATION
-# ==================================================
-
-if __name__ == "__main__":
-
-    print("=" * 70)
-    print("STUDENT INFORMATION PROCESSING SYSTEM")
-    print("=" * 70, "\n")
-
-    students_raw = [
-        "ID: 2025-001 | Name: Juan Dela Cruz | Email: juan.cruz@example.com | Age: 20",
-        "ID: 2025-002 | Name: Maria Santos | Email: maria.santos@school.edu | Age: 21 | Scholarship: Academic",
-        "ID: 2025-003 | Name: Pedro Reyes | Email: pedro.reyes@university.ph | Age: 22",
-        "ID: 2025-004 | Name: Ana Gonzales | Email: ana.gonzales@school.edu | Age: 19 | Scholarship: Athletic"
-    ]
-
-    students = process_students(students_raw)
-
-    print(f"\nSuccessfully processed {len(students)} student(s)\n")
-    print("=" * 70)
-
-    for i, student in enumerate(students, 1):
-        student.display_info()
-        if i < len(students):
-            print("-" * 70)
-
-    print("\n" + "=" * 70)
-    print("EXTRA TASK DEMONSTRATIONS")
-    print("=" * 70, "\n")
-
-    print("Email Masking Example:")
-    email = "juan.cruz@example.com"
-    print(f"Original: {email}")
-    print(f"Masked  : {mask_email(email)}\n")
-
-    print("Find Words in Name:")
-    name = "Juan Dela Cruz"
-    print(f"Words: {find_all_words(name)}\n")
-
-    print("Email Validation via Property:")
-    student = students[0]
-    print(f"Old Email: {student.email}")
-    student.email = "updated.email@valid.com"
-    print(f"New Email: {student.email}")
-
-    print("\n" + "=" * 70)
-    print("PROGRAM COMPLETED SUCCESSFULLY")
-    print("=" * 70)
+import mmap
+import os
+import re
+import sys
+import time
+from array import array
+from collections import Counter
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Tuple
+
+try:
+    from .metrics import METRICS
+    from .parallel import ordered_pool_map, process_pool
+except ImportError:  # run as a script
+    from metrics import METRICS
+    from parallel import ordered_pool_map, process_pool
+
+# ==================================================
+# PART 1 – REGULAR EXPRESSION UTILITIES
+# ==================================================
+
+STUDENT_PATTERN = re.compile(
+    r"""
+    ID:\s*(?P<id>\d{4}-\d{3})\s*\|\s*
+    Name:\s*(?P<name>[A-Za-z\s]+)\s*\|\s*
+    Email:\s*(?P<email>[^\s|]+)\s*\|\s*
+    Age:\s*(?P<age>\d+)
+    """,
+    re.VERBOSE
+)
+
+EMAIL_PATTERN = re.compile(
+    r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+)
+
+# Line-oriented bytes variant used by the streaming reader: one pass per
+# record picks up the optional Scholarship field and the rest of the line.
+STUDENT_RECORD_PATTERN = re.compile(
+    rb"""
+    ID:[^\S\n]*(?P<id>\d{4}-\d{3})[^\S\n]*\|[^\S\n]*
+    Name:[^\S\n]*(?P<name>[A-Za-z \t]+)\|[^\S\n]*
+    Email:[^\S\n]*(?P<email>[^\s|]+)[^\S\n]*\|[^\S\n]*
+    Age:[^\S\n]*(?P<age>\d+)
+    (?:[^\n]*?Scholarship:[^\S\n]*(?P<scholarship>\w+))?
+    [^\n]*
+    """,
+    re.VERBOSE
+)
+
+ID_PATTERN = re.compile(r'^\d{4}-\d{3}$')
+NAME_PATTERN = re.compile(r'^[A-Za-z\s]+$')
+
+
+@METRICS.timed("parse_seconds")
+def extract_student_data(data: str) -> dict | None:
+    """Extract student data using named regex groups."""
+    match = STUDENT_PATTERN.search(data)
+    return match.groupdict() if match else None
+
+
+def validate_email(email: str) -> bool:
+    """Validate email format."""
+    return EMAIL_PATTERN.fullmatch(email) is not None
+
+
+def validate_student_id(student_id: str) -> bool:
+    """Validate student ID format (YYYY-XXX)."""
+    return ID_PATTERN.fullmatch(student_id) is not None
+
+
+def validate_name(name: str) -> bool:
+    """Validate name (letters and spaces only)."""
+    return NAME_PATTERN.fullmatch(name.strip()) is not None
+
+
+def mask_email(email: str) -> str:
+    """Mask email username while keeping domain."""
+    return re.sub(r'^[^@]+', '*****', email)
+
+
+def find_all_words(text: str) -> list:
+    """Find all words using regex."""
+    return re.findall(r'[A-Za-z]+', text)
+
+
+# ==================================================
+# PART 2 – OBJECT-ORIENTED PROGRAMMING
+# ==================================================
+
+class Student:
+    """Represents a student."""
+
+    def __init__(self, student_id: str, name: str, email: str, age: int):
+        if not validate_student_id(student_id):
+            raise ValueError("Invalid student ID format")
+        if not validate_name(name):
+            raise ValueError("Invalid name format")
+        if not validate_email(email):
+            raise ValueError("Invalid email format")
+        if age <= 0:
+            raise ValueError("Invalid age")
+
+        self.student_id = student_id
+        self.name = name
+        self._email = email
+        self._age = age
+
+    @property
+    def email(self):
+        return self._email
+
+    @email.setter
+    def email(self, value):
+        if not validate_email(value):
+            raise ValueError("Invalid email format")
+        self._email = value
+
+    @property
+    def age(self):
+        return self._age
+
+    @age.setter
+    def age(self, value):
+        if not isinstance(value, int) or value <= 0:
+            raise ValueError("Invalid age")
+        self._age = value
+
+    def display_info(self):
+        """Display student information."""
+        print(f"Student ID : {self.student_id}")
+        print(f"Name       : {self.name}")
+        print(f"Email      : {self.email}")
+        print(f"Age        : {self.age}")
+
+
+class Scholar(Student):
+    """Represents a scholar student."""
+
+    def __init__(self, student_id, name, email, age, scholarship_type):
+        super().__init__(student_id, name, email, age)
+        self.scholarship_type = scholarship_type
+
+    def display_info(self):
+        super().display_info()
+        print(f"Scholarship: {self.scholarship_type}")
+
+
+# ==================================================
+# PART 3 – INTEGRATION & PROCESSING
+# ==================================================
+
+@METRICS.timed("validate_seconds")
+def build_student(student_id: str, name: str, email: str, age: int,
+                  scholarship_type: str | None = None) -> Student:
+    """Create a Scholar if a scholarship is given, otherwise a Student."""
+    if scholarship_type:
+        return Scholar(student_id, name, email, age, scholarship_type)
+    return Student(student_id, name, email, age)
+
+
+PARSE_FAILED = "Failed to parse entry"
+
+
+def report_error(entry: str, message: str) -> None:
+    """Default error reporter used by the processing functions."""
+    if message == PARSE_FAILED:
+        print(f"❌ {PARSE_FAILED}:\n{entry}\n")
+    else:
+        print(f"❌ Error processing student: {message}")
+
+
+def _counting(on_error):
+    """Wrap an error callback so failures are counted by reason (when metrics are on)."""
+    if not METRICS.enabled:
+        return on_error
+
+    def counted(entry: str, message: str) -> None:
+        reason = "no_match" if message == PARSE_FAILED else message.lower().replace(" ", "_")
+        METRICS.increment("parse_failures_total", reason=reason)
+        on_error(entry, message)
+
+    return counted
+
+
+def process_students(students_raw: list, on_error=report_error) -> list:
+    """Convert raw text entries into Student / Scholar objects."""
+    students = []
+    on_error = _counting(on_error)
+
+    for entry in students_raw:
+        data = extract_student_data(entry)
+
+        if not data:
+            on_error(entry, PARSE_FAILED)
+            continue
+
+        student_id = data['id']
+        name = data['name'].strip()
+        email = data['email']
+        age = int(data['age'])
+
+        scholarship_match = re.search(r'Scholarship:\s*(\w+)', entry)
+
+        try:
+            student = build_student(
+                student_id, name, email, age,
+                scholarship_match.group(1) if scholarship_match else None
+            )
+            students.append(student)
+
+        except ValueError as error:
+            on_error(entry, str(error))
+
+    return students
+
+
+def iter_students_from_buffer(buffer, start: int = 0, end: int | None = None,
+                              on_error=report_error) -> Iterator[Student]:
+    """Yield Student / Scholar objects from a bytes-like buffer, one line per record.
+
+    The buffer is walked line by line, so a line that does not parse is
+    passed to ``on_error`` as soon as it is read and memory stays flat
+    however long an unparseable stretch is.
+    """
+    if end is None:
+        end = len(buffer)
+    position = start
+    on_error = _counting(on_error)
+    find_newline = buffer.find
+    search = STUDENT_RECORD_PATTERN.search
+
+    while position < end:
+        line_end = find_newline(b'\n', position, end)
+        if line_end < 0:
+            line_end = end
+        # A record never spans lines; text before it on its line is ignored.
+        match = search(buffer, position, line_end)
+        if match is None:
+            line = buffer[position:line_end]
+            if line.strip():
+                on_error(line.decode('utf-8', 'replace').rstrip('\r'), PARSE_FAILED)
+        else:
+            student_id, name, email, age, scholarship = match.groups()
+            try:
+                yield build_student(
+                    student_id.decode(),
+                    name.decode().strip(),
+                    email.decode('utf-8', 'replace'),
+                    int(age),
+                    scholarship.decode() if scholarship else None
+                )
+            except ValueError as error:
+                on_error(match.group().decode('utf-8', 'replace').rstrip('\r'), str(error))
+        position = line_end + 1
+
+
+def iter_students_from_file(path: str, on_error=report_error) -> Iterator[Student]:
+    """Lazily yield Student / Scholar objects from a memory-mapped text file."""
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from iter_students_from_buffer(buffer, on_error=on_error)
+
+
+def _process_entry_chunk(entries: list) -> tuple:
+    """Worker: parse one chunk of raw entries, collecting errors."""
+    errors = []
+    students = process_students(
+        entries, on_error=lambda entry, message: errors.append((entry, message))
+    )
+    return students, errors
+
+
+def _process_byte_range(path: str, start: int, end: int) -> tuple:
+    """Worker: parse one newline-aligned byte range of a file, collecting errors."""
+    errors = []
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            students = list(iter_students_from_buffer(
+                buffer, start, end,
+                on_error=lambda entry, message: errors.append((entry, message))
+            ))
+    return students, errors
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _byte_ranges(path: str, chunk_bytes: int) -> list:
+    """Split a file into byte ranges that end on a newline."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    ranges = []
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start = 0
+            while start < size:
+                end = buffer.find(b'\n', min(start + chunk_bytes, size) - 1)
+                end = size if end == -1 else end + 1
+                ranges.append((start, end))
+                start = end
+    return ranges
+
+
+def _collect(results) -> tuple:
+    """Flatten ordered per-chunk results into students and error reports."""
+    students = []
+    reports = []
+    for chunk_index, (chunk_students, errors) in enumerate(results):
+        students.extend(chunk_students)
+        if errors:
+            reports.append({'chunk': chunk_index, 'errors': errors})
+    return students, reports
+
+
+def process_students_parallel(students_raw: Iterable, chunk_size: int = 10_000,
+                              workers: int | None = None) -> tuple:
+    """Parse raw entries on a process pool.
+
+    Returns ``(students, error_reports)``; students keep input order and each
+    report holds the ``(entry, message)`` pairs of one chunk.
+    """
+    with process_pool(workers) as pool:
+        results = pool.map(_process_entry_chunk, _chunked(students_raw, chunk_size))
+        return _collect(results)
+
+
+def process_students_file_parallel(path: str, chunk_bytes: int = 32 * 1024 * 1024,
+                                   workers: int | None = None) -> tuple:
+    """Parse a student file on a process pool, one byte range per task."""
+    ranges = _byte_ranges(path, chunk_bytes)
+    with process_pool(workers) as pool:
+        results = pool.map(
+            _process_byte_range,
+            [path] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges]
+        )
+        return _collect(results)
+
+
+def benchmark_parallel(count: int = 200_000, chunk_size: int = 10_000,
+                       workers: int | None = None) -> dict:
+    """Compare serial and parallel processing on synthetic entries."""
+    entries = [
+        f"ID: 2025-{i % 1000:03d} | Name: Student Number | "
+        f"Email: student{i}@school.edu | Age: {18 + i % 10}"
+        + (" | Scholarship: Academic" if i % 4 == 0 else "")
+        for i in range(count)
+    ]
+
+    start = time.perf_counter()
+    process_students(entries, on_error=lambda entry, message: None)
+    serial = time.perf_counter() - start
+
+    start = time.perf_counter()
+    process_students_parallel(entries, chunk_size=chunk_size, workers=workers)
+    parallel = time.perf_counter() - start
+
+    print(f"Serial   : {serial:.3f}s")
+    print(f"Parallel : {parallel:.3f}s")
+    print(f"Speedup  : {serial / parallel:.2f}x")
+    return {'count': count, 'serial': serial, 'parallel': parallel,
+            'speedup': serial / parallel}
+
+
+# ==================================================
+# PART 4 – COMPACT COLUMNAR STORAGE
+# ==================================================
+
+class StudentRow:
+    """Lightweight view of one row in a StudentTable."""
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'StudentTable', index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def student_id(self):
+        value = self._table._ids[self._index]
+        return f"{value // 1000:04d}-{value % 1000:03d}"
+
+    @property
+    def name(self):
+        return self._table._names[self._index]
+
+    @property
+    def email(self):
+        return self._table._emails[self._index]
+
+    @email.setter
+    def email(self, value):
+        self._table.set_email(self._index, value)
+
+    @property
+    def age(self):
+        return self._table._ages[self._index]
+
+    @age.setter
+    def age(self, value):
+        self._table.set_age(self._index, value)
+
+    @property
+    def scholarship_type(self):
+        table = self._table
+        return table._scholarship_types[table._scholarship_codes[self._index]]
+
+    def display_info(self):
+        """Display student information."""
+        print(f"Student ID : {self.student_id}")
+        print(f"Name       : {self.name}")
+        print(f"Email      : {self.email}")
+        print(f"Age        : {self.age}")
+        if self.scholarship_type:
+            print(f"Scholarship: {self.scholarship_type}")
+
+
+class StudentTable:
+    """Column-oriented student storage with the same rules as Student."""
+
+    def __init__(self):
+        self._ids = array('I')
+        self._ages = array('I')
+        self._names = []
+        self._emails = []
+        self._scholarship_codes = array('H')
+        self._scholarship_types = [None]
+        self._scholarship_lookup = {}
+
+    def append(self, student_id: str, name: str, email: str, age: int,
+               scholarship_type: str | None = None) -> int:
+        """Validate and append one student, returning its row index."""
+        if not validate_student_id(student_id):
+            raise ValueError("Invalid student ID format")
+        if not validate_name(name):
+            raise ValueError("Invalid name format")
+        if not validate_email(email):
+            raise ValueError("Invalid email format")
+        age = self._column_age(age)
+        packed_id = int(student_id[:4]) * 1000 + int(student_id[5:])
+
+        code = 0
+        if scholarship_type:
+            code = self._scholarship_lookup.get(scholarship_type)
+            if code is None:
+                code = len(self._scholarship_types)
+                if code > 0xFFFF and self._scholarship_codes.typecode == 'H':
+                    # Past 65,536 types the codes no longer fit in 16 bits.
+                    self._scholarship_codes = array('I', self._scholarship_codes)
+                self._scholarship_types.append(sys.intern(scholarship_type))
+                self._scholarship_lookup[scholarship_type] = code
+
+        # Everything is converted above and the code column is wide enough,
+        # so no append below can fail and leave the columns out of step.
+        self._ids.append(packed_id)
+        self._ages.append(age)
+        self._names.append(sys.intern(name))
+        self._emails.append(sys.intern(email))
+        self._scholarship_codes.append(code)
+        return len(self._ids) - 1
+
+    def add(self, student: Student) -> int:
+        """Append an existing Student / Scholar object."""
+        return self.append(student.student_id, student.name, student.email,
+                           student.age, getattr(student, 'scholarship_type', None))
+
+    def extend(self, students: Iterable) -> None:
+        """Append many Student / Scholar objects."""
+        for student in students:
+            self.add(student)
+
+    def set_email(self, index: int, value: str) -> None:
+        if not validate_email(value):
+            raise ValueError("Invalid email format")
+        self._emails[index] = sys.intern(value)
+
+    def set_age(self, index: int, value: int) -> None:
+        if not isinstance(value, int):
+            raise ValueError("Invalid age")
+        self._ages[index] = self._column_age(value)
+
+    @staticmethod
+    def _column_age(age) -> int:
+        """Age as stored in the unsigned 32-bit age column.
+
+        Raises ValueError, like Student, for non-positive ages and for ages
+        the column cannot hold (fractional, or 2**32 and above).
+        """
+        if not 0 < age < 1 << 32 or age != int(age):
+            raise ValueError("Invalid age")
+        return int(age)
+
+    def columns(self) -> dict:
+        """Columns for analytics: names, ages, and scholarship types (None for none)."""
+        return {
+            'name': self._names,
+            'age': self._ages,
+            'scholarship_type': list(map(self._scholarship_types.__getitem__,
+                                         self._scholarship_codes)),
+        }
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> StudentRow:
+        if index < 0:
+            index += len(self._ids)
+        if not 0 <= index < len(self._ids):
+            raise IndexError("StudentTable index out of range")
+        return StudentRow(self, index)
+
+    def __iter__(self) -> Iterator[StudentRow]:
+        for index in range(len(self._ids)):
+            yield StudentRow(self, index)
+
+    def memory_usage(self) -> int:
+        """Approximate bytes used by the columns and their strings."""
+        total = sum(sys.getsizeof(column) for column in (
+            self._ids, self._ages, self._names, self._emails,
+            self._scholarship_codes, self._scholarship_types,
+            self._scholarship_lookup
+        ))
+        seen = set()
+        for value in (*self._names, *self._emails, *self._scholarship_types[1:]):
+            if id(value) not in seen:
+                seen.add(id(value))
+                total += sys.getsizeof(value)
+        return total
+
+
+def object_memory_usage(students: list) -> int:
+    """Approximate bytes used by a list of Student / Scholar objects."""
+    total = sys.getsizeof(students)
+    seen = set()
+    for student in students:
+        total += sys.getsizeof(student) + sys.getsizeof(student.__dict__)
+        for value in student.__dict__.values():
+            if id(value) not in seen:
+                seen.add(id(value))
+                total += sys.getsizeof(value)
+    return total
+
+
+def compare_memory(count: int = 100_000) -> dict:
+    """Report memory of the object-based path next to StudentTable."""
+    students = [
+        build_student(
+            f"2025-{i % 1000:03d}", f"Student {chr(65 + i % 26)}",
+            f"student{i}@school.edu", 18 + i % 10,
+            ("Academic", "Athletic", None, None)[i % 4]
+        )
+        for i in range(count)
+    ]
+    table = StudentTable()
+    table.extend(students)
+
+    objects = object_memory_usage(students)
+    columnar = table.memory_usage()
+    print(f"Objects : {objects / 1024 / 1024:.1f} MiB")
+    print(f"Table   : {columnar / 1024 / 1024:.1f} MiB")
+    return {'count': count, 'objects': objects, 'table': columnar}
+
+
+# ==================================================
+# PART 5 – STREAMING PII REDACTION
+# ==================================================
+
+# Unanchored forms of EMAIL_PATTERN and ID_PATTERN for scanning free text.
+# Each scan starts on a literal ('@' or the ID's '-'), which the regex
+# engine finds with a fast memchr-style search; the rest of the match is
+# checked by lookbehind (ID digits) or by looking back from '@' (email
+# username). An alternation of the two would lose that fast path. No match
+# can contain whitespace, so chunks cut on whitespace never split one.
+EMAIL_DOMAIN_PATTERN = re.compile(rb"@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+EMAIL_USER_REVERSED = re.compile(rb"[a-zA-Z0-9._%+-]+")
+STUDENT_ID_SCAN_PATTERN = re.compile(rb"-(?<=(?<![\w.%+-])\d{4}-)\d{3}(?![\w@-])")
+EMAIL_MASK = b"*****"
+STUDENT_ID_MASK = b"****-***"
+
+
+def _email_user_start(data: bytes, floor: int, at: int) -> int:
+    """Start of the email username ending at ``at`` (no earlier than ``floor``).
+
+    Looks back through a window that grows until the username run ends
+    inside it, so long usernames are masked whole; returns ``at`` if there
+    is no username.
+    """
+    window = 64
+    while True:
+        low = max(floor, at - window)
+        user = EMAIL_USER_REVERSED.match(data[low:at][::-1])
+        length = user.end() if user else 0
+        if length < at - low or low == floor:
+            return at - length
+        window *= 4
+
+
+def redact(data: bytes) -> Tuple[bytes, Counter]:
+    """Mask emails (like mask_email) and student IDs; count matches by kind."""
+    spans = [(match.start(), match.end(), 'email')
+             for match in EMAIL_DOMAIN_PATTERN.finditer(data)]
+    spans += [(match.start() - 4, match.end(), 'student_id')
+              for match in STUDENT_ID_SCAN_PATTERN.finditer(data)]
+    spans.sort()
+
+    counts = Counter()
+    pieces = []
+    position = 0
+    for start, end, kind in spans:
+        if start < position:
+            continue  # overlaps the previous match
+        if kind == 'email':
+            user_start = _email_user_start(data, position, start)
+            if user_start == start:
+                continue  # '@host' without a username is not an email
+            pieces += (data[position:user_start], EMAIL_MASK, data[start:end])
+        else:
+            pieces += (data[position:start], STUDENT_ID_MASK)
+        counts[kind] += 1
+        position = end
+    pieces.append(data[position:])
+    return b"".join(pieces), counts
+
+
+def iter_whitespace_chunks(file, chunk_bytes: int) -> Iterator[bytes]:
+    """Read a binary file in chunks that end on whitespace (so no PII match is cut)."""
+    carry = b""
+    while block := file.read(chunk_bytes):
+        block = carry + block
+        cut = max(block.rfind(b"\n"), block.rfind(b" "), block.rfind(b"\t"))
+        if cut == -1:
+            carry = block
+            continue
+        carry = block[cut + 1:]
+        yield block[:cut + 1]
+    if carry:
+        yield carry
+
+
+def redact_file(source: str, destination: str, chunk_bytes: int = 8 * 1024 * 1024,
+                workers: int | None = 1) -> Dict[str, float]:
+    """Redact a text file chunk by chunk; ``workers`` > 1 (or None) uses a process pool.
+
+    Output order is preserved and at most ``2 * workers`` chunks are in
+    flight. Returns the match counts and throughput.
+    """
+    counts = Counter()
+    size = 0
+    start = time.perf_counter()
+    with open(source, 'rb') as infile, open(destination, 'wb') as outfile:
+        chunks = iter_whitespace_chunks(infile, chunk_bytes)
+        if workers == 1:
+            results = map(redact, chunks)
+        else:
+            results = ordered_pool_map(redact, chunks, workers)
+        for redacted, chunk_counts in results:
+            outfile.write(redacted)
+            counts.update(chunk_counts)
+            size += len(redacted)
+    seconds = time.perf_counter() - start
+    return {
+        'emails': counts['email'],
+        'student_ids': counts['student_id'],
+        'bytes': size,
+        'seconds': seconds,
+        'mb_per_s': size / 1_000_000 / seconds if seconds else 0.0,
+    }
+
+
+def benchmark_redaction(megabytes: int = 64, workers: int | None = None) -> dict:
+    """Serial vs parallel redaction throughput on a synthetic application log."""
+    import tempfile
+
+    pii_line = ("2025-03-01 12:00:00 INFO lookup ok for student 2025-{:03d} "
+                "(contact juan.cruz{}@school.edu) after 12 ms retry=0\n")
+    plain_line = "2025-03-01 12:00:01 DEBUG cache hit key=records:view:{} size=2048 ttl=300s\n"
+    # One line in ten carries PII.
+    block = "".join((pii_line if i % 10 == 0 else plain_line).format(i % 1000, i)
+                    for i in range(10_000)).encode()
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "app.log")
+        with open(source, 'wb') as file:
+            for _ in range(max(1, megabytes * 1_000_000 // len(block))):
+                file.write(block)
+        serial = redact_file(source, os.path.join(directory, "serial.log"), workers=1)
+        parallel = redact_file(source, os.path.join(directory, "parallel.log"), workers=workers)
+
+    print(f"Serial   : {serial['mb_per_s']:.1f} MB/s "
+          f"({serial['emails']:,} emails, {serial['student_ids']:,} IDs)")
+    print(f"Parallel : {parallel['mb_per_s']:.1f} MB/s")
+    return {'serial': serial, 'parallel': parallel}
+
+
+# ==================================================
+# MAIN PROGRAM – DEMONSTRATION
+# ==================================================
+
+if __name__ == "__main__":
+
+    print("=" * 70)
+    print("STUDENT INFORMATION PROCESSING SYSTEM")
+    print("=" * 70, "\n")
+
+    students_raw = [
+        "ID: 2025-001 | Name: Juan Dela Cruz | Email: juan.cruz@example.com | Age: 20",
+        "ID: 2025-002 | Name: Maria Santos | Email: maria.santos@school.edu | Age: 21 | Scholarship: Academic",
+        "ID: 2025-003 | Name: Pedro Reyes | Email: pedro.reyes@university.ph | Age: 22",
+        "ID: 2025-004 | Name: Ana Gonzales | Email: ana.gonzales@school.edu | Age: 19 | Scholarship: Athletic"
+    ]
+
+    students = process_students(students_raw)
+
+    print(f"\nSuccessfully processed {len(students)} student(s)\n")
+    print("=" * 70)
+
+    for i, student in enumerate(students, 1):
+        student.display_info()
+        if i < len(students):
+            print("-" * 70)
+
+    print("\n" + "=" * 70)
+    print("EXTRA TASK DEMONSTRATIONS")
+    print("=" * 70, "\n")
+
+    print("Email Masking Example:")
+    email = "juan.cruz@example.com"
+    print(f"Original: {email}")
+    print(f"Masked  : {mask_email(email)}\n")
+
+    print("Find Words in Name:")
+    name = "Juan Dela Cruz"
+    print(f"Words: {find_all_words(name)}\n")
+
+    print("Email Validation via Property:")
+    student = students[0]
+    print(f"Old Email: {student.email}")
+    student.email = "updated.email@valid.com"
+    print(f"New Email: {student.email}")
+
+    print("\n" + "=" * 70)
+    print("PROGRAM COMPLETED SUCCESSFULLY")
+    print("=" * 70)
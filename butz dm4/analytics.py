@@ -0,0 +1,235 @@
+# ==================================================
+# GROUP-BY ANALYTICS
+# count / mean / min / max / percentiles per group over
+# columnar data from StudentDatabase, StudentManager,
+# StudentTable or a columnar snapshot (read_columns).
+# ==================================================
+
+import bisect
+import math
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # group_stats falls back to pure Python
+    np = None
+
+GRADE_POINTS = {
+    "A+": 4.0, "A": 4.0, "A-": 3.7,
+    "B+": 3.3, "B": 3.0, "B-": 2.7,
+    "C+": 2.3, "C": 2.0, "C-": 1.7,
+    "D+": 1.3, "D": 1.0, "D-": 0.7,
+    "F": 0.0,
+}
+
+# Lowest numeric grade (0-100) for each letter, ascending.
+LETTER_CUTOFFS = ((60, "D-"), (63, "D"), (67, "D+"), (70, "C-"), (73, "C"), (77, "C+"),
+                  (80, "B-"), (83, "B"), (87, "B+"), (90, "A-"), (93, "A"))
+_CUTOFF_SCORES = [score for score, _ in LETTER_CUTOFFS]
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+Columns = Dict[str, Sequence]
+GroupStats = Dict[Any, Dict[str, Optional[float]]]
+
+
+def letter_grade(score: float) -> str:
+    """Letter for a numeric grade on the 0-100 scale."""
+    position = bisect.bisect_right(_CUTOFF_SCORES, score)
+    return LETTER_CUTOFFS[position - 1][1] if position else "F"
+
+
+def _encode(keys: Sequence) -> Tuple[list, Any]:
+    """Dictionary-encode group keys: (labels in first-seen order, code iterator)."""
+    labels = list(dict.fromkeys(keys))
+    code_of = {label: code for code, label in enumerate(labels)}
+    return labels, map(code_of.__getitem__, keys)
+
+
+def _interpolate(ordered: Sequence[float], start: int, count: int, percent: float) -> float:
+    position = start + (count - 1) * percent / 100
+    lower = math.floor(position)
+    value = ordered[lower]
+    if position == lower:
+        return value
+    return value + (ordered[lower + 1] - value) * (position - lower)
+
+
+def _group_stats_python(keys: Sequence, values: Sequence,
+                        percentiles: Sequence[float]) -> GroupStats:
+    labels, codes = _encode(keys)
+    buckets: List[List[float]] = [[] for _ in labels]
+    for code, value in zip(codes, values):
+        if value is not None and value == value:  # skip None and NaN
+            buckets[code].append(value)
+
+    result = {}
+    for label, bucket in zip(labels, buckets):
+        stats = {'count': len(bucket)}
+        if bucket:
+            bucket.sort()
+            stats.update(mean=math.fsum(bucket) / len(bucket), min=bucket[0], max=bucket[-1])
+            for percent in percentiles:
+                stats[f"p{percent:g}"] = _interpolate(bucket, 0, len(bucket), percent)
+        else:
+            stats.update(mean=None, min=None, max=None)
+            stats.update({f"p{percent:g}": None for percent in percentiles})
+        result[label] = stats
+    return result
+
+
+def _group_stats_numpy(keys: Sequence, values: Sequence,
+                       percentiles: Sequence[float]) -> GroupStats:
+    labels, codes = _encode(keys)
+    code_type = np.uint16 if len(labels) <= 1 << 16 else np.intp
+    codes = np.fromiter(codes, dtype=code_type, count=len(keys))
+    values = np.asarray(values, dtype=float)  # None becomes NaN
+    valid = ~np.isnan(values)
+    if not valid.all():
+        codes, values = codes[valid], values[valid]
+
+    # One stable sort by group, then each group's slice sorted in place.
+    ordered = values[np.argsort(codes, kind="stable")]
+    counts = np.bincount(codes, minlength=len(labels))
+    sums = np.bincount(codes, weights=values, minlength=len(labels))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    for start, count in zip(starts.tolist(), counts.tolist()):
+        if count > 1:
+            ordered[start:start + count].sort()
+
+    present = counts > 0
+    last = np.where(present, starts + counts - 1, 0)
+    columns = {
+        'count': counts,
+        'mean': np.divide(sums, counts, out=np.zeros(len(labels)), where=present),
+        'min': ordered[np.where(present, starts, 0)] if len(ordered) else np.zeros(len(labels)),
+        'max': ordered[last] if len(ordered) else np.zeros(len(labels)),
+    }
+    for percent in percentiles:
+        position = starts + np.maximum(counts - 1, 0) * percent / 100
+        lower = np.floor(position).astype(np.intp)
+        upper = np.minimum(lower + 1, last)
+        if len(ordered):
+            low_values = ordered[np.where(present, lower, 0)]
+            high_values = ordered[np.where(present, upper, 0)]
+            columns[f"p{percent:g}"] = low_values + (high_values - low_values) * (position - lower)
+        else:
+            columns[f"p{percent:g}"] = np.zeros(len(labels))
+
+    listed = {name: column.tolist() for name, column in columns.items()}
+    result = {}
+    for index, label in enumerate(labels):
+        if listed['count'][index]:
+            result[label] = {name: column[index] for name, column in listed.items()}
+        else:
+            result[label] = {name: 0 if name == 'count' else None for name in listed}
+    return result
+
+
+def group_stats(keys: Sequence, values: Sequence,
+                percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> GroupStats:
+    """Per-group count, mean, min, max and percentiles (linearly interpolated).
+
+    ``keys`` and ``values`` are equally long columns; None / NaN values are
+    ignored. Groups appear in first-seen order. Uses one sort over all rows
+    with NumPy, or one bucketing pass in pure Python.
+    """
+    if len(keys) != len(values):
+        raise ValueError("keys and values must have the same length")
+    if np is None:
+        return _group_stats_python(keys, values, percentiles)
+    return _group_stats_numpy(keys, values, percentiles)
+
+
+def group_by(columns: Columns, by: str, value: str,
+             percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> GroupStats:
+    """group_stats over two named columns of a column dict."""
+    return group_stats(columns[by], columns[value], percentiles)
+
+
+# -----------------------------
+# COLUMN ADAPTERS
+# -----------------------------
+
+def add_grade_points(columns: Columns, grade_column: str = 'grade') -> Columns:
+    """Add a 'grade_points' column mapping letter grades (unknown letters -> None)."""
+    columns['grade_points'] = list(map(GRADE_POINTS.get, columns[grade_column]))
+    return columns
+
+
+def database_columns(database) -> Columns:
+    """Columns of a StudentDatabase: student_id, name, grade, major, grade_points."""
+    students = database.snapshot()
+    rows = students.values()
+    return add_grade_points({
+        'student_id': list(students),
+        'name': [info['name'] for info in rows],
+        'grade': [info['grade'] for info in rows],
+        'major': [info['major'] for info in rows],
+    })
+
+
+def manager_columns(manager) -> Columns:
+    """Columns of a StudentManager: name, grade (0-100) and its letter."""
+    grades = [student['grade'] for student in manager.students]
+    return {
+        'name': [student['name'] for student in manager.students],
+        'grade': grades,
+        'letter': list(map(letter_grade, grades)),
+    }
+
+
+def database_report(database, by: str = 'major',
+                    percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> GroupStats:
+    """Grade-point statistics of a StudentDatabase grouped by 'major' or 'grade'."""
+    return group_by(database_columns(database), by, 'grade_points', percentiles)
+
+
+def manager_report(manager, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> GroupStats:
+    """Numeric grade statistics of a StudentManager grouped by letter grade."""
+    return group_by(manager_columns(manager), 'letter', 'grade', percentiles)
+
+
+def scholarship_report(table, value: str = 'age',
+                       percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> GroupStats:
+    """Statistics of a StudentTable column grouped by scholarship type (None = no scholarship)."""
+    return group_by(table.columns(), 'scholarship_type', value, percentiles)
+
+
+def format_report(stats: GroupStats, title: str = "GROUP STATISTICS") -> str:
+    """Render group statistics as a fixed-width text table."""
+    names = list(next(iter(stats.values()))) if stats else ['count']
+    lines = ["=" * 60, title, "=" * 60,
+             f"{'group':<20}" + "".join(f"{name:>10}" for name in names)]
+    for label, row in stats.items():
+        cells = []
+        for name in names:
+            value = row[name]
+            cells.append(f"{'-':>10}" if value is None else
+                         f"{value:>10,}" if name == 'count' else f"{value:>10.2f}")
+        lines.append(f"{'(none)' if label is None else str(label):<20}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def benchmark_group_by(rows: int = 2_000_000) -> dict:
+    """Time a grade-point report grouped by major over synthetic columns."""
+    rng = random.Random(0)
+    majors = ("Computer Science", "Engineering", "Mathematics", "Physics", "Biology",
+              "Chemistry", "History", "Economics")
+    columns = add_grade_points({
+        'major': rng.choices(majors, k=rows),
+        'grade': rng.choices(list(GRADE_POINTS), k=rows),
+    })
+
+    results = {'rows': rows}
+    variants = [('python', _group_stats_python)]
+    if np is not None:
+        variants.insert(0, ('numpy', _group_stats_numpy))
+    for name, function in variants:
+        start = time.perf_counter()
+        stats = function(columns['major'], columns['grade_points'], DEFAULT_PERCENTILES)
+        results[name] = time.perf_counter() - start
+        print(f"{name:7}: {results[name]:.3f}s for {rows:,} rows ({len(stats)} groups)")
+    return results
@@ -0,0 +1,243 @@
+# ==================================================
+# BENCHMARK SUITE
+# Times every lab module on deterministic synthetic data
+# and writes the results as JSON for run-to-run comparison.
+#
+#   python benchmarks.py --sizes 1000 10000 --output bench.json
+#   python benchmarks.py --compare bench.json --output new.json
+# ==================================================
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+try:
+    from .lab_modules import load_module
+except ImportError:  # run as a script
+    from lab_modules import load_module
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+FIRST_NAMES = ("Juan", "Maria", "Pedro", "Ana", "Jose", "Rosa", "Carlos", "Liza")
+LAST_NAMES = ("Dela Cruz", "Santos", "Reyes", "Gonzales", "Garcia", "Mendoza", "Bautista")
+GRADES = ("A", "A-", "B+", "B", "B-", "C+", "C", "D", "F")
+MAJORS = ("Computer Science", "Engineering", "Mathematics", "Physics", "Biology")
+SCHOLARSHIPS = ("Academic", "Athletic", "Leadership")
+VOCABULARY = ("python", "is", "a", "programming", "language", "easy", "to", "learn",
+              "powerful", "fun", "student", "grade", "records", "data", "the", "and")
+
+
+# -----------------------------
+# DETERMINISTIC DATA GENERATORS
+# -----------------------------
+
+def student_lines(count: int, seed: int = 0) -> List[str]:
+    """Raw entries in STUDENT_PATTERN format, about a quarter with a scholarship."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        line = (f"ID: {(2000 + i // 1000) % 10000:04d}-{i % 1000:03d} | Name: {first} {last} | "
+                f"Email: {first.lower()}.{i}@school.edu | Age: {rng.randint(17, 30)}")
+        if rng.random() < 0.25:
+            line += f" | Scholarship: {rng.choice(SCHOLARSHIPS)}"
+        lines.append(line)
+    return lines
+
+
+def database_records(count: int, seed: int = 0) -> Dict[str, Dict[str, str]]:
+    """StudentDatabase-shaped records keyed by student ID."""
+    rng = random.Random(seed)
+    return {
+        f"S{i:07d}": {
+            'name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            'grade': rng.choice(GRADES),
+            'major': rng.choice(MAJORS),
+        }
+        for i in range(count)
+    }
+
+
+def grade_list(count: int, seed: int = 0) -> List[float]:
+    """Numeric grades roughly normally distributed around 82."""
+    rng = random.Random(seed)
+    return [round(min(100.0, max(50.0, rng.gauss(82, 8))), 1) for _ in range(count)]
+
+
+def text_corpus(words: int, seed: int = 0) -> str:
+    """Free text with punctuation, mixed case and a Zipf-like word mix."""
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, len(VOCABULARY) + 1)]
+    chosen = rng.choices(VOCABULARY, weights, k=words)
+    return " ".join(
+        (word.capitalize() + ".") if i % 12 == 11 else word
+        for i, word in enumerate(chosen)
+    )
+
+
+# -----------------------------
+# TIMING
+# -----------------------------
+
+def time_call(function: Callable[[], object], repeat: int = 3) -> float:
+    """Best wall time of ``repeat`` runs, with stdout discarded."""
+    best = float("inf")
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _ignore(entry, message):
+    pass
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat: int = 3) -> dict:
+    """Run every benchmark at every size and return the JSON-ready results."""
+    regex_oop = load_module('regex_oop')
+    student_database = load_module('student_database')
+    student_grades = load_module('student_grades')
+    student_records = load_module('student_records')
+    coordinates = load_module('coordinates')
+    word_stats = load_module('word_stats')
+
+    results = []
+
+    def record(name: str, size: int, seconds: float) -> None:
+        results.append({
+            'benchmark': name,
+            'size': size,
+            'seconds': seconds,
+            'per_item_us': seconds / size * 1e6 if size else 0.0,
+        })
+        print(f"  {name:32} n={size:<9,} {seconds:9.4f}s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            print(f"Size {size:,}")
+
+            lines = student_lines(size)
+            record("process_students", size, time_call(
+                lambda: regex_oop.process_students(lines, on_error=_ignore), repeat))
+
+            records = database_records(size)
+            rows = [(student_id, info['name'], info['grade'], info['major'])
+                    for student_id, info in records.items()]
+            database = student_database.StudentDatabase()
+
+            def add_rows():
+                for row in rows:
+                    database.add_student(*row)
+
+            record("StudentDatabase.add_student", size, time_call(add_rows, repeat))
+            record("StudentDatabase.get_student", size, time_call(
+                lambda: [database.get_student(row[0]) for row in rows], repeat))
+            record("StudentDatabase.update_grade", size, time_call(
+                lambda: [database.update_grade(row[0], "A") for row in rows], repeat))
+
+            grades = grade_list(size)
+
+            def manager_stats():
+                manager = student_grades.StudentManager()
+                for i, grade in enumerate(grades):
+                    manager.add_student(f"Student {i}", grade)
+                manager.calculate_average()
+                manager.find_highest()
+                manager.median()
+                manager.top(10)
+
+            record("StudentManager add+stats", size, time_call(manager_stats, repeat))
+
+            file_system = student_records.StudentFileSystem(
+                os.path.join(directory, "students.pkl"),
+                os.path.join(directory, "students.txt"))
+            record("StudentFileSystem.save_records", size, time_call(
+                lambda: file_system.save_records(records), repeat))
+            record("StudentFileSystem.load_records", size, time_call(
+                file_system.load_records, repeat))
+            record("StudentFileSystem.export_to_text", size, time_call(
+                lambda: file_system.export_to_text(records), repeat))
+
+            text = text_corpus(size * 10)
+            record("word_stats (10 words/item)", size, time_call(
+                lambda: word_stats.word_stats(text), repeat))
+            corpus_path = os.path.join(directory, "corpus.txt")
+            with open(corpus_path, "w") as file:
+                file.write(text)
+            record("count_words_in_files (serial)", size, time_call(
+                lambda: word_stats.count_words_in_files(corpus_path, workers=1), repeat))
+
+            points1 = coordinates.random_points(size, seed=1)
+            points2 = coordinates.random_points(size, seed=2)
+            record("calculate_distance loop", size, time_call(
+                lambda: [coordinates.calculate_distance(p, q) for p, q in zip(points1, points2)],
+                repeat))
+            record("find_midpoint loop", size, time_call(
+                lambda: [coordinates.find_midpoint(p, q) for p, q in zip(points1, points2)],
+                repeat))
+            record("batch_distances", size, time_call(
+                lambda: coordinates.batch_distances(points1, points2), repeat))
+            record("closest_pair", size, time_call(
+                lambda: coordinates.closest_pair(points1), repeat))
+            record("convex_hull", size, time_call(
+                lambda: coordinates.convex_hull(points1), repeat))
+
+    return {
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': list(sizes),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compare_runs(baseline: dict, current: dict, threshold: float = 1.2) -> List[dict]:
+    """List benchmarks that got slower than ``threshold`` x the baseline."""
+    previous = {(r['benchmark'], r['size']): r['seconds'] for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        before = previous.get((result['benchmark'], result['size']))
+        if before and result['seconds'] > before * threshold:
+            regressions.append({**result, 'baseline_seconds': before,
+                                'ratio': result['seconds'] / before})
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the DM4 lab modules.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="earlier JSON results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.sizes, args.repeat)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"\n✅ Results written to '{args.output}'")
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare_runs(json.load(file), report, args.threshold)
+        for regression in regressions:
+            print(f"❌ {regression['benchmark']} (n={regression['size']:,}): "
+                  f"{regression['ratio']:.2f}x slower")
+        if regressions:
+            return 1
+        print("✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
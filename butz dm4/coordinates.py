@@ -1,99 +1,489 @@
-# Task 2.1: Coordinate System with Tuples
-import math
-import string
-from collections import Counter
-from typing import Tuple
-
-
-Point = Tuple[float, float]
-
-
-def calculate_distance(point1: Point, point2: Point) -> float:
-    """Calculate the distance between two 2D points."""
-    return math.dist(point1, point2)
-
-
-def find_midpoint(point1: Point, point2: Point) -> Point:
-    """Find the midpoint between two 2D points."""
-    return ((point1[0] + point2[0]) / 2,
-            (point1[1] + point2[1]) / 2)
-
-
-def display_points(points: Tuple[Point, ...]) -> None:
-    """Display a list of points."""
-    for idx, point in enumerate(points, start=1):
-        print(f"Point {idx}: {point}")
-
-
-# Task 2.2: Unique Word Counter with Sets
-def count_unique_words(text: str) -> None:
-    """Analyze and display word statistics from text."""
-    
-    # Clean and normalize text
-    translator = str.maketrans("", "", string.punctuation)
-    cleaned_text = text.lower().translate(translator)
-    words = cleaned_text.split()
-
-    unique_words = set(words)
-    word_freq = Counter(words)
-
-    print("\n" + "=" * 40)
-    print("TASK 2.2: Unique Word Counter")
-    print("=" * 40)
-
-    print(f"Original text:\n{text}")
-    print(f"\nTotal words: {len(words)}")
-    print(f"Unique words: {len(unique_words)}")
-
-    print("\nUnique words (sorted):")
-    print(sorted(unique_words))
-
-    most_common_word, count = word_freq.most_common(1)[0]
-    print(f"\nMost common word: '{most_common_word}' ({count} times)")
-
-    print("\nWord frequencies:")
-    for word, freq in word_freq.most_common():
-        print(f"  {word}: {freq}")
-
-
-def demonstrate_tuple_immutability(point: Point) -> None:
-    """Show that tuples cannot be modified."""
-    print("\n" + "=" * 40)
-    print("Demonstrating Tuple Immutability")
-    print("=" * 40)
-    print(f"Original point: {point}")
-
-    try:
-        point[0] = 10
-    except TypeError as e:
-        print(f"Error: {e}")
-        print("✔ Tuples are immutable and cannot be changed.")
-
-
-# Main Program
-if __name__ == "__main__":
-    print("=" * 40)
-    print("TASK 2.1: Coordinate System")
-    print("=" * 40)
-
-    point1 = (2, 3)
-    point2 = (5, 7)
-    point3 = (1, 1)
-
-    all_points = (point1, point2, point3)
-    display_points(all_points)
-
-    distance = calculate_distance(point1, point2)
-    midpoint = find_midpoint(point1, point2)
-
-    print(f"\nDistance between {point1} and {point2}: {distance:.2f}")
-    print(f"Midpoint between {point1} and {point2}: {midpoint}")
-
-    demonstrate_tuple_immutability(point1)
-
-    sample_text = (
-        "Python is a programming language. "
-        "Python is easy to learn. "
-        "Python is powerful."
-    )
-    count_unique_words(sample_text)
+# Task 2.1: Coordinate System with Tuples
+import heapq
+import math
+import random
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from .word_stats import word_stats
+except ImportError:  # run as a script
+    from word_stats import word_stats
+
+_NOT_LOADED = object()
+np = _NOT_LOADED
+
+
+def _numpy():
+    """NumPy, imported on first use so plain geometry starts fast (None if not installed)."""
+    global np
+    if np is _NOT_LOADED:
+        try:
+            import numpy as np
+        except ImportError:  # batch helpers fall back to pure Python
+            np = None
+    return np
+
+
+Point = Tuple[float, float]
+
+
+def calculate_distance(point1: Point, point2: Point) -> float:
+    """Calculate the distance between two 2D points."""
+    return math.dist(point1, point2)
+
+
+def find_midpoint(point1: Point, point2: Point) -> Point:
+    """Find the midpoint between two 2D points."""
+    return ((point1[0] + point2[0]) / 2,
+            (point1[1] + point2[1]) / 2)
+
+
+def display_points(points: Tuple[Point, ...]) -> None:
+    """Display a list of points."""
+    for idx, point in enumerate(points, start=1):
+        print(f"Point {idx}: {point}")
+
+
+# Batch geometry: NumPy arrays of shape (n, 2) (or any sequence of points)
+def _as_array(points):
+    array = np.asarray(points, dtype=float)
+    return array.reshape(-1, 2)
+
+
+def batch_distances(points1, points2):
+    """Element-wise distances between two equally long point sequences."""
+    if _numpy() is None:
+        return [math.dist(p, q) for p, q in zip(points1, points2, strict=True)]
+    a, b = _as_array(points1), _as_array(points2)
+    if a.shape != b.shape:
+        raise ValueError("Point arrays must have the same length")
+    return np.hypot(a[:, 0] - b[:, 0], a[:, 1] - b[:, 1])
+
+
+def batch_midpoints(points1, points2):
+    """Element-wise midpoints between two equally long point sequences."""
+    if _numpy() is None:
+        return [find_midpoint(p, q) for p, q in zip(points1, points2, strict=True)]
+    a, b = _as_array(points1), _as_array(points2)
+    if a.shape != b.shape:
+        raise ValueError("Point arrays must have the same length")
+    return (a + b) / 2
+
+
+def iter_distance_blocks(points1, points2=None,
+                         max_bytes: int = 64 * 1024 * 1024) -> Iterator[tuple]:
+    """Yield ``(row_start, block)`` slices of the pairwise distance matrix.
+
+    Rows are grouped so a block and its temporaries stay within ``max_bytes``.
+    """
+    if points2 is None:
+        points2 = points1
+    if _numpy() is None:
+        points1 = list(points1)
+        points2 = list(points2)
+        rows = max(1, max_bytes // (max(len(points2), 1) * 32))
+        for start in range(0, len(points1), rows):
+            yield start, [[math.dist(p, q) for q in points2]
+                          for p in points1[start:start + rows]]
+        return
+
+    a, b = _as_array(points1), _as_array(points2)
+    # dx, dy and the result are each rows * len(b) float64 values.
+    rows = max(1, max_bytes // (max(len(b), 1) * 8 * 3))
+    for start in range(0, len(a), rows):
+        block = a[start:start + rows]
+        yield start, np.hypot(block[:, 0, None] - b[None, :, 0],
+                              block[:, 1, None] - b[None, :, 1])
+
+
+def pairwise_distances(points1, points2=None, max_bytes: int = 64 * 1024 * 1024, out=None):
+    """Full pairwise distance matrix, computed block by block.
+
+    ``max_bytes`` bounds the working memory; pass ``out`` (for example a
+    ``numpy.memmap``) to fill a matrix that does not fit in RAM.
+    """
+    if points2 is None:
+        points2 = points1
+    if _numpy() is None:
+        matrix = [] if out is None else out
+        for start, block in iter_distance_blocks(points1, points2, max_bytes):
+            if out is None:
+                matrix.extend(block)
+            else:
+                matrix[start:start + len(block)] = block
+        return matrix
+
+    a, b = _as_array(points1), _as_array(points2)
+    if out is None:
+        out = np.empty((len(a), len(b)))
+    for start, block in iter_distance_blocks(a, b, max_bytes):
+        out[start:start + len(block)] = block
+    return out
+
+
+def random_points(count: int, seed: int = 0, scale: float = 1000.0) -> List[Point]:
+    """Deterministic random points for demos and benchmarks."""
+    rng = random.Random(seed)
+    return [(rng.uniform(0, scale), rng.uniform(0, scale)) for _ in range(count)]
+
+
+def benchmark_batch_geometry(count: int = 200_000) -> dict:
+    """Compare the batch helpers with looping over the scalar functions."""
+    points1 = random_points(count, seed=1)
+    points2 = random_points(count, seed=2)
+
+    start = time.perf_counter()
+    loop_distances = [calculate_distance(p, q) for p, q in zip(points1, points2)]
+    loop_midpoints = [find_midpoint(p, q) for p, q in zip(points1, points2)]
+    loop_seconds = time.perf_counter() - start
+
+    if _numpy() is not None:
+        points1, points2 = np.array(points1), np.array(points2)
+    start = time.perf_counter()
+    distances = batch_distances(points1, points2)
+    midpoints = batch_midpoints(points1, points2)
+    batch_seconds = time.perf_counter() - start
+
+    matches = (
+        all(math.isclose(x, y, rel_tol=1e-12) for x, y in zip(loop_distances, distances))
+        and all(math.isclose(x, y, rel_tol=1e-12)
+                for p, q in zip(loop_midpoints, midpoints) for x, y in zip(p, q))
+    )
+    print(f"Loop  : {loop_seconds:.3f}s")
+    print(f"Batch : {batch_seconds:.3f}s ({'NumPy' if np is not None else 'pure Python'})")
+    print(f"Results match: {matches}")
+    return {'count': count, 'loop': loop_seconds, 'batch': batch_seconds, 'matches': matches}
+
+
+# Spatial index: uniform grid over a Point collection
+class PointGrid:
+    """Uniform-grid spatial index with insert/delete, radius and k-NN queries.
+
+    Points get integer ids on insert so duplicates can be told apart.
+    """
+
+    def __init__(self, cell_size: float = 1.0):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Dict[int, Point]] = {}
+        self._points: Dict[int, Point] = {}
+        self._next_id = 0
+        self._bounds: Optional[List[int]] = None  # min_x, max_x, min_y, max_y (cells)
+
+    @classmethod
+    def build(cls, points: Iterable[Point], cell_size: Optional[float] = None) -> "PointGrid":
+        """Bulk-build an index; by default cells hold about two points each."""
+        points = list(points)
+        if cell_size is None:
+            cell_size = 1.0
+            if points:
+                xs = [x for x, _ in points]
+                ys = [y for _, y in points]
+                width, height = max(xs) - min(xs), max(ys) - min(ys)
+                if width > 0 and height > 0:
+                    cell_size = math.sqrt(2 * width * height / len(points))
+                elif width + height > 0:
+                    cell_size = 2 * (width + height) / len(points)
+        grid = cls(cell_size)
+        for point in points:
+            grid.insert(point)
+        return grid
+
+    def _cell(self, point: Point) -> Tuple[int, int]:
+        return (math.floor(point[0] / self.cell_size), math.floor(point[1] / self.cell_size))
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def insert(self, point: Point) -> int:
+        """Add a point and return its id."""
+        point_id = self._next_id
+        self._next_id += 1
+        point = (float(point[0]), float(point[1]))
+        cell = self._cell(point)
+        self._cells.setdefault(cell, {})[point_id] = point
+        self._points[point_id] = point
+        if self._bounds is None:
+            self._bounds = [cell[0], cell[0], cell[1], cell[1]]
+        else:
+            bounds = self._bounds
+            bounds[0] = min(bounds[0], cell[0])
+            bounds[1] = max(bounds[1], cell[0])
+            bounds[2] = min(bounds[2], cell[1])
+            bounds[3] = max(bounds[3], cell[1])
+        return point_id
+
+    def delete(self, point_id: int) -> bool:
+        """Remove a point by id; returns False if it is not indexed."""
+        point = self._points.pop(point_id, None)
+        if point is None:
+            return False
+        cell = self._cell(point)
+        bucket = self._cells[cell]
+        del bucket[point_id]
+        if not bucket:
+            del self._cells[cell]
+        return True
+
+    def get(self, point_id: int) -> Optional[Point]:
+        return self._points.get(point_id)
+
+    def within(self, center: Point, radius: float) -> List[Tuple[int, Point]]:
+        """All (id, point) pairs within ``radius`` of ``center``."""
+        x, y = center
+        low_x, low_y = self._cell((x - radius, y - radius))
+        high_x, high_y = self._cell((x + radius, y + radius))
+        radius_sq = radius * radius
+        if (high_x - low_x + 1) * (high_y - low_y + 1) > len(self._cells):
+            buckets = self._cells.values()
+        else:
+            buckets = [
+                self._cells[cell]
+                for cell in ((cx, cy) for cx in range(low_x, high_x + 1)
+                             for cy in range(low_y, high_y + 1))
+                if cell in self._cells
+            ]
+        return [
+            (point_id, point)
+            for bucket in buckets
+            for point_id, point in bucket.items()
+            if (point[0] - x) ** 2 + (point[1] - y) ** 2 <= radius_sq
+        ]
+
+    def _ring(self, cx: int, cy: int, r: int) -> Iterator[Tuple[int, int]]:
+        if r == 0:
+            yield cx, cy
+            return
+        for gx in range(cx - r, cx + r + 1):
+            yield gx, cy - r
+            yield gx, cy + r
+        for gy in range(cy - r + 1, cy + r):
+            yield cx - r, gy
+            yield cx + r, gy
+
+    def nearest(self, center: Point, k: int = 1) -> List[Tuple[float, int, Point]]:
+        """The k nearest points as (distance, id, point), closest first."""
+        if k <= 0 or not self._points:
+            return []
+        cx, cy = self._cell(center)
+        bounds = self._bounds
+        max_ring = max(abs(cx - bounds[0]), abs(cx - bounds[1]),
+                       abs(cy - bounds[2]), abs(cy - bounds[3]))
+        best = []  # max-heap of (-distance, id, point)
+
+        def visit(bucket):
+            for point_id, point in bucket.items():
+                distance = math.dist(center, point)
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, point_id, point))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, point_id, point))
+
+        for r in range(max_ring + 1):
+            if 8 * r > len(self._cells):
+                # Rings now hold more empty cells than there are occupied
+                # ones: finish with one pass over the remaining cells.
+                for (gx, gy), bucket in self._cells.items():
+                    if max(abs(gx - cx), abs(gy - cy)) >= r:
+                        visit(bucket)
+                break
+            for cell in self._ring(cx, cy, r):
+                bucket = self._cells.get(cell)
+                if bucket:
+                    visit(bucket)
+            # Unvisited cells are at least r cell widths away.
+            if len(best) == k and -best[0][0] <= r * self.cell_size:
+                break
+        return sorted((-negative, point_id, point) for negative, point_id, point in best)
+
+
+def benchmark_spatial_index(count: int = 1_000_000, queries: int = 100, k: int = 10) -> dict:
+    """Time PointGrid k-NN and radius queries against linear scans."""
+    points = random_points(count, seed=3)
+    targets = random_points(queries, seed=4)
+
+    start = time.perf_counter()
+    grid = PointGrid.build(points)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for target in targets:
+        grid.nearest(target, k)
+        grid.within(target, grid.cell_size * 3)
+    index_seconds = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for target in targets[:3]:
+        heapq.nsmallest(k, points, key=lambda point: math.dist(target, point))
+    scan_seconds = (time.perf_counter() - start) / 3
+
+    print(f"Build            : {build_seconds:.2f}s for {count:,} points")
+    print(f"Indexed query    : {index_seconds * 1000:.3f} ms (k-NN + radius)")
+    print(f"Linear-scan k-NN : {scan_seconds * 1000:.1f} ms")
+    return {'count': count, 'build': build_seconds, 'indexed_query': index_seconds,
+            'scan_query': scan_seconds}
+
+
+# Closest pair and convex hull in O(n log n)
+def _by_y(point: Point) -> float:
+    return point[1]
+
+
+def closest_pair(points: Iterable[Point]) -> Tuple[float, Point, Point]:
+    """Closest pair of points by divide and conquer: (distance, point1, point2)."""
+    ordered = sorted(points)
+    if len(ordered) < 2:
+        raise ValueError("closest_pair needs at least two points")
+    best = [math.inf, ordered[0], ordered[1]]
+
+    def check(p: Point, q: Point) -> None:
+        distance = math.dist(p, q)
+        if distance < best[0]:
+            best[:] = [distance, p, q]
+
+    def solve(low: int, high: int) -> List[Point]:
+        """Update best for ordered[low:high] and return that slice sorted by y."""
+        if high - low <= 3:
+            for i in range(low, high):
+                for j in range(i + 1, high):
+                    check(ordered[i], ordered[j])
+            return sorted(ordered[low:high], key=_by_y)
+
+        middle = (low + high) // 2
+        middle_x = ordered[middle][0]
+        # Both halves are sorted by y, so this sort is a linear run merge.
+        merged = sorted(solve(low, middle) + solve(middle, high), key=_by_y)
+
+        strip = [point for point in merged if abs(point[0] - middle_x) < best[0]]
+        for i, p in enumerate(strip):
+            for q in strip[i + 1:i + 8]:
+                if q[1] - p[1] >= best[0]:
+                    break
+                check(p, q)
+        return merged
+
+    solve(0, len(ordered))
+    return best[0], best[1], best[2]
+
+
+def _cross(origin: Point, a: Point, b: Point) -> float:
+    return (a[0] - origin[0]) * (b[1] - origin[1]) - (a[1] - origin[1]) * (b[0] - origin[0])
+
+
+def convex_hull(points: Iterable[Point]) -> List[Point]:
+    """Convex hull by Andrew's monotone chain, counter-clockwise, without collinear points."""
+    ordered = sorted(set(points))
+    if len(ordered) <= 2:
+        return ordered
+
+    lower: List[Point] = []
+    for point in ordered:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], point) <= 0:
+            lower.pop()
+        lower.append(point)
+
+    upper: List[Point] = []
+    for point in reversed(ordered):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], point) <= 0:
+            upper.pop()
+        upper.append(point)
+
+    return lower[:-1] + upper[:-1]
+
+
+def benchmark_geometry_scaling(sizes: Sequence[int] = (10**3, 10**4, 10**5, 10**6, 10**7)) -> List[dict]:
+    """Time closest_pair and convex_hull across point-set sizes.
+
+    The last column divides by n log2 n; it should stay roughly flat.
+    """
+    results = []
+    print(f"{'n':>10}  {'closest pair':>12}  {'convex hull':>11}  {'us / n log n':>12}")
+    for count in sizes:
+        points = random_points(count, seed=5, scale=float(count))
+
+        start = time.perf_counter()
+        closest_pair(points)
+        pair_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        convex_hull(points)
+        hull_seconds = time.perf_counter() - start
+
+        per_unit = pair_seconds / (count * math.log2(count)) * 1e6
+        print(f"{count:>10,}  {pair_seconds:>11.3f}s  {hull_seconds:>10.3f}s  {per_unit:>12.3f}")
+        results.append({'count': count, 'closest_pair': pair_seconds,
+                        'convex_hull': hull_seconds})
+        del points
+    return results
+
+
+# Task 2.2: Unique Word Counter with Sets
+def count_unique_words(text: str) -> None:
+    """Analyze and display word statistics from text."""
+    
+    # Clean, normalize and count
+    stats = word_stats(text)
+    word_freq = stats['frequencies']
+
+    print("\n" + "=" * 40)
+    print("TASK 2.2: Unique Word Counter")
+    print("=" * 40)
+
+    print(f"Original text:\n{text}")
+    print(f"\nTotal words: {stats['total_words']}")
+    print(f"Unique words: {stats['unique_words']}")
+
+    print("\nUnique words (sorted):")
+    print(sorted(word_freq))
+
+    most_common_word, count = word_freq.most_common(1)[0]
+    print(f"\nMost common word: '{most_common_word}' ({count} times)")
+
+    print("\nWord frequencies:")
+    for word, freq in word_freq.most_common():
+        print(f"  {word}: {freq}")
+
+
+def demonstrate_tuple_immutability(point: Point) -> None:
+    """Show that tuples cannot be modified."""
+    print("\n" + "=" * 40)
+    print("Demonstrating Tuple Immutability")
+    print("=" * 40)
+    print(f"Original point: {point}")
+
+    try:
+        point[0] = 10
+    except TypeError as e:
+        print(f"Error: {e}")
+        print("✔ Tuples are immutable and cannot be changed.")
+
+
+# Main Program
+if __name__ == "__main__":
+    print("=" * 40)
+    print("TASK 2.1: Coordinate System")
+    print("=" * 40)
+
+    point1 = (2, 3)
+    point2 = (5, 7)
+    point3 = (1, 1)
+
+    all_points = (point1, point2, point3)
+    display_points(all_points)
+
+    distance = calculate_distance(point1, point2)
+    midpoint = find_midpoint(point1, point2)
+
+    print(f"\nDistance between {point1} and {point2}: {distance:.2f}")
+    print(f"Midpoint between {point1} and {point2}: {midpoint}")
+
+    demonstrate_tuple_immutability(point1)
+
+    sample_text = (
+        "Python is a programming language. "
+        "Python is easy to learn. "
+        "Python is powerful."
+    )
+    count_unique_words(sample_text)
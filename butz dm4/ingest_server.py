@@ -0,0 +1,354 @@
+# ==================================================
+# INGEST SERVER
+# asyncio entry point in front of process_students: many
+# producers stream raw "ID: ... | Name: ... | Email: ... | Age: ..."
+# lines, which are micro-batched, parsed and acknowledged.
+#
+#   python ingest_server.py --port 8765
+#   python ingest_server.py --stdin < students.txt
+#   python ingest_server.py --benchmark
+#
+# Protocol: one record per line in; one JSON ack per batch out, e.g.
+#   {"first_line": 1, "last_line": 40, "lines": 40, "accepted": 39,
+#    "errors": [{"line": 7, "error": "Failed to parse entry"}]}
+# Line numbers count every line of the connection, blank lines included.
+# ==================================================
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+try:
+    from .lab_modules import load_module
+    from .metrics import METRICS
+except ImportError:  # run as a script
+    from lab_modules import load_module
+    from metrics import METRICS
+
+regex_oop = load_module('regex_oop')
+
+
+class _Connection:
+    """Per-producer state: where acks go and how many lines await one."""
+
+    def __init__(self, write: Callable[[bytes], None], drain=None):
+        self.write = write
+        self.drain = drain
+        self.line_number = 0
+        self.pending = 0
+        self.finished = False
+        self.done = asyncio.Event()
+
+
+class IngestServer:
+    """Micro-batching line ingest with bounded-queue backpressure.
+
+    Lines from every connection go into one queue of ``queue_size`` lines.
+    When it is full, connection readers stop reading and TCP flow control
+    pushes back on the producers. A single batcher drains up to
+    ``batch_size`` lines (waiting at most ``max_delay`` seconds to fill a
+    batch), parses them with ``process_students``, hands the students to
+    ``sink`` and acks each connection's share of the batch. If parsing or
+    the sink raises, every line of that batch is acked as an error and the
+    batcher carries on.
+    """
+
+    def __init__(self, batch_size: int = 512, max_delay: float = 0.005,
+                 queue_size: int = 10_000,
+                 sink: Optional[Callable[[list], None]] = None):
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.queue_size = queue_size
+        self.sink = sink
+        self.stats = {'lines': 0, 'accepted': 0, 'errors': 0, 'batches': 0}
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def _ensure_batcher(self) -> None:
+        if self._batcher is None:
+            self._queue = asyncio.Queue(self.queue_size)
+            self._batcher = asyncio.create_task(self._run_batcher())
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """Listen for producers on a TCP socket."""
+        self._ensure_batcher()
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = _Connection(writer.write, writer.drain)
+        try:
+            await self._consume(connection, self._socket_lines(reader))
+        except (ValueError, ConnectionError) as e:
+            # ValueError: a line longer than the stream limit.
+            writer.write(json.dumps({'error': str(e)}).encode() + b"\n")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _socket_lines(reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+        while line := await reader.readline():
+            yield line
+
+    async def serve_stdin(self) -> None:
+        """Ingest lines from stdin and write the acks to stdout."""
+        self._ensure_batcher()
+        output = sys.stdout.buffer
+        connection = _Connection(output.write)
+        await self._consume(connection, self._stdin_lines())
+        output.flush()
+
+    @staticmethod
+    async def _stdin_lines() -> AsyncIterator[bytes]:
+        # Regular files cannot be watched by the event loop, so read blocks
+        # of lines on a worker thread.
+        loop = asyncio.get_running_loop()
+        while lines := await loop.run_in_executor(None, sys.stdin.buffer.readlines, 1 << 16):
+            for line in lines:
+                yield line
+
+    async def _consume(self, connection: _Connection, lines: AsyncIterator[bytes]) -> None:
+        """Queue a connection's lines, then wait until all of them are acked."""
+        async for raw in lines:
+            connection.line_number += 1
+            text = raw.decode("utf-8", "replace").rstrip("\r\n")
+            if not text.strip():
+                continue
+            connection.pending += 1
+            # Blocks while the queue is full: this is the backpressure point.
+            await self._queue.put((connection, connection.line_number, text, time.perf_counter()))
+            if connection.drain is not None and connection.line_number % 256 == 0:
+                await connection.drain()
+        connection.finished = True
+        if connection.pending:
+            await connection.done.wait()
+        if connection.drain is not None:
+            await connection.drain()
+
+    async def _run_batcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                failures = self._process(batch)
+            except Exception as e:
+                # Connections wait for acks of every line they sent, so a
+                # failed batch is rejected rather than ending the batcher.
+                METRICS.increment("ingest_batch_failures_total")
+                failures = dict.fromkeys(range(len(batch)), f"Batch failed: {e}")
+            self._acknowledge(batch, failures)
+
+    def _process(self, batch: List[tuple]) -> Dict[int, str]:
+        """Parse one micro-batch and sink it; return error messages by batch position."""
+        lines = [text for _, _, text, _ in batch]
+        # process_students reports failures in input order with the entry
+        # object itself, which maps each failure back to its position.
+        positions: Dict[int, deque] = {}
+        for position, text in enumerate(lines):
+            positions.setdefault(id(text), deque()).append(position)
+        failures = {}
+
+        def collect(entry: str, message: str) -> None:
+            failures[positions[id(entry)].popleft()] = message
+
+        with METRICS.timer("ingest_batch_seconds"):
+            students = regex_oop.process_students(lines, on_error=collect)
+        if self.sink is not None and students:
+            self.sink(students)
+        return failures
+
+    def _acknowledge(self, batch: List[tuple], failures: Dict[int, str]) -> None:
+        """Ack each connection's lines in one batch."""
+        acks: Dict[_Connection, dict] = {}
+        now = time.perf_counter()
+        for position, (connection, line_number, _, received) in enumerate(batch):
+            ack = acks.get(connection)
+            if ack is None:
+                ack = acks[connection] = {'first_line': line_number, 'last_line': line_number,
+                                          'lines': 0, 'accepted': 0, 'errors': []}
+            ack['last_line'] = line_number
+            ack['lines'] += 1
+            if position in failures:
+                ack['errors'].append({'line': line_number, 'error': failures[position]})
+            else:
+                ack['accepted'] += 1
+            METRICS.observe("ingest_seconds", now - received)
+
+        for connection, ack in acks.items():
+            connection.write(json.dumps(ack).encode() + b"\n")
+            connection.pending -= ack['lines']
+            if connection.finished and not connection.pending:
+                connection.done.set()
+
+        self.stats['lines'] += len(batch)
+        self.stats['accepted'] += len(batch) - len(failures)
+        self.stats['errors'] += len(failures)
+        self.stats['batches'] += 1
+        METRICS.increment("ingest_lines_total", len(batch))
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of unsorted samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def _produce(port: int, lines: List[str], burst: int, in_flight: int,
+                   latencies: List[float]) -> int:
+    """Send lines in bursts, keeping at most ``in_flight`` unacked; record send-to-ack latency."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    sent = deque()
+    acked = asyncio.Event()
+    errors = 0
+
+    async def receive() -> None:
+        nonlocal errors
+        while line := await reader.readline():
+            ack = json.loads(line)
+            now = time.perf_counter()
+            errors += len(ack['errors'])
+            for _ in range(ack['lines']):
+                latencies.append(now - sent.popleft())
+            acked.set()
+
+    receiver = asyncio.create_task(receive())
+    for start in range(0, len(lines), burst):
+        while len(sent) >= in_flight:
+            acked.clear()
+            await acked.wait()
+        chunk = lines[start:start + burst]
+        now = time.perf_counter()
+        sent.extend([now] * len(chunk))
+        writer.write(("\n".join(chunk) + "\n").encode())
+        await writer.drain()
+    writer.write_eof()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+    return errors
+
+
+async def _benchmark(producers: int, lines_per_producer: int, burst: int, in_flight: int,
+                     batch_size: int, max_delay: float, queue_size: int) -> dict:
+    server = IngestServer(batch_size, max_delay, queue_size)
+    listener = await server.start(port=0)
+    port = listener.sockets[0].getsockname()[1]
+
+    student_lines = load_module('benchmarks').student_lines
+
+    workloads = []
+    for producer in range(producers):
+        lines = student_lines(lines_per_producer, seed=producer)
+        lines[::100] = ["not a student record"] * len(lines[::100])
+        workloads.append(lines)
+
+    latencies: List[float] = []
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(_produce(port, lines, burst, in_flight, latencies) for lines in workloads))
+    seconds = time.perf_counter() - start
+    await server.close()
+
+    total = producers * lines_per_producer
+    return {
+        'producers': producers,
+        'lines': total,
+        'seconds': seconds,
+        'lines_per_s': total / seconds,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'errors_acked': sum(errors),
+        'batches': server.stats['batches'],
+    }
+
+
+def benchmark_ingest(producers: int = 50, lines_per_producer: int = 2_000, burst: int = 20,
+                     in_flight: int = 100, batch_size: int = 512, max_delay: float = 0.005,
+                     queue_size: int = 10_000) -> dict:
+    """Load-generate against a local server and report throughput and p50/p99 latency.
+
+    Each producer keeps at most ``in_flight`` lines unacknowledged, so the
+    latencies reflect batching and parsing rather than an unbounded backlog.
+    """
+    result = asyncio.run(_benchmark(producers, lines_per_producer, burst, in_flight,
+                                    batch_size, max_delay, queue_size))
+    print(f"Producers   : {result['producers']}")
+    print(f"Lines       : {result['lines']:,} in {result['batches']:,} batches "
+          f"({result['errors_acked']:,} rejected)")
+    print(f"Throughput  : {result['lines_per_s']:,.0f} lines/s")
+    print(f"Latency p50 : {result['p50_ms']:.2f} ms")
+    print(f"Latency p99 : {result['p99_ms']:.2f} ms")
+    return result
+
+
+async def _serve(args) -> None:
+    server = IngestServer(args.batch_size, args.max_delay, args.queue_size)
+    if args.stdin:
+        await server.serve_stdin()
+        await server.close()
+        print(f"✅ Ingested {server.stats['accepted']:,} of {server.stats['lines']:,} lines",
+              file=sys.stderr)
+        return
+    listener = await server.start(args.host, args.port)
+    print(f"✅ Ingest server listening on {args.host}:{args.port}", file=sys.stderr)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Ingest raw student lines over TCP or stdin.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--stdin", action="store_true", help="read lines from stdin")
+    parser.add_argument("--batch-size", type=int, default=512)
+    parser.add_argument("--max-delay", type=float, default=0.005, help="seconds to fill a batch")
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    parser.add_argument("--benchmark", action="store_true", help="run the load generator")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark_ingest(batch_size=args.batch_size, max_delay=args.max_delay,
+                         queue_size=args.queue_size)
+        return 0
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
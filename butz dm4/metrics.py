@@ -0,0 +1,166 @@
+# ==================================================
+# METRICS
+# Counters and latency histograms for the hot paths
+# (parse, validate, add, update, save, load, export).
+#
+# Disabled by default; enable with DM4_METRICS=1 or METRICS.enable().
+# Metrics are per process: pool workers keep their own copies.
+# ==================================================
+
+import bisect
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Tuple
+
+# Upper bounds in seconds, Prometheus style (cumulative on export).
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3,
+                   0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _key(name: str, labels: Dict[str, str]) -> MetricKey:
+    return name, tuple(sorted(labels.items()))
+
+
+def _label_text(labels: Tuple[Tuple[str, str], ...], extra: str = "") -> str:
+    parts = [f'{name}="{value}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class MetricsRegistry:
+    """Holds counters and histograms; every call is a no-op while disabled."""
+
+    def __init__(self, enabled: bool = False, prefix: str = "dm4_"):
+        self.enabled = enabled
+        self.prefix = prefix
+        self._counters: Dict[MetricKey, float] = {}
+        self._histograms: Dict[MetricKey, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def increment(self, name: str, amount: float = 1, **labels: str) -> None:
+        """Add to a counter."""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """Record one latency sample."""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def timed(self, name: str, **labels: str):
+        """Decorator recording the call latency of a function."""
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start, **labels)
+            return wrapper
+        return decorator
+
+    @contextmanager
+    def timer(self, name: str, **labels: str):
+        """Context manager recording the latency of a block."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def stats(self) -> dict:
+        """Snapshot of all metrics as plain data."""
+        with self._lock:
+            counters = {
+                self.prefix + name + _label_text(labels): value
+                for (name, labels), value in self._counters.items()
+            }
+            histograms = {
+                self.prefix + name + _label_text(labels): {
+                    'count': histogram.count,
+                    'sum': histogram.sum,
+                    'mean': histogram.sum / histogram.count if histogram.count else 0.0,
+                    'buckets': dict(zip([*map(str, histogram.buckets), "+Inf"],
+                                        histogram.counts)),
+                }
+                for (name, labels), histogram in self._histograms.items()
+            }
+        return {'counters': counters, 'histograms': histograms}
+
+    def prometheus_text(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        typed = set()
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                metric = self.prefix + name
+                if metric not in typed:
+                    typed.add(metric)
+                    lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric}{_label_text(labels)} {value}")
+
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                metric = self.prefix + name
+                if metric not in typed:
+                    typed.add(metric)
+                    lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip([*map(str, histogram.buckets), "+Inf"], histogram.counts):
+                    cumulative += count
+                    bucket_labels = _label_text(labels, 'le="' + bound + '"')
+                    lines.append(f"{metric}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{metric}_sum{_label_text(labels)} {histogram.sum}")
+                lines.append(f"{metric}_count{_label_text(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry(enabled=os.environ.get("DM4_METRICS") == "1")
@@ -0,0 +1,33 @@
+# ==================================================
+# PROCESS POOL HELPERS
+# The one bounded process-pool map, shared by the chunked
+# text pipelines (redaction in the RegEx lab, word counting
+# and sketches in word_stats).
+# ==================================================
+
+import os
+from collections import deque
+from typing import Iterable, Iterator
+
+
+def process_pool(workers: int | None):
+    """A ProcessPoolExecutor; multiprocessing is slow to import, so only on demand."""
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def ordered_pool_map(function, items: Iterable, workers: int | None) -> Iterator:
+    """Like pool.map, but only keeps ``2 * workers`` tasks in flight.
+
+    Items are consumed lazily, so a large input is never queued whole, and
+    results come back in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    with process_pool(workers) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(function, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
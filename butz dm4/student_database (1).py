@@ -1,126 +1,775 @@
-import string
-from collections import Counter
-from typing import Optional
-
-
-# -----------------------------
-# TASK 3.1: STUDENT DATABASE
-# -----------------------------
-
-class StudentDatabase:
-    """A simple student database using dictionaries."""
-
-    def __init__(self):
-        self.students = {}
-
-    def add_student(self, student_id: str, name: str, grade: str, major: str) -> None:
-        """Add a student with ID, name, grade, and major."""
-        self.students[student_id] = {
-            'name': name,
-            'grade': grade,
-            'major': major
-        }
-        print(f"✅ Added student: {name} (ID: {student_id})")
-
-    def get_student(self, student_id: str) -> Optional[dict]:
-        """Retrieve student information by ID."""
-        return self.students.get(student_id)
-
-    def update_grade(self, student_id: str, new_grade: str) -> None:
-        """Update a student's grade."""
-        student = self.get_student(student_id)
-        if student:
-            old_grade = student['grade']
-            student['grade'] = new_grade
-            print(f"✅ Updated {student['name']}'s grade from {old_grade} to {new_grade}")
-        else:
-            print(f"❌ Student ID {student_id} not found!")
-
-    def display_all_students(self) -> None:
-        """Display all students."""
-        print("\n" + "=" * 50)
-        print("ALL STUDENTS")
-        print("=" * 50)
-        if not self.students:
-            print("No students in the database.")
-            return
-
-        for student_id, info in self.students.items():
-            print(f"ID: {student_id}")
-            print(f"  Name : {info['name']}")
-            print(f"  Grade: {info['grade']}")
-            print(f"  Major: {info['major']}")
-            print("-" * 50)
-
-
-# -----------------------------
-# TASK 3.2: WORD FREQUENCY COUNTER
-# -----------------------------
-
-def count_word_frequency(text: str) -> None:
-    """Count and display word frequencies in text."""
-    print("\n" + "=" * 50)
-    print("TASK 3.2: WORD FREQUENCY COUNTER")
-    print("=" * 50)
-
-    # Remove punctuation and normalize
-    translator = str.maketrans("", "", string.punctuation)
-    cleaned_text = text.lower().translate(translator)
-    words = cleaned_text.split()
-
-    word_count = Counter(words)
-    sorted_words = word_count.most_common()
-
-    print(f"Original text: {text}")
-    print(f"\nTotal words  : {len(words)}")
-    print(f"Unique words : {len(word_count)}")
-
-    print("\nWord frequencies (sorted by count):")
-    for word, count in sorted_words:
-        print(f"  '{word}': {count}")
-
-    most_common_word, count = sorted_words[0]
-    print(f"\nMost common word: '{most_common_word}' appears {count} times")
-
-
-# -----------------------------
-# MAIN PROGRAM
-# -----------------------------
-
-if __name__ == "__main__":
-    print("=" * 50)
-    print("TASK 3.1: STUDENT DATABASE DEMO")
-    print("=" * 50)
-
-    db = StudentDatabase()
-
-    # Adding students
-    db.add_student("S001", "Alice Johnson", "A", "Computer Science")
-    db.add_student("S002", "Bob Smith", "B+", "Engineering")
-    db.add_student("S003", "Charlie Brown", "A-", "Mathematics")
-
-    # Display all students
-    db.display_all_students()
-
-    # Retrieve a student
-    print("\n" + "=" * 50)
-    print("RETRIEVING STUDENT S002")
-    print("=" * 50)
-    student = db.get_student("S002")
-    if student:
-        print(f"Name : {student['name']}")
-        print(f"Grade: {student['grade']}")
-        print(f"Major: {student['major']}")
-    else:
-        print("Student not found!")
-
-    # Update grade
-    print("\n" + "=" * 50)
-    print("UPDATING GRADE")
-    print("=" * 50)
-    db.update_grade("S002", "A")
-    db.display_all_students()
-
-    # Task 3.2: Word Frequency Counter
-    sample_text = "Python is amazing. Python makes programming easy. Programming with Python is fun."
-    count_word_frequency(sample_text)
+import contextlib
+import os
+import random
+import threading
+import time
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple, Union
+
+try:
+    from .metrics import METRICS
+    from .word_stats import word_stats
+except ImportError:  # run as a script
+    from metrics import METRICS
+    from word_stats import word_stats
+
+
+# -----------------------------
+# TASK 3.1: STUDENT DATABASE
+# -----------------------------
+
+def _normalize_name(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character of ``pattern``."""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | 1 << i
+    return masks
+
+
+def _bit_parallel_distance(masks: Dict[str, int], length: int, text: str,
+                           limit: Optional[int] = None) -> int:
+    """Levenshtein distance of ``text`` to the pattern of ``masks`` (``length`` > 0 characters)."""
+    full = (1 << length) - 1
+    high = 1 << (length - 1)
+    positive, negative = full, 0
+    distance = length
+    for remaining, char in zip(range(len(text) - 1, -1, -1), text):
+        match = masks.get(char, 0)
+        vertical = match | negative
+        horizontal = (((match & positive) + positive) ^ positive) | match
+        up = negative | ~(horizontal | positive)
+        down = positive & horizontal
+        if up & high:
+            distance += 1
+        elif down & high:
+            distance -= 1
+        # The distance can still drop by at most one per character left.
+        if limit is not None and distance - remaining > limit:
+            return limit + 1
+        up = (up << 1) | 1
+        down <<= 1
+        positive = (down | ~(vertical | up)) & full
+        negative = up & vertical
+    return distance if limit is None or distance <= limit else limit + 1
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """Levenshtein distance; stops early (returning limit + 1) once it exceeds ``limit``.
+
+    Bit-parallel (Myers / Hyyrö): one DP column of the shorter string is
+    kept as bit vectors in Python ints, so each character of the longer
+    string costs a handful of integer operations instead of a Python loop.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return len(a)
+    return _bit_parallel_distance(_pattern_masks(b), len(b), a, limit)
+
+
+class NameIndex:
+    """Name search: a trie over name words for prefixes, trigram postings for typos.
+
+    Lookups copy what they iterate or read shared postings through single
+    set operations, so they are safe next to a single writer.
+    """
+
+    _IDS = ""  # trie key holding the IDs whose word ends at a node
+
+    def __init__(self):
+        self._trie: dict = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._names: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, student_id: str, name: str) -> None:
+        if student_id in self._names:
+            self.remove(student_id)
+        normalized = _normalize_name(name)
+        self._names[student_id] = normalized
+        for word in set(normalized.split()):
+            node = self._trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node.setdefault(self._IDS, set()).add(student_id)
+        for gram in _trigrams(normalized):
+            self._trigrams.setdefault(gram, set()).add(student_id)
+
+    def remove(self, student_id: str) -> None:
+        normalized = self._names.pop(student_id, None)
+        if normalized is None:
+            return
+        for word in set(normalized.split()):
+            node = self._trie
+            for char in word:
+                node = node[char]
+            node[self._IDS].discard(student_id)
+        for gram in _trigrams(normalized):
+            postings = self._trigrams[gram]
+            postings.discard(student_id)
+            if not postings:
+                del self._trigrams[gram]
+
+    def _word_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """IDs with a word starting with ``prefix``, shortest completions first."""
+        node = self._trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        found = []
+        seen = set()
+        queue = deque([node])
+        while queue:
+            node = queue.popleft()
+            for key, child in tuple(node.items()):
+                if key == self._IDS:
+                    for student_id in tuple(child):
+                        if student_id not in seen:
+                            seen.add(student_id)
+                            found.append(student_id)
+                    if limit is not None and len(found) >= limit:
+                        return found[:limit]
+                else:
+                    queue.append(child)
+        return found
+
+    def prefix(self, query: str, limit: int = 10) -> List[str]:
+        """IDs whose name has words starting with every word of ``query``."""
+        words = _normalize_name(query).split()
+        if not words:
+            return []
+        if len(words) == 1:
+            return self._word_prefix(words[0], limit)
+        # Drive from the last (usually most selective) word, check the others.
+        results = []
+        for student_id in self._word_prefix(words[-1]):
+            name_words = self._names.get(student_id, "").split()
+            if name_words and all(any(word.startswith(part) for word in name_words) for part in words[:-1]):
+                results.append(student_id)
+                if len(results) >= limit:
+                    break
+        return results
+
+    @staticmethod
+    def _count_hits(by_count: Dict[int, Set[str]], postings: Set[str]) -> None:
+        """Move the IDs in ``postings`` from count c to c + 1 (set operations only)."""
+        for count in sorted(by_count, reverse=True):
+            hits = by_count[count] & postings
+            if hits:
+                by_count[count] -= hits
+                by_count.setdefault(count + 1, set()).update(hits)
+
+    def fuzzy(self, query: str, limit: int = 10, max_distance: int = 2) -> List[Tuple[str, int]]:
+        """Ranked (student_id, distance) matches within ``max_distance`` edits.
+
+        The distance is to the full name or the closest of its words; ties
+        rank by trigram overlap with the query, then by ID. Overlap leaves out
+        the query's leading "  x" gram, which a later word of a name does not
+        have; every other trigram of a matching word is in its name too. Each
+        edit removes at most three trigrams, so only names sharing at least
+        ``len(grams) - 3 * max_distance`` of them, and never fewer than one,
+        are candidates. (A name sharing none can only match a query of at
+        most ``3 * max_distance`` letters; such names are not found.)
+
+        Candidates are scored in tiers of equal overlap, highest first. An
+        ID sharing c grams is at least (len(grams) - c) / 3 edits away, so
+        scoring stops once the ``limit``-th best distance cannot be beaten
+        by the next tier. Posting lists are read rarest first and only as
+        deep as the current tier needs: an ID missing from the first s lists
+        shares at most len(grams) - s grams.
+        """
+        normalized = _normalize_name(query)
+        if not normalized:
+            return []
+        grams = _trigrams(normalized) - {"  " + normalized[0]}
+        required = max(1, len(grams) - 3 * max_distance)
+        postings = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+        masks, length, letters = _pattern_masks(normalized), len(normalized), set(normalized)
+        by_count: Dict[int, Set[str]] = {}  # overlap -> IDs seen so far (exact counts)
+        seen: Set[str] = set()
+        scanned = 0
+        scored: List[Tuple[int, int, str]] = []
+        # Names and words repeat; a cached distance stays valid as the cutoff only shrinks.
+        distances: Dict[str, int] = {}
+        for count in range(len(postings), required - 1, -1):
+            # Every ID sharing ``count`` grams is in one of the first
+            # len(postings) - count + 1 lists.
+            while scanned <= len(postings) - count:
+                new = postings[scanned] - seen
+                scanned += 1
+                if new:
+                    seen |= new
+                    # New IDs are in none of the earlier lists; count the later ones.
+                    tally = {1: new}
+                    for later in postings[scanned:]:
+                        self._count_hits(tally, later)
+                    for tally_count, ids in tally.items():
+                        by_count.setdefault(tally_count, set()).update(ids)
+
+            cutoff = scored[-1][0] if len(scored) >= limit else max_distance
+            for student_id in by_count.pop(count, ()):
+                name = self._names.get(student_id)
+                if name is None:
+                    continue
+                distance = cutoff + 1
+                for target in (name, *name.split()):
+                    target_distance = distances.get(target)
+                    if target_distance is None:
+                        # Each query letter the target lacks costs at least one edit.
+                        if abs(len(target) - length) > cutoff \
+                                or len(letters.difference(target)) > cutoff:
+                            target_distance = cutoff + 1
+                        else:
+                            target_distance = _bit_parallel_distance(masks, length, target, cutoff)
+                        distances[target] = target_distance
+                    distance = min(distance, target_distance)
+                if distance <= cutoff:
+                    scored.append((distance, -count, student_id))
+            scored.sort()
+            del scored[limit:]
+            # Lower tiers are at least this far away, and rank after equal
+            # distances found here.
+            if len(scored) >= limit and scored[-1][0] <= (len(grams) - count + 3) // 3:
+                break
+        return [(student_id, distance) for distance, _, student_id in scored]
+
+    def search(self, query: str, limit: int = 10, max_distance: int = 2) -> List[Tuple[str, int]]:
+        """Prefix matches first (distance 0), then fuzzy matches."""
+        results = [(student_id, 0) for student_id in self.prefix(query, limit)]
+        if len(results) < limit:
+            seen = {student_id for student_id, _ in results}
+            for student_id, distance in self.fuzzy(query, limit, max_distance):
+                if student_id not in seen:
+                    results.append((student_id, distance))
+                    if len(results) >= limit:
+                        break
+        return results
+
+
+class Change(NamedTuple):
+    """One mutation in the change feed; ``info`` is the full row after it."""
+    sequence: int
+    operation: str
+    student_id: str
+    info: Optional[Dict[str, Any]]
+
+
+class ChangeFeed:
+    """Append-only, sequence-numbered log of mutations, trimmed to ``retention``.
+
+    Consumers keep the sequence of the last change they processed and ask
+    for everything after it. The log is swapped rather than trimmed in
+    place, so readers never need the writer's lock.
+    """
+
+    def __init__(self, retention: int = 100_000):
+        self.retention = retention
+        self.sequence = 0
+        self._log: Tuple[int, List[Change]] = (1, [])  # (sequence of entries[0], entries)
+
+    def append(self, operation: str, student_id: str, info: Optional[Dict[str, Any]]) -> int:
+        self.sequence += 1
+        first, entries = self._log
+        entries.append(Change(self.sequence, operation, student_id, info))
+        if len(entries) > 2 * self.retention:
+            kept = entries[-self.retention:]
+            self._log = (self.sequence - len(kept) + 1, kept)
+        return self.sequence
+
+    def changes_since(self, checkpoint: int, limit: Optional[int] = None) -> List[Change]:
+        """Changes with a sequence above ``checkpoint``, oldest first."""
+        first, entries = self._log
+        if checkpoint < first - 1:
+            raise ValueError(f"Checkpoint {checkpoint} is older than the retained change feed "
+                             f"(oldest sequence {first}); reload the full table")
+        start = checkpoint - first + 1
+        return entries[start:None if limit is None else start + limit]
+
+
+class StudentDatabase:
+    """A simple student database using dictionaries.
+
+    With ``concurrent=True`` the database serves lock-free readers next to
+    writers: writers are serialized by a lock and never modify a row in
+    place (an update swaps in a new row dict), so a row returned by
+    ``get_student`` is a consistent version that never changes under the
+    reader. ``snapshot()`` gives a point-in-time view of all rows. The name
+    index is always built in this mode, so ``search_names`` never has to
+    build it under the writer's lock.
+
+    With ``change_feed=True`` every add and grade update is also recorded in
+    a ``ChangeFeed`` that consumers read with ``changes_since(checkpoint)``.
+    """
+
+    def __init__(self, indexed_fields: Iterable[str] = (), name_index: bool = False,
+                 concurrent: bool = False, change_feed: bool = False,
+                 change_retention: int = 100_000):
+        self.students = {}
+        self.indexes: Dict[str, Dict[str, Set[str]]] = {}
+        self.name_index: Optional[NameIndex] = None
+        self.concurrent = concurrent
+        self._write_lock = threading.Lock() if concurrent else contextlib.nullcontext()
+        self.changes = ChangeFeed(change_retention) if change_feed else None
+        for field in indexed_fields:
+            self.create_index(field)
+        if name_index or concurrent:
+            self.create_name_index()
+
+    def create_name_index(self) -> None:
+        """Build the prefix / fuzzy name index over the current students."""
+        with self._write_lock:
+            name_index = NameIndex()
+            for student_id, info in self.students.items():
+                name_index.add(student_id, info['name'])
+            self.name_index = name_index
+
+    def snapshot(self) -> Mapping[str, dict]:
+        """Read-only point-in-time view of all students.
+
+        Only the outer dict is copied; in concurrent mode rows are never
+        modified in place, so the view stays consistent while writers run.
+        """
+        return MappingProxyType(self.students.copy())
+
+    def search_names(self, query: str, limit: int = 10,
+                     max_distance: int = 2) -> List[Tuple[str, dict]]:
+        """Top matches for a partial or misspelled name as (student_id, info)."""
+        if self.name_index is None:
+            self.create_name_index()
+        return [(student_id, self.students[student_id])
+                for student_id, _ in self.name_index.search(query, limit, max_distance)]
+
+    def _record_change(self, operation: str, student_id: str, info: dict) -> None:
+        # Plain mode updates rows in place, so the feed needs its own copy.
+        self.changes.append(operation, student_id, info if self.concurrent else dict(info))
+
+    def changes_since(self, checkpoint: int = 0, limit: Optional[int] = None) -> List[Change]:
+        """Changes after ``checkpoint`` (the last sequence a consumer processed).
+
+        Raises ValueError if the feed is disabled or the checkpoint has been
+        trimmed away, in which case the consumer must reload the full table.
+        """
+        if self.changes is None:
+            raise ValueError("Change feed is not enabled (use change_feed=True)")
+        return self.changes.changes_since(checkpoint, limit)
+
+    def create_index(self, field: str) -> None:
+        """Build a secondary index (value -> student IDs) on a field such as 'major' or 'grade'."""
+        with self._write_lock:
+            index: Dict[str, Set[str]] = {}
+            for student_id, info in self.students.items():
+                index.setdefault(info[field], set()).add(student_id)
+            self.indexes[field] = index
+
+    def _has_indexes(self) -> bool:
+        return bool(self.indexes) or self.name_index is not None
+
+    def _index_add(self, student_id: str, info: dict) -> None:
+        for field, index in self.indexes.items():
+            index.setdefault(info[field], set()).add(student_id)
+        if self.name_index is not None:
+            self.name_index.add(student_id, info['name'])
+
+    def _index_remove(self, student_id: str, info: dict) -> None:
+        if self.name_index is not None:
+            self.name_index.remove(student_id)
+        for field, index in self.indexes.items():
+            postings = index.get(info[field])
+            if postings is not None:
+                postings.discard(student_id)
+                if not postings:
+                    del index[info[field]]
+
+    @METRICS.timed("add_seconds", component="database")
+    def add_student(self, student_id: str, name: str, grade: str, major: str) -> None:
+        """Add a student with ID, name, grade, and major."""
+        info = {
+            'name': name,
+            'grade': grade,
+            'major': major
+        }
+        with self._write_lock:
+            previous = self.students.get(student_id)
+            if previous is not None and self._has_indexes():
+                self._index_remove(student_id, previous)
+            self.students[student_id] = info
+            if self._has_indexes():
+                self._index_add(student_id, info)
+            if self.changes is not None:
+                self._record_change('add', student_id, info)
+        print(f"✅ Added student: {name} (ID: {student_id})")
+
+    @METRICS.timed("add_seconds", component="database", mode="bulk")
+    def add_students(self, rows: Union[Iterable[tuple], Dict[str, List[str]]]) -> dict:
+        """Add many students silently and return a summary.
+
+        ``rows`` is an iterable of ``(student_id, name, grade, major)`` tuples
+        or a column batch ``{'student_id': [...], 'name': [...], 'grade': [...],
+        'major': [...]}``. Rows with the wrong shape or empty / non-string
+        fields are skipped and reported in ``errors`` as (row index, student
+        ID, reason). A column batch with columns of different lengths raises
+        ValueError and adds nothing.
+        """
+        if isinstance(rows, dict):
+            columns = (rows['student_id'], rows['name'], rows['grade'], rows['major'])
+            if len({len(column) for column in columns}) > 1:
+                raise ValueError("columns must have the same length")
+            rows = zip(*columns)
+
+        batch = {}
+        errors = []
+        for index, row in enumerate(rows):
+            try:
+                student_id, name, grade, major = row
+            except (TypeError, ValueError):
+                errors.append((index, None, "expected 4 fields"))
+                continue
+            if not all(isinstance(value, str) and value for value in (student_id, name, grade, major)):
+                errors.append((index, student_id, "fields must be non-empty strings"))
+                continue
+            batch[student_id] = {'name': name, 'grade': grade, 'major': major}
+
+        with self._write_lock:
+            replaced = len(batch.keys() & self.students.keys())
+            if self._has_indexes():
+                for student_id, info in batch.items():
+                    previous = self.students.get(student_id)
+                    if previous is not None:
+                        self._index_remove(student_id, previous)
+                    self._index_add(student_id, info)
+            self.students.update(batch)
+            if self.changes is not None:
+                for student_id, info in batch.items():
+                    self._record_change('add', student_id, info)
+        return {'added': len(batch) - replaced, 'replaced': replaced, 'errors': errors}
+
+    def get_student(self, student_id: str) -> Optional[dict]:
+        """Retrieve student information by ID."""
+        return self.students.get(student_id)
+
+    @METRICS.timed("update_seconds", component="database")
+    def update_grade(self, student_id: str, new_grade: str) -> None:
+        """Update a student's grade."""
+        with self._write_lock:
+            student = self.get_student(student_id)
+            if student:
+                old_grade = student['grade']
+                index = self.indexes.get('grade')
+                if index is not None and old_grade != new_grade:
+                    index.setdefault(new_grade, set()).add(student_id)
+                    postings = index[old_grade]
+                    postings.discard(student_id)
+                    if not postings:
+                        del index[old_grade]
+                if self.concurrent:
+                    student = self.students[student_id] = {**student, 'grade': new_grade}
+                else:
+                    student['grade'] = new_grade
+                if self.changes is not None:
+                    self._record_change('update', student_id, student)
+        if student:
+            print(f"✅ Updated {student['name']}'s grade from {old_grade} to {new_grade}")
+        else:
+            print(f"❌ Student ID {student_id} not found!")
+
+    def query(self, **filters) -> Dict[str, dict]:
+        """Return students matching every filter (AND).
+
+        A filter value is either a single value (equality) or a list, tuple or
+        set of values (IN), e.g. ``query(major="Engineering", grade=["A", "A-"])``.
+        The most selective indexed filter drives the lookup; the rest are
+        checked per candidate, so the cost follows the candidate count.
+        Every filter, including the driving one, is re-checked on the row, so
+        results stay correct while a concurrent writer moves index entries.
+        """
+        conditions = {
+            field: set(value) if isinstance(value, (list, tuple, set, frozenset)) else {value}
+            for field, value in filters.items()
+        }
+
+        best_field = None
+        best_size = None
+        for field, values in conditions.items():
+            index = self.indexes.get(field)
+            if index is None:
+                continue
+            size = sum(len(index.get(value, ())) for value in values)
+            if best_size is None or size < best_size:
+                best_field, best_size = field, size
+
+        if best_field is None:
+            candidates = tuple(self.students)
+        else:
+            # tuple() copies each posting set in one step, so a writer
+            # changing the set cannot break the iteration.
+            index = self.indexes[best_field]
+            candidates = [
+                student_id
+                for value in conditions[best_field]
+                for student_id in tuple(index.get(value, ()))
+            ]
+
+        results = {}
+        for student_id in candidates:
+            info = self.students[student_id]
+            if all(info.get(field) in values for field, values in conditions.items()):
+                results[student_id] = info
+        return results
+
+    def display_all_students(self) -> None:
+        """Display all students."""
+        print("\n" + "=" * 50)
+        print("ALL STUDENTS")
+        print("=" * 50)
+        if not self.students:
+            print("No students in the database.")
+            return
+
+        for student_id, info in self.students.items():
+            print(f"ID: {student_id}")
+            print(f"  Name : {info['name']}")
+            print(f"  Grade: {info['grade']}")
+            print(f"  Major: {info['major']}")
+            print("-" * 50)
+
+
+def benchmark_bulk_add(count: int = 200_000) -> dict:
+    """Compare add_students with looping over add_student (output discarded)."""
+    rows = [(f"S{i:07d}", f"Student {i}", "B+", "Engineering") for i in range(count)]
+
+    database = StudentDatabase()
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for row in rows:
+            database.add_student(*row)
+    loop_seconds = time.perf_counter() - start
+
+    database = StudentDatabase()
+    start = time.perf_counter()
+    database.add_students(rows)
+    bulk_seconds = time.perf_counter() - start
+
+    print(f"add_student loop : {count / loop_seconds:,.0f} rows/s")
+    print(f"add_students     : {count / bulk_seconds:,.0f} rows/s")
+    return {'count': count, 'loop': loop_seconds, 'bulk': bulk_seconds}
+
+
+def benchmark_concurrent_reads(count: int = 100_000, readers: int = 4,
+                               seconds: float = 2.0) -> dict:
+    """Reader throughput with and without a writer running update_grade.
+
+    Each reader fetches rows in batches of 1,000 and, at the end of a
+    batch, checks whether any row it still holds has changed grade since
+    it was fetched; ``changed_rows`` counts those. Plain mode updates rows
+    in place, so held rows change under the reader; concurrent mode swaps
+    in new rows, so a held row never changes.
+    """
+    grades = ("A", "B", "C", "D")
+    results = {}
+    for concurrent in (False, True):
+        database = StudentDatabase(indexed_fields=("grade",), concurrent=concurrent)
+        database.add_students([(f"S{i:07d}", f"Student {i}", "A", "Engineering")
+                               for i in range(count)])
+        ids = list(database.students)
+
+        for with_writer in (False, True):
+            stop = threading.Event()
+            reads = [0] * readers
+            changed = [0] * readers
+
+            def read(slot: int) -> None:
+                rng = random.Random(slot)
+                done = changed_rows = 0
+                while not stop.is_set():
+                    held = []
+                    for _ in range(1000):
+                        row = database.get_student(ids[rng.randrange(count)])
+                        held.append((row, row['grade']))
+                    changed_rows += sum(row['grade'] != grade for row, grade in held)
+                    done += 1000
+                reads[slot], changed[slot] = done, changed_rows
+
+            def write() -> None:
+                rng = random.Random(99)
+                while not stop.is_set():
+                    database.update_grade(ids[rng.randrange(count)], rng.choice(grades))
+
+            threads = [threading.Thread(target=read, args=(slot,)) for slot in range(readers)]
+            if with_writer:
+                threads.append(threading.Thread(target=write))
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                for thread in threads:
+                    thread.start()
+                time.sleep(seconds)
+                stop.set()
+                for thread in threads:
+                    thread.join()
+
+            label = f"{'concurrent' if concurrent else 'plain'}{' + writer' if with_writer else ''}"
+            results[label] = {'reads_per_second': sum(reads) / seconds, 'changed_rows': sum(changed)}
+            print(f"{label:20}: {sum(reads) / seconds:,.0f} reads/s, "
+                  f"{sum(changed):,} held rows changed")
+    return results
+
+
+def benchmark_incremental_save(count: int = 100_000, updates: int = 100) -> dict:
+    """Hourly refresh cost: full snapshot save vs journaling the change feed."""
+    import tempfile
+    try:
+        from .student_records import StudentFileSystem
+    except ImportError:  # run as a script
+        from student_records import StudentFileSystem
+
+    database = StudentDatabase(change_feed=True)
+    database.add_students([(f"S{i:07d}", f"Student {i}", "B", "Engineering")
+                           for i in range(count)])
+    with tempfile.TemporaryDirectory() as directory, \
+            open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        full = StudentFileSystem(os.path.join(directory, "full.pkl"))
+        incremental = StudentFileSystem(os.path.join(directory, "incremental.pkl"), journal=True)
+        incremental.save_records(database.students)
+        checkpoint = database.changes.sequence
+
+        for i in range(updates):
+            database.update_grade(f"S{i * 7 % count:07d}", "A")
+
+        start = time.perf_counter()
+        full.save_records(database.students)
+        full_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        changes = database.changes_since(checkpoint)
+        incremental.apply_changes(changes)
+        incremental_seconds = time.perf_counter() - start
+        incremental.close()
+
+    print(f"Full save     : {full_seconds * 1000:.2f} ms for {count:,} rows")
+    print(f"Apply changes : {incremental_seconds * 1000:.2f} ms for {len(changes):,} changes")
+    return {'count': count, 'changes': len(changes), 'full': full_seconds,
+            'incremental': incremental_seconds}
+
+
+def benchmark_name_search(count: int = 1_000_000, queries: int = 50) -> dict:
+    """Time indexed prefix and fuzzy name search against a linear scan."""
+    first = ("alice", "bob", "charlie", "diana", "edward", "fiona", "george", "hannah",
+             "ivan", "julia", "kevin", "laura", "miguel", "nina", "oscar", "paula")
+    rng = random.Random(7)
+    rows = [(f"S{i:07d}",
+             f"{rng.choice(first).title()} {''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=7)).title()}",
+             "B", "Engineering")
+            for i in range(count)]
+    database = StudentDatabase(name_index=True)
+    start = time.perf_counter()
+    database.add_students(rows)
+    build_seconds = time.perf_counter() - start
+
+    targets = [rng.choice(rows)[1] for _ in range(queries)]
+    prefixes = [name.split()[1][:4] for name in targets]
+    typos = [name[:-2] + name[-1] for name in targets]  # drop one character
+
+    start = time.perf_counter()
+    for prefix in prefixes:
+        database.search_names(prefix)
+    prefix_seconds = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for typo in typos:
+        database.name_index.fuzzy(typo)
+    fuzzy_seconds = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for prefix in prefixes[:3]:
+        [student_id for student_id, info in database.students.items()
+         if any(word.startswith(prefix) for word in info['name'].lower().split())]
+    scan_seconds = (time.perf_counter() - start) / 3
+
+    print(f"Index build  : {build_seconds:.2f}s for {count:,} names")
+    print(f"Prefix query : {prefix_seconds * 1000:.2f} ms")
+    print(f"Fuzzy query  : {fuzzy_seconds * 1000:.2f} ms")
+    print(f"Linear scan  : {scan_seconds * 1000:.1f} ms")
+    return {'count': count, 'build': build_seconds, 'prefix': prefix_seconds,
+            'fuzzy': fuzzy_seconds, 'scan': scan_seconds}
+
+
+# -----------------------------
+# TASK 3.2: WORD FREQUENCY COUNTER
+# -----------------------------
+
+def count_word_frequency(text: str) -> None:
+    """Count and display word frequencies in text."""
+    print("\n" + "=" * 50)
+    print("TASK 3.2: WORD FREQUENCY COUNTER")
+    print("=" * 50)
+
+    # Remove punctuation, normalize and count
+    stats = word_stats(text)
+    sorted_words = stats['frequencies'].most_common()
+
+    print(f"Original text: {text}")
+    print(f"\nTotal words  : {stats['total_words']}")
+    print(f"Unique words : {stats['unique_words']}")
+
+    print("\nWord frequencies (sorted by count):")
+    for word, count in sorted_words:
+        print(f"  '{word}': {count}")
+
+    most_common_word, count = sorted_words[0]
+    print(f"\nMost common word: '{most_common_word}' appears {count} times")
+
+
+# -----------------------------
+# MAIN PROGRAM
+# -----------------------------
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("TASK 3.1: STUDENT DATABASE DEMO")
+    print("=" * 50)
+
+    db = StudentDatabase()
+
+    # Adding students
+    db.add_student("S001", "Alice Johnson", "A", "Computer Science")
+    db.add_student("S002", "Bob Smith", "B+", "Engineering")
+    db.add_student("S003", "Charlie Brown", "A-", "Mathematics")
+
+    # Display all students
+    db.display_all_students()
+
+    # Retrieve a student
+    print("\n" + "=" * 50)
+    print("RETRIEVING STUDENT S002")
+    print("=" * 50)
+    student = db.get_student("S002")
+    if student:
+        print(f"Name : {student['name']}")
+        print(f"Grade: {student['grade']}")
+        print(f"Major: {student['major']}")
+    else:
+        print("Student not found!")
+
+    # Update grade
+    print("\n" + "=" * 50)
+    print("UPDATING GRADE")
+    print("=" * 50)
+    db.update_grade("S002", "A")
+    db.display_all_students()
+
+    # Task 3.2: Word Frequency Counter
+    sample_text = "Python is amazing. Python makes programming easy. Programming with Python is fun."
+    count_word_frequency(sample_text)
@@ -1,89 +1,383 @@
-# ==================================================
-# TASK 1.1: STUDENT GRADE MANAGER
-# ==================================================
-
-from typing import List
-
-
-class StudentManager:
-    """Manage student names and grades."""
-
-    def __init__(self):
-        self.students: List[dict] = []
-
-    def add_student(self, name: str, grade: float) -> None:
-        """Add a student with their grade."""
-        self.students.append({"name": name, "grade": grade})
-        print(f"✅ Added {name} with grade {grade}")
-
-    def calculate_average(self) -> float:
-        """Calculate average grade."""
-        if not self.students:
-            return 0.0
-        return sum(s["grade"] for s in self.students) / len(self.students)
-
-    def find_highest(self) -> float:
-        """Find the highest grade."""
-        if not self.students:
-            return 0.0
-        return max(s["grade"] for s in self.students)
-
-    def display_all(self) -> None:
-        """Display all students and their grades."""
-        print("\n" + "=" * 40)
-        print("STUDENT GRADES")
-        print("=" * 40)
-        if not self.students:
-            print("No students added yet.")
-            return
-
-        for s in self.students:
-            print(f"{s['name']}: {s['grade']}")
-
-        print("\nAverage Grade: {:.2f}".format(self.calculate_average()))
-        print("Highest Grade: {:.2f}".format(self.find_highest()))
-
-
-# ==================================================
-# TASK 1.2: LIST OPERATIONS PRACTICE
-# ==================================================
-
-def list_operations() -> None:
-    """Practice various list operations."""
-    numbers = [5, 2, 8, 1, 9, 3]
-    print("\n" + "=" * 40)
-    print("TASK 1.2: LIST OPERATIONS")
-    print("=" * 40)
-    print(f"Original list: {numbers}")
-
-    sorted_numbers = sorted(numbers)
-    print(f"Sorted list: {sorted_numbers}")
-
-    total = sum(numbers)
-    print(f"Sum: {total}")
-
-    average = total / len(numbers)
-    print(f"Average: {average:.2f}")
-
-    print(f"Maximum: {max(numbers)}")
-    print(f"Minimum: {min(numbers)}")
-    print(f"Length: {len(numbers)}")
-
-
-# ==================================================
-# MAIN PROGRAM
-# ==================================================
-
-if __name__ == "__main__":
-    print("=" * 40)
-    print("TASK 1.1: STUDENT GRADE MANAGER")
-    print("=" * 40)
-
-    manager = StudentManager()
-    manager.add_student("Alice", 85)
-    manager.add_student("Bob", 92)
-    manager.add_student("Charlie", 78)
-
-    manager.display_all()
-
-    list_operations()
+# ==================================================
+# TASK 1.1: STUDENT GRADE MANAGER
+# ==================================================
+
+import contextlib
+import math
+import os
+import random
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    from .metrics import METRICS
+except ImportError:  # run as a script
+    from metrics import METRICS
+
+
+class _Node:
+    __slots__ = ("key", "priority", "left", "right", "size")
+
+    def __init__(self, key: tuple, priority: float):
+        self.key = key
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.size = 1
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node else 0
+
+
+def _split(node: Optional[_Node], key: tuple) -> tuple:
+    """Split a treap into keys < key and keys >= key."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        left, right = _split(node.right, key)
+        node.right = left
+        node.size = 1 + _size(node.left) + _size(left)
+        return node, right
+    left, right = _split(node.left, key)
+    node.left = right
+    node.size = 1 + _size(right) + _size(node.right)
+    return left, node
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Merge two treaps where every key in left is below every key in right."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.size = 1 + _size(left.left) + _size(left.right)
+        return left
+    right.left = _merge(left, right.left)
+    right.size = 1 + _size(right.left) + _size(right.right)
+    return right
+
+
+def _union(first: Optional[_Node], second: Optional[_Node]) -> Optional[_Node]:
+    """Union of two treaps with distinct keys."""
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if first.priority < second.priority:
+        first, second = second, first
+    left, right = _split(second, first.key)
+    first.left = _union(first.left, left)
+    first.right = _union(first.right, right)
+    first.size = 1 + _size(first.left) + _size(first.right)
+    return first
+
+
+class GradeTree:
+    """Order-statistic treap of grades; operations take expected O(log n).
+
+    Keys are (grade, insertion number), so equal grades stay distinct and
+    each entry can be traced back to the insert that added it.
+    """
+
+    def __init__(self):
+        self._root: Optional[_Node] = None
+        self._sequence = 0
+        self._random = random.Random()
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def insert(self, grade: float) -> None:
+        """Insert a grade (duplicates allowed)."""
+        key = (grade, self._sequence)
+        self._sequence += 1
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, _Node(key, self._random.random())), right)
+
+    def extend(self, grades: Iterable[float]) -> None:
+        """Insert many grades: build a treap from the sorted batch, then union."""
+        keys = []
+        for grade in grades:
+            keys.append((grade, self._sequence))
+            self._sequence += 1
+        keys.sort()
+
+        # Linear-time Cartesian tree build over the sorted keys.
+        stack: List[_Node] = []
+        for key in keys:
+            node = _Node(key, self._random.random())
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+                last.size = 1 + _size(last.left) + _size(last.right)
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+        batch = stack[0] if stack else None
+        while stack:
+            node = stack.pop()
+            node.size = 1 + _size(node.left) + _size(node.right)
+
+        self._root = _union(self._root, batch)
+
+    def kth(self, k: int) -> float:
+        """Return the k-th smallest grade (0-based)."""
+        if not 0 <= k < len(self):
+            raise IndexError("GradeTree index out of range")
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.key[0]
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def count_above(self, grade: float) -> int:
+        """Count grades strictly greater than the given grade."""
+        count = 0
+        node = self._root
+        while node:
+            if node.key[0] > grade:
+                count += 1 + _size(node.right)
+                node = node.left
+            else:
+                node = node.right
+        return count
+
+    def top(self, n: int) -> List[float]:
+        """Return the n highest grades, highest first."""
+        return [grade for grade, _ in self.top_entries(n)]
+
+    def top_entries(self, n: int) -> List[Tuple[float, int]]:
+        """Return the n highest (grade, insertion number) keys, highest first."""
+        result = []
+        stack = []
+        node = self._root
+        while (stack or node) and len(result) < n:
+            if node:
+                stack.append(node)
+                node = node.right
+            else:
+                node = stack.pop()
+                result.append(node.key)
+                node = node.left
+        return result
+
+
+class StudentManager:
+    """Manage student names and grades."""
+
+    def __init__(self):
+        self.students: List[dict] = []
+        self._total = 0.0
+        self._lowest: Optional[float] = None
+        self._highest: Optional[float] = None
+        # Grades in insertion order, so a tree entry's number is its row in students.
+        self._tree = GradeTree()
+        self._rows_of: Dict[str, List[int]] = {}
+
+    @METRICS.timed("add_seconds", component="manager")
+    def add_student(self, name: str, grade: float) -> None:
+        """Add a student with their grade."""
+        self._record(name, grade)
+        print(f"✅ Added {name} with grade {grade}")
+
+    @METRICS.timed("add_seconds", component="manager", mode="bulk")
+    def add_students(self, rows: Union[Iterable[tuple], Dict[str, list]]) -> dict:
+        """Add many students silently and return a summary.
+
+        ``rows`` is an iterable of ``(name, grade)`` pairs or a column batch
+        ``{'name': [...], 'grade': [...]}``. Rows whose grade is not a finite
+        number, or that are not pairs, are skipped and reported in ``errors``
+        as (row index, name, reason). A column batch with columns of different
+        lengths raises ValueError and adds nothing.
+        """
+        if isinstance(rows, dict):
+            if len(rows['name']) != len(rows['grade']):
+                raise ValueError("columns must have the same length")
+            rows = zip(rows['name'], rows['grade'])
+
+        names = []
+        grades = []
+        errors = []
+        for index, row in enumerate(rows):
+            try:
+                name, grade = row
+            except (TypeError, ValueError):
+                errors.append((index, None, "expected 2 fields"))
+                continue
+            if isinstance(grade, bool) or not isinstance(grade, (int, float)) \
+                    or not math.isfinite(grade):
+                errors.append((index, name, "grade must be a finite number"))
+                continue
+            names.append(name)
+            grades.append(grade)
+
+        if grades:
+            first_row = len(self.students)
+            self.students.extend({"name": name, "grade": grade}
+                                 for name, grade in zip(names, grades))
+            self._total += sum(grades)
+            highest, lowest = max(grades), min(grades)
+            if self._highest is None or highest > self._highest:
+                self._highest = highest
+            if self._lowest is None or lowest < self._lowest:
+                self._lowest = lowest
+            self._tree.extend(grades)
+            for row, name in enumerate(names, first_row):
+                self._rows_of.setdefault(name, []).append(row)
+        return {'added': len(grades), 'errors': errors}
+
+    def _record(self, name: str, grade: float) -> None:
+        """Store a student and update the running statistics."""
+        self.students.append({"name": name, "grade": grade})
+        self._total += grade
+        if self._highest is None or grade > self._highest:
+            self._highest = grade
+        if self._lowest is None or grade < self._lowest:
+            self._lowest = grade
+        self._tree.insert(grade)
+        self._rows_of.setdefault(name, []).append(len(self.students) - 1)
+
+    def calculate_average(self) -> float:
+        """Calculate average grade."""
+        if not self.students:
+            return 0.0
+        return self._total / len(self.students)
+
+    def find_highest(self) -> float:
+        """Find the highest grade."""
+        if not self.students:
+            return 0.0
+        return self._highest
+
+    def find_lowest(self) -> float:
+        """Find the lowest grade."""
+        if not self.students:
+            return 0.0
+        return self._lowest
+
+    def percentile(self, percent: float) -> float:
+        """Grade at the given percentile (0-100), linearly interpolated."""
+        if not self.students:
+            return 0.0
+        position = (len(self._tree) - 1) * percent / 100
+        lower = math.floor(position)
+        value = self._tree.kth(lower)
+        if position == lower:
+            return value
+        return value + (self._tree.kth(lower + 1) - value) * (position - lower)
+
+    def median(self) -> float:
+        """Median grade."""
+        return self.percentile(50)
+
+    def rank(self, student: Union[int, str]) -> Optional[int]:
+        """Leaderboard rank (1 = highest grade, equal grades share a rank), or None if unknown.
+
+        ``student`` is a row index into ``students`` or a name; a name shared
+        by several students gives the best of their ranks.
+        """
+        if isinstance(student, str):
+            rows = self._rows_of.get(student)
+            if not rows:
+                return None
+            grade = max(self.students[row]['grade'] for row in rows)
+        elif 0 <= student < len(self.students):
+            grade = self.students[student]['grade']
+        else:
+            return None
+        return self._tree.count_above(grade) + 1
+
+    def top(self, n: int) -> List[Tuple[str, float]]:
+        """The n highest-graded students as (name, grade), highest first."""
+        return [(self.students[row]['name'], grade) for grade, row in self._tree.top_entries(n)]
+
+    def display_all(self) -> None:
+        """Display all students and their grades."""
+        print("\n" + "=" * 40)
+        print("STUDENT GRADES")
+        print("=" * 40)
+        if not self.students:
+            print("No students added yet.")
+            return
+
+        for s in self.students:
+            print(f"{s['name']}: {s['grade']}")
+
+        print("\nAverage Grade: {:.2f}".format(self.calculate_average()))
+        print("Highest Grade: {:.2f}".format(self.find_highest()))
+
+
+def benchmark_bulk_add(count: int = 200_000) -> dict:
+    """Compare add_students with looping over add_student (output discarded)."""
+    rng = random.Random(0)
+    rows = [(f"Student {i}", round(rng.uniform(60, 100), 1)) for i in range(count)]
+
+    manager = StudentManager()
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for name, grade in rows:
+            manager.add_student(name, grade)
+    loop_seconds = time.perf_counter() - start
+
+    manager = StudentManager()
+    start = time.perf_counter()
+    manager.add_students(rows)
+    bulk_seconds = time.perf_counter() - start
+
+    print(f"add_student loop : {count / loop_seconds:,.0f} rows/s")
+    print(f"add_students     : {count / bulk_seconds:,.0f} rows/s")
+    return {'count': count, 'loop': loop_seconds, 'bulk': bulk_seconds}
+
+
+# ==================================================
+# TASK 1.2: LIST OPERATIONS PRACTICE
+# ==================================================
+
+def list_operations() -> None:
+    """Practice various list operations."""
+    numbers = [5, 2, 8, 1, 9, 3]
+    print("\n" + "=" * 40)
+    print("TASK 1.2: LIST OPERATIONS")
+    print("=" * 40)
+    print(f"Original list: {numbers}")
+
+    sorted_numbers = sorted(numbers)
+    print(f"Sorted list: {sorted_numbers}")
+
+    total = sum(numbers)
+    print(f"Sum: {total}")
+
+    average = total / len(numbers)
+    print(f"Average: {average:.2f}")
+
+    print(f"Maximum: {max(numbers)}")
+    print(f"Minimum: {min(numbers)}")
+    print(f"Length: {len(numbers)}")
+
+
+# ==================================================
+# MAIN PROGRAM
+# ==================================================
+
+if __name__ == "__main__":
+    print("=" * 40)
+    print("TASK 1.1: STUDENT GRADE MANAGER")
+    print("=" * 40)
+
+    manager = StudentManager()
+    manager.add_student("Alice", 85)
+    manager.add_student("Bob", 92)
+    manager.add_student("Charlie", 78)
+
+    manager.display_all()
+
+    list_operations()
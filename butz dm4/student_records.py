@@ -1,165 +1,1119 @@
-import pickle
-from typing import Dict, Any, Optional
-
-# ==================================================
-# TASK 4.1: STUDENT RECORDS FILE SYSTEM
-# ==================================================
-
-class StudentFileSystem:
-    """Manage saving, loading, and exporting student records."""
-
-    def __init__(self, filename_pickle: str = "students.pkl", filename_text: str = "students.txt"):
-        self.filename_pickle = filename_pickle
-        self.filename_text = filename_text
-
-    def save_records(self, records: Dict[str, Dict[str, Any]]) -> bool:
-        """Save student records using pickle."""
-        try:
-            with open(self.filename_pickle, 'wb') as file:
-                pickle.dump(records, file)
-            print(f"✅ Records saved to '{self.filename_pickle}'")
-            return True
-        except Exception as e:
-            print(f"❌ Error saving records: {e}")
-            return False
-
-    def load_records(self) -> Optional[Dict[str, Dict[str, Any]]]:
-        """Load student records from pickle file."""
-        try:
-            with open(self.filename_pickle, 'rb') as file:
-                records = pickle.load(file)
-            print(f"✅ Records loaded from '{self.filename_pickle}'")
-            return records
-        except FileNotFoundError:
-            print(f"❌ Error: File '{self.filename_pickle}' not found!")
-            return None
-        except Exception as e:
-            print(f"❌ Error loading records: {e}")
-            return None
-
-    def export_to_text(self, records: Dict[str, Dict[str, Any]]) -> bool:
-        """Export student records to a readable text file."""
-        try:
-            with open(self.filename_text, 'w') as file:
-                file.write("="*60 + "\n")
-                file.write("STUDENT RECORDS\n")
-                file.write("="*60 + "\n\n")
-                
-                for student_id, info in records.items():
-                    file.write(f"Student ID: {student_id}\n")
-                    file.write(f"  Name : {info['name']}\n")
-                    file.write(f"  Grade: {info['grade']}\n")
-                    file.write(f"  Major: {info['major']}\n")
-                    file.write("-"*60 + "\n")
-            print(f"✅ Records exported to '{self.filename_text}'")
-            return True
-        except Exception as e:
-            print(f"❌ Error exporting records: {e}")
-            return False
-
-
-# ==================================================
-# TASK 4.2: FILE OPERATIONS PRACTICE
-# ==================================================
-
-def demonstrate_file_operations() -> None:
-    """Demonstrate writing, reading, and appending to files."""
-    print("\n" + "="*60)
-    print("TASK 4.2: FILE OPERATIONS PRACTICE")
-    print("="*60)
-
-    filename = "sample.txt"
-
-    # Writing to a file
-    print("\n1. Writing to a new file (w mode)...")
-    try:
-        with open(filename, 'w') as file:
-            file.writelines(["This is line 1\n", "This is line 2\n", "This is line 3\n"])
-        print("✅ File written successfully")
-    except Exception as e:
-        print(f"❌ Error writing file: {e}")
-
-    # Reading from a file
-    print("\n2. Reading from the file (r mode)...")
-    try:
-        with open(filename, 'r') as file:
-            content = file.read()
-        print("File contents:\n" + content)
-    except FileNotFoundError:
-        print("❌ Error: File not found!")
-    except Exception as e:
-        print(f"❌ Error reading file: {e}")
-
-    # Appending to a file
-    print("\n3. Appending to the file (a mode)...")
-    try:
-        with open(filename, 'a') as file:
-            file.writelines(["This is line 4 (appended)\n", "This is line 5 (appended)\n"])
-        print("✅ Content appended successfully")
-    except Exception as e:
-        print(f"❌ Error appending to file: {e}")
-
-    # Reading again
-    print("\n4. Reading file again to show appended content...")
-    try:
-        with open(filename, 'r') as file:
-            content = file.read()
-        print("Updated file contents:\n" + content)
-    except Exception as e:
-        print(f"❌ Error reading file: {e}")
-
-    # Demonstrating file not found
-    print("\n5. Demonstrating file not found error handling...")
-    try:
-        with open("nonexistent.txt", 'r') as file:
-            _ = file.read()
-    except FileNotFoundError:
-        print("✅ Handled FileNotFoundError: The file does not exist")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-
-
-# ==================================================
-# MAIN PROGRAM
-# ==================================================
-
-if __name__ == "__main__":
-    print("="*60)
-    print("TASK 4.1: STUDENT RECORDS FILE SYSTEM")
-    print("="*60)
-
-    student_records = {
-        "S001": {"name": "Alice Johnson", "grade": "A", "major": "Computer Science"},
-        "S002": {"name": "Bob Smith", "grade": "B+", "major": "Engineering"},
-        "S003": {"name": "Charlie Brown", "grade": "A-", "major": "Mathematics"}
-    }
-
-    print("\nOriginal student records:")
-    for sid, info in student_records.items():
-        print(f"{sid}: {info['name']} - {info['grade']} - {info['major']}")
-
-    print("\n" + "-"*60)
-    fs = StudentFileSystem()
-    fs.save_records(student_records)
-
-    print("\n" + "-"*60)
-    loaded_records = fs.load_records()
-
-    if loaded_records:
-        print("\nLoaded student records:")
-        for sid, info in loaded_records.items():
-            print(f"{sid}: {info['name']} - {info['grade']} - {info['major']}")
-
-    print("\n" + "-"*60)
-    fs.export_to_text(student_records)
-    print("\nCheck 'students.txt' to see the readable export.")
-
-    demonstrate_file_operations()
-
-    print("\n" + "="*60)
-    print("ALL TASKS COMPLETED!")
-    print("="*60)
-    print("\nFiles created:")
-    print("  - students.pkl (pickle file)")
-    print("  - students.txt (readable export)")
-    print("  - sample.txt (file operations demo)")
+import contextlib
+import csv
+import gzip
+import io
+import json
+import lzma
+import mmap
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from array import array
+from collections.abc import Mapping
+from concurrent.futures import Future
+from itertools import accumulate, islice, repeat
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from .metrics import METRICS
+except ImportError:  # run as a script
+    from metrics import METRICS
+
+# Journal layout: a header naming the snapshot it applies to (size + crc32),
+# followed by frames of (payload length, payload crc32, pickled operation).
+_JOURNAL_MAGIC = b"SJRNL1\0\0"
+_JOURNAL_HEADER = struct.Struct("<8sQI")
+_FRAME_HEADER = struct.Struct("<II")
+
+
+def _fsync_directory(path: str) -> None:
+    """Flush a directory entry so a rename survives a crash."""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_synced(path: str, data: bytes) -> None:
+    with open(path, 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write a file via temp file, fsync and rename."""
+    temp_path = f"{path}.tmp"
+    _write_synced(temp_path, data)
+    os.replace(temp_path, path)
+    _fsync_directory(path)
+
+
+def _read_snapshot(path: str) -> bytes:
+    try:
+        with open(path, 'rb') as file:
+            return file.read()
+    except FileNotFoundError:
+        return b""
+
+
+def _snapshot_token(data: bytes) -> Tuple[int, int]:
+    return len(data), zlib.crc32(data)
+
+
+def _journal_header(token: Tuple[int, int]) -> bytes:
+    return _JOURNAL_HEADER.pack(_JOURNAL_MAGIC, *token)
+
+
+def _read_journal(path: str, token: Tuple[int, int],
+                  limit: Optional[int] = None) -> Optional[Tuple[List[tuple], int]]:
+    """Return (operations, end offset of the last intact frame) or None.
+
+    None means the journal is missing or belongs to a different snapshot.
+    Reading stops at the first torn or corrupt frame.
+    """
+    try:
+        with open(path, 'rb') as file:
+            data = file.read() if limit is None else file.read(limit)
+    except FileNotFoundError:
+        return None
+    if len(data) < _JOURNAL_HEADER.size:
+        return None
+    magic, size, crc = _JOURNAL_HEADER.unpack_from(data)
+    if magic != _JOURNAL_MAGIC or (size, crc) != token:
+        return None
+
+    operations = []
+    offset = _JOURNAL_HEADER.size
+    while offset + _FRAME_HEADER.size <= len(data):
+        length, crc = _FRAME_HEADER.unpack_from(data, offset)
+        start = offset + _FRAME_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        operations.append(pickle.loads(payload))
+        offset = start + length
+    return operations, offset
+
+
+def _apply_operations(records: Dict[str, Dict[str, Any]], operations: List[tuple]) -> None:
+    for operation, student_id, info in operations:
+        if operation == 'put':
+            records[student_id] = info
+        else:
+            records.pop(student_id, None)
+
+# Indexed layout: header (magic, count, keys offset, index offset), pickled
+# records back to back, the sorted UTF-8 keys, then one fixed-size index
+# entry (key offset, key length, record offset, record length) per record.
+_INDEX_MAGIC = b"SRECIDX1"
+_INDEX_HEADER = struct.Struct("<8sQQQ")
+_INDEX_ENTRY = struct.Struct("<QIQI")
+
+
+def write_indexed_records(path: str, records: Dict[str, Dict[str, Any]]) -> None:
+    """Write records in the random-access indexed format (atomically)."""
+    temp_path = f"{path}.tmp"
+    keys = sorted(records, key=lambda student_id: student_id.encode())
+    with open(temp_path, 'wb') as file:
+        file.write(b"\0" * _INDEX_HEADER.size)
+        locations = []
+        for student_id in keys:
+            payload = pickle.dumps(records[student_id], protocol=pickle.HIGHEST_PROTOCOL)
+            locations.append((file.tell(), len(payload)))
+            file.write(payload)
+
+        keys_offset = file.tell()
+        key_locations = []
+        for student_id in keys:
+            encoded = student_id.encode()
+            key_locations.append((file.tell() - keys_offset, len(encoded)))
+            file.write(encoded)
+
+        index_offset = file.tell()
+        file.write(b"".join(
+            _INDEX_ENTRY.pack(*key_location, *location)
+            for key_location, location in zip(key_locations, locations)
+        ))
+        file.seek(0)
+        file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, len(keys), keys_offset, index_offset))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+    _fsync_directory(path)
+
+
+class IndexedRecords(Mapping):
+    """Read-only, memory-mapped view of an indexed records file.
+
+    Opening only reads the header; lookups binary-search the on-disk index
+    and unpickle just the requested record.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._keys_offset, self._index_offset = \
+            _INDEX_HEADER.unpack_from(self._buffer)
+        if magic != _INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' is not an indexed records file")
+
+    def _entry(self, position: int) -> tuple:
+        return _INDEX_ENTRY.unpack_from(
+            self._buffer, self._index_offset + position * _INDEX_ENTRY.size
+        )
+
+    def _key(self, entry: tuple) -> bytes:
+        start = self._keys_offset + entry[0]
+        return self._buffer[start:start + entry[1]]
+
+    def _find(self, student_id: str) -> Optional[tuple]:
+        target = student_id.encode()
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            entry = self._entry(middle)
+            key = self._key(entry)
+            if key < target:
+                low = middle + 1
+            elif key > target:
+                high = middle
+            else:
+                return entry
+        return None
+
+    def __getitem__(self, student_id: str) -> Dict[str, Any]:
+        entry = self._find(student_id) if isinstance(student_id, str) else None
+        if entry is None:
+            raise KeyError(student_id)
+        return pickle.loads(self._buffer[entry[2]:entry[2] + entry[3]])
+
+    def __contains__(self, student_id) -> bool:
+        return isinstance(student_id, str) and self._find(student_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self._key(self._entry(position)).decode()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._buffer.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Columnar layout: header (magic, row count, column count), one directory
+# entry per column (name length, kind, codec, offset, stored length) plus
+# the name, then the column blobs. Columns are read independently, so a
+# load can skip the ones it does not need.
+_COLUMNAR_MAGIC = b"SCOLUMN1"
+_COLUMNAR_HEADER = struct.Struct("<8sQI")
+_COLUMN_ENTRY = struct.Struct("<HBBQQ")
+_DICTIONARY_HEADER = struct.Struct("<cIQ")
+# Column kinds: length-prefixed strings, dictionary-encoded strings, and a
+# pickled list for anything else (missing fields stored as Ellipsis).
+_STRINGS, _DICTIONARY, _PICKLED = 0, 1, 2
+COLUMN_CODECS = {None: 0, 'zlib': 1, 'lzma': 2}
+_COMPRESS = {0: bytes, 1: lambda data: zlib.compress(data, 6), 2: lzma.compress}
+_DECOMPRESS = {0: bytes, 1: zlib.decompress, 2: lzma.decompress}
+SNAPSHOT_FORMATS = ('pickle', 'columnar')
+
+
+def _pack_lengths(values: List[str]) -> bytes:
+    lengths = array('I', map(len, values))
+    if sys.byteorder == 'big':
+        lengths.byteswap()
+    return lengths.tobytes()
+
+
+def _encode_strings(values: List[str]) -> bytes:
+    """Per-value lengths (in code points) followed by the UTF-8 of all values."""
+    return _pack_lengths(values) + "".join(values).encode('utf-8', 'surrogatepass')
+
+
+def _decode_strings(data: bytes, count: int) -> List[str]:
+    lengths = array('I')
+    lengths.frombytes(data[:4 * count])
+    if sys.byteorder == 'big':
+        lengths.byteswap()
+    # Decode once and slice by code-point offsets.
+    text = data[4 * count:].decode('utf-8', 'surrogatepass')
+    ends = list(accumulate(lengths))
+    return [text[start:end] for start, end in zip([0, *ends], ends)]
+
+
+def _encode_column(values: List[Any]) -> Tuple[int, bytes]:
+    """Pick the smallest encoding that can hold a column's values."""
+    if not all(type(value) is str for value in values):
+        return _PICKLED, pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    dictionary = list(dict.fromkeys(values))
+    if len(dictionary) > min(65_536, max(1, len(values) // 4)):
+        return _STRINGS, _encode_strings(values)
+    typecode = 'B' if len(dictionary) <= 256 else 'H'
+    code_of = {value: code for code, value in enumerate(dictionary)}
+    codes = array(typecode, map(code_of.__getitem__, values))
+    if sys.byteorder == 'big':
+        codes.byteswap()
+    encoded_dictionary = _encode_strings(dictionary)
+    return _DICTIONARY, (_DICTIONARY_HEADER.pack(typecode.encode(), len(dictionary),
+                                                 len(encoded_dictionary))
+                         + encoded_dictionary + codes.tobytes())
+
+
+def _decode_column(kind: int, data: bytes, count: int) -> List[Any]:
+    if kind == _STRINGS:
+        return _decode_strings(data, count)
+    if kind == _PICKLED:
+        return pickle.loads(data)
+    typecode, size, length = _DICTIONARY_HEADER.unpack_from(data)
+    start = _DICTIONARY_HEADER.size
+    dictionary = _decode_strings(data[start:start + length], size)
+    codes = array(typecode.decode())
+    codes.frombytes(data[start + length:])
+    if sys.byteorder == 'big':
+        codes.byteswap()
+    return list(map(dictionary.__getitem__, codes))
+
+
+def write_columnar_records(path: str, records: Dict[str, Dict[str, Any]],
+                           compression: Union[None, str, Dict[str, Optional[str]]] = None) -> int:
+    """Write records column by column (atomically) and return the file size.
+
+    Low-cardinality string fields such as grade and major are dictionary
+    encoded. ``compression`` is None, 'zlib' or 'lzma' for every column, or
+    a dict choosing the codec per column name.
+    """
+    fields = list(dict.fromkeys(field for info in records.values() for field in info))
+    columns = {'student_id': list(records)}
+    for field in fields:
+        columns[field] = [info.get(field, ...) for info in records.values()]
+
+    directory = []
+    blobs = []
+    for name, values in columns.items():
+        codec_name = compression.get(name) if isinstance(compression, dict) else compression
+        if codec_name not in COLUMN_CODECS:
+            raise ValueError(f"Unknown compression '{codec_name}' "
+                             f"(expected one of {', '.join(map(str, COLUMN_CODECS))})")
+        codec = COLUMN_CODECS[codec_name]
+        kind, data = _encode_column(values)
+        blobs.append(_COMPRESS[codec](data))
+        directory.append((name.encode(), kind, codec))
+
+    offset = _COLUMNAR_HEADER.size + sum(_COLUMN_ENTRY.size + len(name) for name, _, _ in directory)
+    parts = [_COLUMNAR_HEADER.pack(_COLUMNAR_MAGIC, len(records), len(columns))]
+    for (name, kind, codec), blob in zip(directory, blobs):
+        parts.append(_COLUMN_ENTRY.pack(len(name), kind, codec, offset, len(blob)) + name)
+        offset += len(blob)
+    parts.extend(blobs)
+    data = b"".join(parts)
+    _atomic_write(path, data)
+    return len(data)
+
+
+def read_columns(path: str, columns: Optional[Iterable[str]] = None) -> Dict[str, List[Any]]:
+    """Read a columnar file as ``{column: values}`` without building records.
+
+    'student_id' is always included; ``columns`` selects the other fields
+    (default: all). Missing fields in pickled columns come back as Ellipsis.
+    """
+    with open(path, 'rb') as file:
+        magic, count, column_count = _COLUMNAR_HEADER.unpack(file.read(_COLUMNAR_HEADER.size))
+        if magic != _COLUMNAR_MAGIC:
+            raise ValueError(f"'{path}' is not a columnar student file")
+        directory = {}
+        for _ in range(column_count):
+            name_length, kind, codec, offset, length = _COLUMN_ENTRY.unpack(
+                file.read(_COLUMN_ENTRY.size))
+            directory[file.read(name_length).decode()] = (kind, codec, offset, length)
+
+        fields = [name for name in directory if name != 'student_id']
+        if columns is not None:
+            columns = list(columns)
+            unknown = [name for name in columns if name not in directory]
+            if unknown:
+                raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+            fields = [name for name in fields if name in columns]
+
+        decoded = {}
+        for name in ['student_id', *fields]:
+            kind, codec, offset, length = directory[name]
+            file.seek(offset)
+            decoded[name] = _decode_column(kind, _DECOMPRESS[codec](file.read(length)), count)
+    return decoded
+
+
+def read_columnar_records(path: str,
+                          columns: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Read a columnar file as records, decoding only ``columns`` (default: all fields)."""
+    decoded = read_columns(path, columns)
+    student_ids = decoded.pop('student_id')
+    fields = list(decoded)
+    if not fields:
+        return {student_id: {} for student_id in student_ids}
+    records = dict(zip(student_ids, map(dict, map(zip, repeat(fields), zip(*decoded.values())))))
+    for field, values in decoded.items():
+        if ... in values:
+            for info in records.values():
+                if info[field] is ...:
+                    del info[field]
+    return records
+
+
+EXPORT_FORMATS = ('text', 'csv', 'jsonl')
+EXPORT_EXTENSIONS = {'text': '.txt', 'csv': '.csv', 'jsonl': '.jsonl'}
+TEXT_EXPORT_HEADER = "=" * 60 + "\nSTUDENT RECORDS\n" + "=" * 60 + "\n\n"
+CSV_FIELDS = ('student_id', 'name', 'grade', 'major')
+
+RecordSource = Union[Dict[str, Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]]
+
+
+def _format_text(batch: List[tuple]) -> str:
+    return "".join(
+        f"Student ID: {student_id}\n"
+        f"  Name : {info['name']}\n"
+        f"  Grade: {info['grade']}\n"
+        f"  Major: {info['major']}\n"
+        + "-" * 60 + "\n"
+        for student_id, info in batch
+    )
+
+
+def _format_csv(batch: List[tuple]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(
+        (student_id, info['name'], info['grade'], info['major'])
+        for student_id, info in batch
+    )
+    return buffer.getvalue()
+
+
+def _format_jsonl(batch: List[tuple]) -> str:
+    return "".join(
+        json.dumps({'student_id': student_id, **info}, ensure_ascii=False) + "\n"
+        for student_id, info in batch
+    )
+
+
+_EXPORT_FORMATTERS = {'text': _format_text, 'csv': _format_csv, 'jsonl': _format_jsonl}
+_EXPORT_HEADERS = {'text': TEXT_EXPORT_HEADER, 'csv': ",".join(CSV_FIELDS) + "\n", 'jsonl': ""}
+
+
+# ==================================================
+# TASK 4.1: STUDENT RECORDS FILE SYSTEM
+# ==================================================
+
+class StudentFileSystem:
+    """Manage saving, loading, and exporting student records."""
+
+    def __init__(self, filename_pickle: str = "students.pkl", filename_text: str = "students.txt",
+                 journal: bool = False, sync: bool = True,
+                 compact_threshold: int = 64 * 1024 * 1024,
+                 filename_indexed: str = "students.srec",
+                 snapshot_format: str = 'pickle',
+                 compression: Union[None, str, Dict[str, Optional[str]]] = None,
+                 filename_columnar: str = "students.scol"):
+        if snapshot_format not in SNAPSHOT_FORMATS:
+            raise ValueError(f"Unknown snapshot format '{snapshot_format}' "
+                             f"(expected one of {', '.join(SNAPSHOT_FORMATS)})")
+        if journal and snapshot_format != 'pickle':
+            raise ValueError("Journaled mode requires the pickle snapshot format")
+        self.filename_pickle = filename_pickle
+        self.filename_text = filename_text
+        self.filename_indexed = filename_indexed
+        # Columnar mode: save_records / load_records use a column-per-field
+        # file instead of a pickle.
+        self.snapshot_format = snapshot_format
+        self.compression = compression
+        self.filename_columnar = filename_columnar
+        self._indexed: Optional[IndexedRecords] = None
+        # Journaled mode: changes are appended to a log next to the snapshot
+        # and folded back into it by compact().
+        self.journal = journal
+        self.sync = sync
+        self.compact_threshold = compact_threshold
+        self.filename_journal = filename_pickle + ".journal"
+        self._journal_file = None
+        self._journal_lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._compaction: Optional[threading.Thread] = None
+        self._compacting = False
+        # Background saves remember a journal position (frame bytes journaled
+        # since opening, including frames compaction has folded away since)
+        # and the number of save_records calls, which supersede them.
+        self._journal_trimmed = 0
+        self._snapshot_saves = 0
+        self._journal_saves = 0
+        # Background saves: one worker thread, at most one pending snapshot.
+        self._save_condition = threading.Condition()
+        self._saver: Optional[threading.Thread] = None
+        self._pending_snapshot: Optional[Dict[str, Dict[str, Any]]] = None
+        self._pending_mark: Optional[Tuple[int, int]] = None
+        self._pending_calls = 0
+        self._pending_future: Optional[Future] = None
+        self._last_future: Optional[Future] = None
+
+    @METRICS.timed("save_seconds", kind="snapshot")
+    def save_records(self, records: Dict[str, Dict[str, Any]]) -> bool:
+        """Save student records as a pickle snapshot (a columnar file in columnar mode)."""
+        if self.journal:
+            return self._save_snapshot(records)
+        if self.snapshot_format == 'columnar':
+            return self._save_columnar(records)
+        try:
+            with open(self.filename_pickle, 'wb') as file:
+                pickle.dump(records, file)
+            print(f"✅ Records saved to '{self.filename_pickle}'")
+            return True
+        except Exception as e:
+            print(f"❌ Error saving records: {e}")
+            return False
+
+    @METRICS.timed("load_seconds", kind="snapshot")
+    def load_records(self, columns: Optional[Iterable[str]] = None) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load student records from the pickle snapshot (the columnar file in columnar mode).
+
+        ``columns`` limits each record to those fields; in columnar mode the
+        other columns are not read at all.
+        """
+        if self.snapshot_format == 'columnar':
+            return self._load_columnar(columns)
+        if self.journal:
+            records = self._load_journaled()
+        else:
+            try:
+                with open(self.filename_pickle, 'rb') as file:
+                    records = pickle.load(file)
+                print(f"✅ Records loaded from '{self.filename_pickle}'")
+            except FileNotFoundError:
+                print(f"❌ Error: File '{self.filename_pickle}' not found!")
+                return None
+            except Exception as e:
+                print(f"❌ Error loading records: {e}")
+                return None
+        if records is not None and columns is not None:
+            columns = list(columns)
+            records = {student_id: {field: info[field] for field in columns if field in info}
+                       for student_id, info in records.items()}
+        return records
+
+    def _save_columnar(self, records: Dict[str, Dict[str, Any]]) -> bool:
+        try:
+            write_columnar_records(self.filename_columnar, records, self.compression)
+            print(f"✅ Records saved to '{self.filename_columnar}'")
+            return True
+        except Exception as e:
+            print(f"❌ Error saving records: {e}")
+            return False
+
+    def _load_columnar(self, columns: Optional[Iterable[str]]) -> Optional[Dict[str, Dict[str, Any]]]:
+        try:
+            records = read_columnar_records(self.filename_columnar, columns)
+            print(f"✅ Records loaded from '{self.filename_columnar}'")
+            return records
+        except FileNotFoundError:
+            print(f"❌ Error: File '{self.filename_columnar}' not found!")
+            return None
+        except Exception as e:
+            print(f"❌ Error loading records: {e}")
+            return None
+
+    # ---------- background saves ----------
+
+    def save_records_async(self, records: Dict[str, Dict[str, Any]]) -> Future:
+        """Snapshot records and save them on a worker thread.
+
+        The caller only pays for a shallow copy of the outer dict, which
+        fixes the set of students; row contents are read when the worker
+        pickles the snapshot in one step (in columnar mode, when it copies
+        each row before encoding). Calls made before the worker picks
+        it up coalesce into one save of the newest snapshot and share its
+        future, which resolves to True or False like save_records.
+
+        In journaled mode, changes journaled after this call are carried
+        into the journal that starts with the new snapshot. A later
+        save_records supersedes the background save.
+        """
+        mark = None
+        if self.journal:
+            # Take the position before the copy: a change journaled before
+            # it was applied to ``records`` before it was journaled.
+            with self._journal_lock:
+                mark = self._snapshot_saves, self._journal_position()
+                self._journal_saves += 1
+        snapshot = dict(records)
+        with self._save_condition:
+            if self._pending_future is None:
+                self._pending_future = Future()
+                self._pending_calls = 0
+            self._pending_snapshot = snapshot
+            self._pending_mark = mark
+            self._pending_calls += 1
+            future = self._last_future = self._pending_future
+            if self._saver is None:
+                self._saver = threading.Thread(target=self._save_worker, daemon=True)
+                self._saver.start()
+            self._save_condition.notify()
+        return future
+
+    async def asave_records(self, records: Dict[str, Dict[str, Any]]) -> bool:
+        """Awaitable form of save_records_async for asyncio callers."""
+        import asyncio  # already loaded in any asyncio program; slow to import otherwise
+
+        return await asyncio.wrap_future(self.save_records_async(records))
+
+    def _save_worker(self) -> None:
+        while True:
+            with self._save_condition:
+                while self._pending_future is None:
+                    self._save_condition.wait()
+                snapshot, future = self._pending_snapshot, self._pending_future
+                mark, calls = self._pending_mark, self._pending_calls
+                self._pending_snapshot = self._pending_future = self._pending_mark = None
+            try:
+                if self.snapshot_format == 'columnar':
+                    # Columns are encoded one field at a time; copy each row
+                    # first so its fields are read together.
+                    rows = {student_id: dict(info) for student_id, info in snapshot.items()}
+                    write_columnar_records(self.filename_columnar, rows, self.compression)
+                elif self.journal:
+                    self._install_background_snapshot(pickle.dumps(snapshot), *mark)
+                else:
+                    _atomic_write(self.filename_pickle, pickle.dumps(snapshot))
+                future.set_result(True)
+            except Exception as e:
+                print(f"❌ Error saving records: {e}")
+                future.set_result(False)
+            finally:
+                if self.journal:
+                    with self._journal_lock:
+                        self._journal_saves -= calls
+
+    def flush_saves(self) -> bool:
+        """Wait for the most recent background save and return its result."""
+        future = self._last_future
+        return future.result() if future is not None else True
+
+    # ---------- indexed random-access format ----------
+
+    def save_indexed(self, records: Dict[str, Dict[str, Any]]) -> bool:
+        """Save records in the indexed format for random access."""
+        try:
+            if self._indexed is not None:
+                self._indexed.close()
+                self._indexed = None
+            write_indexed_records(self.filename_indexed, records)
+            print(f"✅ Records saved to '{self.filename_indexed}'")
+            return True
+        except Exception as e:
+            print(f"❌ Error saving records: {e}")
+            return False
+
+    def open_indexed(self) -> Optional[IndexedRecords]:
+        """Return a lazy dict-like view of the indexed file (opened once)."""
+        if self._indexed is None:
+            try:
+                self._indexed = IndexedRecords(self.filename_indexed)
+            except FileNotFoundError:
+                print(f"❌ Error: File '{self.filename_indexed}' not found!")
+                return None
+            except Exception as e:
+                print(f"❌ Error loading records: {e}")
+                return None
+        return self._indexed
+
+    @METRICS.timed("load_seconds", kind="indexed_get")
+    def get(self, student_id: str) -> Optional[Dict[str, Any]]:
+        """Read a single record from the indexed file without loading the rest."""
+        records = self.open_indexed()
+        if records is None:
+            return None
+        return records.get(student_id)
+
+    # ---------- journaled mode ----------
+
+    def _next_journal(self) -> str:
+        return self.filename_journal + ".next"
+
+    def _journal_position(self) -> int:
+        """Frame bytes journaled so far; the caller holds ``_journal_lock``."""
+        if self._journal_file is None:
+            self._open_journal()
+        return self._journal_trimmed + self._journal_file.tell() - _JOURNAL_HEADER.size
+
+    def _install_snapshot(self, snapshot: bytes, tail: bytes = b"") -> None:
+        """Atomically replace the snapshot and start a journal holding ``tail``.
+
+        The new journal is staged as ``.next`` first, so a crash between the
+        two renames leaves a journal that matches whichever snapshot is on disk.
+        """
+        try:
+            frames = os.path.getsize(self.filename_journal) - _JOURNAL_HEADER.size
+        except FileNotFoundError:
+            frames = 0
+        temp_path = f"{self.filename_pickle}.tmp"
+        _write_synced(temp_path, snapshot)
+        _write_synced(self._next_journal(), _journal_header(_snapshot_token(snapshot)) + tail)
+        os.replace(temp_path, self.filename_pickle)
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        os.replace(self._next_journal(), self.filename_journal)
+        _fsync_directory(self.filename_pickle)
+        self._journal_trimmed += max(frames, 0) - len(tail)
+
+    def _install_background_snapshot(self, snapshot: bytes, saves: int, position: int) -> None:
+        """Install a snapshot taken at journal ``position`` by save_records_async."""
+        with self._snapshot_lock, self._journal_lock:
+            if saves != self._snapshot_saves:
+                return  # a later save_records replaced it
+            # Compaction does not start while this save is pending, and one
+            # already running keeps every frame after ``position``.
+            with open(self.filename_journal, 'rb') as file:
+                file.seek(_JOURNAL_HEADER.size + position - self._journal_trimmed)
+                tail = file.read()
+            self._install_snapshot(snapshot, tail)
+
+    def _open_journal(self) -> None:
+        """Open the journal for appending, recovering from an interrupted swap."""
+        token = _snapshot_token(_read_snapshot(self.filename_pickle))
+        if _read_journal(self._next_journal(), token) is not None:
+            os.replace(self._next_journal(), self.filename_journal)
+        elif os.path.exists(self._next_journal()):
+            os.remove(self._next_journal())
+
+        journal = _read_journal(self.filename_journal, token)
+        if journal is None:
+            _atomic_write(self.filename_journal, _journal_header(token))
+        else:
+            with open(self.filename_journal, 'r+b') as file:
+                file.truncate(journal[1])
+        self._journal_file = open(self.filename_journal, 'ab')
+
+    @METRICS.timed("save_seconds", kind="journal")
+    def _append(self, *operations: tuple) -> bool:
+        """Append operations to the journal with a single write and fsync."""
+        frames = []
+        for operation in operations:
+            payload = pickle.dumps(operation, protocol=pickle.HIGHEST_PROTOCOL)
+            frames.append(_FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        try:
+            with self._journal_lock:
+                if self._journal_file is None:
+                    self._open_journal()
+                self._journal_file.write(b"".join(frames))
+                self._journal_file.flush()
+                if self.sync:
+                    os.fsync(self._journal_file.fileno())
+                size = self._journal_file.tell()
+        except Exception as e:
+            print(f"❌ Error writing journal: {e}")
+            return False
+        if size > self.compact_threshold:
+            self.compact(background=True)
+        return True
+
+    def save_change(self, student_id: str, info: Dict[str, Any]) -> bool:
+        """Journal one added or updated record instead of rewriting the file."""
+        return self._append(('put', student_id, info))
+
+    def delete_change(self, student_id: str) -> bool:
+        """Journal the removal of one record."""
+        return self._append(('delete', student_id, None))
+
+    def apply_changes(self, changes: Iterable[tuple]) -> bool:
+        """Persist a batch from a change feed instead of the whole table.
+
+        ``changes`` are ``(sequence, operation, student_id, info)`` tuples,
+        e.g. from ``StudentDatabase.changes_since``; ``operation`` is 'add',
+        'update' or 'delete'. Changes are coalesced to the latest row per
+        student. Journaled mode appends them with one fsync; otherwise the
+        snapshot is loaded, patched and saved; a missing snapshot starts
+        empty, but one that cannot be read is left alone and False returned.
+        """
+        latest = {}
+        for _, operation, student_id, info in changes:
+            latest[student_id] = None if operation == 'delete' else info
+        if not latest:
+            return True
+        operations = [('delete', student_id, None) if info is None else ('put', student_id, info)
+                      for student_id, info in latest.items()]
+        if self.journal:
+            return self._append(*operations)
+        snapshot_path = (self.filename_columnar if self.snapshot_format == 'columnar'
+                         else self.filename_pickle)
+        if os.path.exists(snapshot_path):
+            records = self.load_records()
+            if records is None:
+                print(f"❌ Changes not applied: '{snapshot_path}' could not be read")
+                return False
+        else:
+            records = {}
+        _apply_operations(records, operations)
+        return self.save_records(records)
+
+    def _save_snapshot(self, records: Dict[str, Dict[str, Any]]) -> bool:
+        try:
+            snapshot = pickle.dumps(records)
+            with self._snapshot_lock, self._journal_lock:
+                self._install_snapshot(snapshot)
+                self._snapshot_saves += 1
+            print(f"✅ Records saved to '{self.filename_pickle}'")
+            return True
+        except Exception as e:
+            print(f"❌ Error saving records: {e}")
+            return False
+
+    def _load_journaled(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        try:
+            data = _read_snapshot(self.filename_pickle)
+            records = pickle.loads(data) if data else {}
+            token = _snapshot_token(data)
+            for path in (self._next_journal(), self.filename_journal):
+                journal = _read_journal(path, token)
+                if journal is not None:
+                    _apply_operations(records, journal[0])
+                    break
+            print(f"✅ Records loaded from '{self.filename_pickle}'")
+            return records
+        except Exception as e:
+            print(f"❌ Error loading records: {e}")
+            return None
+
+    def compact(self, background: bool = True) -> bool:
+        """Fold the journal into a new snapshot, on a worker thread by default."""
+        with self._journal_lock:
+            if self._compacting:
+                return False
+            self._compacting = True
+        if not background:
+            return self._compact()
+        self._compaction = threading.Thread(target=self._compact, daemon=True)
+        self._compaction.start()
+        return True
+
+    def _compact(self) -> bool:
+        try:
+            with self._snapshot_lock:
+                with self._journal_lock:
+                    if self._journal_saves:
+                        # A pending background save replaces the journal
+                        # anyway, and folding frames it has yet to carry
+                        # over would lose them.
+                        return False
+                    if self._journal_file is None:
+                        self._open_journal()
+                    end = self._journal_file.tell()
+
+                data = _read_snapshot(self.filename_pickle)
+                records = pickle.loads(data) if data else {}
+                journal = _read_journal(self.filename_journal, _snapshot_token(data), limit=end)
+                if journal is not None:
+                    _apply_operations(records, journal[0])
+                snapshot = pickle.dumps(records)
+
+                with self._journal_lock:
+                    # Keep frames appended while the snapshot was being built.
+                    with open(self.filename_journal, 'rb') as file:
+                        file.seek(end)
+                        tail = file.read()
+                    self._install_snapshot(snapshot, tail)
+                    self._journal_file = open(self.filename_journal, 'ab')
+            return True
+        except Exception as e:
+            print(f"❌ Error compacting journal: {e}")
+            return False
+        finally:
+            self._compacting = False
+
+    def wait_for_compaction(self) -> None:
+        """Block until a background compaction has finished."""
+        if self._compaction is not None:
+            self._compaction.join()
+
+    def close(self) -> None:
+        """Finish background work and close open files."""
+        self.flush_saves()
+        self.wait_for_compaction()
+        if self._indexed is not None:
+            self._indexed.close()
+            self._indexed = None
+        with self._journal_lock:
+            if self._journal_file is not None:
+                self._journal_file.close()
+                self._journal_file = None
+
+    @METRICS.timed("export_seconds", format="text")
+    def export_to_text(self, records: Dict[str, Dict[str, Any]]) -> bool:
+        """Export student records to a readable text file."""
+        try:
+            with open(self.filename_text, 'w') as file:
+                file.write("="*60 + "\n")
+                file.write("STUDENT RECORDS\n")
+                file.write("="*60 + "\n\n")
+                
+                for student_id, info in records.items():
+                    file.write(f"Student ID: {student_id}\n")
+                    file.write(f"  Name : {info['name']}\n")
+                    file.write(f"  Grade: {info['grade']}\n")
+                    file.write(f"  Major: {info['major']}\n")
+                    file.write("-"*60 + "\n")
+            print(f"✅ Records exported to '{self.filename_text}'")
+            return True
+        except Exception as e:
+            print(f"❌ Error exporting records: {e}")
+            return False
+
+    @METRICS.timed("export_seconds", format="stream")
+    def export_stream(self, records: RecordSource, fmt: str = 'text',
+                      compress: bool = False, filename: Optional[str] = None,
+                      batch_size: int = 10_000) -> Optional[Dict[str, float]]:
+        """Stream records to text, CSV or JSON Lines in large buffered batches.
+
+        ``records`` may be a dict or any iterable of ``(student_id, info)``
+        pairs, so the full set never has to be in memory. Returns throughput
+        statistics, or None on error.
+        """
+        if fmt not in EXPORT_FORMATS:
+            print(f"❌ Unknown export format '{fmt}' (expected one of {', '.join(EXPORT_FORMATS)})")
+            return None
+        if filename is None:
+            filename = self.filename_text if fmt == 'text' else \
+                os.path.splitext(self.filename_text)[0] + EXPORT_EXTENSIONS[fmt]
+            if compress:
+                filename += ".gz"
+
+        formatter = _EXPORT_FORMATTERS[fmt]
+        pairs = iter(records.items() if hasattr(records, 'items') else records)
+        count = 0
+        written = 0
+        start = time.perf_counter()
+        try:
+            opener = gzip.open if compress else open
+            with opener(filename, 'wb') as file:
+                data = _EXPORT_HEADERS[fmt].encode()
+                file.write(data)
+                written += len(data)
+                while batch := list(islice(pairs, batch_size)):
+                    data = formatter(batch).encode()
+                    file.write(data)
+                    written += len(data)
+                    count += len(batch)
+        except Exception as e:
+            print(f"❌ Error exporting records: {e}")
+            return None
+
+        seconds = time.perf_counter() - start
+        stats = {
+            'records': count,
+            'bytes': written,
+            'file_bytes': os.path.getsize(filename),
+            'seconds': seconds,
+            'records_per_s': count / seconds if seconds else 0.0,
+            'mb_per_s': written / 1_000_000 / seconds if seconds else 0.0,
+        }
+        print(f"✅ Records exported to '{filename}' "
+              f"({stats['records_per_s']:,.0f} records/s, {stats['mb_per_s']:.1f} MB/s)")
+        return stats
+
+
+def benchmark_save_latency(count: int = 100_000, updates: int = 100) -> dict:
+    """Compare one-grade-update latency: full pickle rewrite vs journal append."""
+    records = {
+        f"S{i:07d}": {"name": f"Student {i}", "grade": "B", "major": "Engineering"}
+        for i in range(count)
+    }
+    with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(io.StringIO()):
+        full = StudentFileSystem(os.path.join(directory, "full.pkl"))
+        journaled = StudentFileSystem(os.path.join(directory, "journal.pkl"), journal=True)
+        journaled.save_records(records)
+
+        start = time.perf_counter()
+        for i in range(updates):
+            records[f"S{i:07d}"]["grade"] = "A"
+            full.save_records(records)
+        full_seconds = (time.perf_counter() - start) / updates
+
+        start = time.perf_counter()
+        for i in range(updates):
+            journaled.save_change(f"S{i:07d}", records[f"S{i:07d}"])
+        journal_seconds = (time.perf_counter() - start) / updates
+        journaled.close()
+
+    print(f"Full pickle save : {full_seconds * 1000:.3f} ms per update")
+    print(f"Journal append   : {journal_seconds * 1000:.3f} ms per update")
+    return {'count': count, 'full_save': full_seconds, 'journal_append': journal_seconds}
+
+
+def benchmark_columnar(count: int = 200_000) -> dict:
+    """Compare file size and load time of pickle and columnar snapshots."""
+    majors = ("Computer Science", "Engineering", "Mathematics", "Physics", "Biology")
+    grades = ("A", "A-", "B+", "B", "B-", "C+", "C", "D", "F")
+    records = {
+        f"S{i:07d}": {"name": f"Student Number {i}", "grade": grades[i * 7 % len(grades)],
+                      "major": majors[i * 3 % len(majors)]}
+        for i in range(count)
+    }
+    results = {}
+    with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(io.StringIO()):
+        variants = {
+            'pickle': StudentFileSystem(os.path.join(directory, "students.pkl")),
+            **{f"columnar/{codec or 'raw'}": StudentFileSystem(
+                filename_columnar=os.path.join(directory, f"students-{codec}.scol"),
+                snapshot_format='columnar', compression=codec)
+               for codec in COLUMN_CODECS},
+        }
+        for name, file_system in variants.items():
+            start = time.perf_counter()
+            file_system.save_records(records)
+            save_seconds = time.perf_counter() - start
+            path = file_system.filename_pickle if name == 'pickle' else file_system.filename_columnar
+
+            start = time.perf_counter()
+            loaded = file_system.load_records()
+            load_seconds = time.perf_counter() - start
+            assert loaded == records
+
+            start = time.perf_counter()
+            file_system.load_records(columns=['grade'])
+            column_seconds = time.perf_counter() - start
+            results[name] = {'bytes': os.path.getsize(path), 'save': save_seconds,
+                             'load': load_seconds, 'load_grade_only': column_seconds}
+            if name != 'pickle':
+                start = time.perf_counter()
+                read_columns(path, ['grade'])
+                results[name]['read_grade_column'] = time.perf_counter() - start
+
+    for name, result in results.items():
+        print(f"{name:16}: {result['bytes'] / 1_000_000:6.2f} MB, save {result['save'] * 1000:7.1f} ms, "
+              f"load {result['load'] * 1000:7.1f} ms, grade only {result['load_grade_only'] * 1000:7.1f} ms"
+              + (f", grade column {result['read_grade_column'] * 1000:5.1f} ms"
+                 if 'read_grade_column' in result else ""))
+    return results
+
+
+# ==================================================
+# TASK 4.2: FILE OPERATIONS PRACTICE
+# ==================================================
+
+def demonstrate_file_operations() -> None:
+    """Demonstrate writing, reading, and appending to files."""
+    print("\n" + "="*60)
+    print("TASK 4.2: FILE OPERATIONS PRACTICE")
+    print("="*60)
+
+    filename = "sample.txt"
+
+    # Writing to a file
+    print("\n1. Writing to a new file (w mode)...")
+    try:
+        with open(filename, 'w') as file:
+            file.writelines(["This is line 1\n", "This is line 2\n", "This is line 3\n"])
+        print("✅ File written successfully")
+    except Exception as e:
+        print(f"❌ Error writing file: {e}")
+
+    # Reading from a file
+    print("\n2. Reading from the file (r mode)...")
+    try:
+        with open(filename, 'r') as file:
+            content = file.read()
+        print("File contents:\n" + content)
+    except FileNotFoundError:
+        print("❌ Error: File not found!")
+    except Exception as e:
+        print(f"❌ Error reading file: {e}")
+
+    # Appending to a file
+    print("\n3. Appending to the file (a mode)...")
+    try:
+        with open(filename, 'a') as file:
+            file.writelines(["This is line 4 (appended)\n", "This is line 5 (appended)\n"])
+        print("✅ Content appended successfully")
+    except Exception as e:
+        print(f"❌ Error appending to file: {e}")
+
+    # Reading again
+    print("\n4. Reading file again to show appended content...")
+    try:
+        with open(filename, 'r') as file:
+            content = file.read()
+        print("Updated file contents:\n" + content)
+    except Exception as e:
+        print(f"❌ Error reading file: {e}")
+
+    # Demonstrating file not found
+    print("\n5. Demonstrating file not found error handling...")
+    try:
+        with open("nonexistent.txt", 'r') as file:
+            _ = file.read()
+    except FileNotFoundError:
+        print("✅ Handled FileNotFoundError: The file does not exist")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+
+
+# ==================================================
+# MAIN PROGRAM
+# ==================================================
+
+if __name__ == "__main__":
+    print("="*60)
+    print("TASK 4.1: STUDENT RECORDS FILE SYSTEM")
+    print("="*60)
+
+    student_records = {
+        "S001": {"name": "Alice Johnson", "grade": "A", "major": "Computer Science"},
+        "S002": {"name": "Bob Smith", "grade": "B+", "major": "Engineering"},
+        "S003": {"name": "Charlie Brown", "grade": "A-", "major": "Mathematics"}
+    }
+
+    print("\nOriginal student records:")
+    for sid, info in student_records.items():
+        print(f"{sid}: {info['name']} - {info['grade']} - {info['major']}")
+
+    print("\n" + "-"*60)
+    fs = StudentFileSystem()
+    fs.save_records(student_records)
+
+    print("\n" + "-"*60)
+    loaded_records = fs.load_records()
+
+    if loaded_records:
+        print("\nLoaded student records:")
+        for sid, info in loaded_records.items():
+            print(f"{sid}: {info['name']} - {info['grade']} - {info['major']}")
+
+    print("\n" + "-"*60)
+    fs.export_to_text(student_records)
+    print("\nCheck 'students.txt' to see the readable export.")
+
+    demonstrate_file_operations()
+
+    print("\n" + "="*60)
+    print("ALL TASKS COMPLETED!")
+    print("="*60)
+    print("\nFiles created:")
+    print("  - students.pkl (pickle file)")
+    print("  - students.txt (readable export)")
+    print("  - sample.txt (file operations demo)")
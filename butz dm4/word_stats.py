@@ -0,0 +1,296 @@
+# ==================================================
+# WORD STATISTICS ENGINE
+# Shared by count_word_frequency (student_database)
+# and count_unique_words (coordinates).
+# ==================================================
+
+import hashlib
+import heapq
+import math
+import random
+import string
+import sys
+import time
+from collections import Counter
+from typing import Iterable, Iterator, List, Tuple, Union
+
+try:
+    from .parallel import ordered_pool_map
+except ImportError:  # run as a script
+    from parallel import ordered_pool_map
+
+TRANSLATOR = str.maketrans("", "", string.punctuation)
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase, strip punctuation and split text into words."""
+    return text.lower().translate(TRANSLATOR).split()
+
+
+def count_chunk(text: str) -> Counter:
+    """Count the words of one chunk of text."""
+    return Counter(normalize_words(text))
+
+
+def stats_from_counter(word_freq: Counter) -> dict:
+    """Build the stats dict returned by the counting functions."""
+    return {
+        'total_words': sum(word_freq.values()),
+        'unique_words': len(word_freq),
+        'frequencies': word_freq,
+    }
+
+
+def word_stats(text: str) -> dict:
+    """Word statistics for an in-memory string."""
+    return stats_from_counter(count_chunk(text))
+
+
+def iter_text_chunks(path: str, chunk_size: int = 8 * 1024 * 1024,
+                     encoding: str = "utf-8") -> Iterator[str]:
+    """Read a text file in chunks that never split a word.
+
+    Each chunk ends on whitespace; a trailing partial word is carried over
+    to the next chunk.
+    """
+    carry = ""
+    with open(path, encoding=encoding, errors="replace") as file:
+        while block := file.read(chunk_size):
+            block = carry + block
+            if block[-1].isspace():
+                carry = ""
+                yield block
+                continue
+            parts = block.rsplit(None, 1)
+            if len(parts) == 2:
+                carry = parts[1]
+                yield parts[0]
+            else:
+                carry = block
+    if carry:
+        yield carry
+
+
+def count_words_in_files(paths: Union[str, Iterable[str]], chunk_size: int = 8 * 1024 * 1024,
+                         workers: int | None = None) -> dict:
+    """Word statistics for one or more files, counted chunk by chunk.
+
+    Chunks are counted on a process pool (``workers=1`` counts in-process)
+    and the per-chunk Counters are merged.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    chunks = (chunk for path in paths for chunk in iter_text_chunks(path, chunk_size))
+    counts = map(count_chunk, chunks) if workers == 1 else ordered_pool_map(count_chunk, chunks, workers)
+
+    word_freq = Counter()
+    for counter in counts:
+        word_freq.update(counter)
+    return stats_from_counter(word_freq)
+
+
+# ==================================================
+# APPROXIMATE, BOUNDED-MEMORY WORD STATISTICS
+# ==================================================
+
+def _hash64(word: str) -> int:
+    """Stable 64-bit hash (unlike hash(), identical across processes)."""
+    return int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest(), "little")
+
+
+class HyperLogLog:
+    """Distinct-count estimator with relative standard error ~``error``."""
+
+    def __init__(self, error: float = 0.01):
+        self.precision = min(18, max(4, math.ceil(math.log2((1.04 / error) ** 2))))
+        self.registers = bytearray(1 << self.precision)
+
+    def add(self, word: str) -> None:
+        value = _hash64(word)
+        index = value >> (64 - self.precision)
+        rest = value & ((1 << (64 - self.precision)) - 1)
+        rank = 64 - self.precision - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> int:
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLogs with different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self.registers)
+
+
+class SpaceSaving:
+    """Top-k frequency summary; each count overestimates by at most N / capacity."""
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, word: str, count: int = 1) -> None:
+        counts = self.counts
+        if word in counts:
+            counts[word] += count
+        elif len(counts) < self.capacity:
+            counts[word] = count
+            self.errors[word] = 0
+        else:
+            # Evict the current minimum; the newcomer inherits its count as error.
+            while True:
+                minimum, victim = heapq.heappop(self._heap)
+                if counts.get(victim) == minimum:
+                    break
+            del counts[victim]
+            del self.errors[victim]
+            counts[word] = minimum + count
+            self.errors[word] = minimum
+        heapq.heappush(self._heap, (counts[word], word))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(value, key) for key, value in counts.items()]
+            heapq.heapify(self._heap)
+
+    def _floor(self) -> int:
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """Merge another summary (mergeable-summaries rule), keeping capacity entries."""
+        floor, other_floor = self._floor(), other._floor()
+        counts = {}
+        errors = {}
+        for word in self.counts.keys() | other.counts.keys():
+            counts[word] = self.counts.get(word, floor) + other.counts.get(word, other_floor)
+            errors[word] = self.errors.get(word, floor) + other.errors.get(word, other_floor)
+        kept = heapq.nlargest(self.capacity, counts, key=counts.get)
+        self.counts = {word: counts[word] for word in kept}
+        self.errors = {word: errors[word] for word in kept}
+        self._heap = [(value, key) for key, value in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        return heapq.nlargest(k, self.counts.items(), key=lambda item: item[1])
+
+    def memory_bytes(self) -> int:
+        return (sys.getsizeof(self.counts) + sys.getsizeof(self.errors)
+                + sys.getsizeof(self._heap)
+                + sum(sys.getsizeof(word) for word in self.counts))
+
+
+class WordSketch:
+    """Fixed-memory word statistics: Space-Saving top-k plus HyperLogLog distinct count.
+
+    ``error`` bounds both the top-k overestimate (as a fraction of all words)
+    and the relative error of the distinct count. Sketches built on separate
+    shards can be merged.
+    """
+
+    def __init__(self, error: float = 0.01):
+        self.error = error
+        self.total_words = 0
+        self.heavy_hitters = SpaceSaving(math.ceil(1 / error))
+        self.distinct = HyperLogLog(error)
+
+    def add_text(self, text: str) -> "WordSketch":
+        words = normalize_words(text)
+        self.total_words += len(words)
+        for word in words:
+            self.heavy_hitters.add(word)
+            self.distinct.add(word)
+        return self
+
+    def merge(self, other: "WordSketch") -> None:
+        self.total_words += other.total_words
+        self.heavy_hitters.merge(other.heavy_hitters)
+        self.distinct.merge(other.distinct)
+
+    def stats(self, top_k: int = 10) -> dict:
+        return {
+            'total_words': self.total_words,
+            'unique_words': self.distinct.count(),
+            'most_common': self.heavy_hitters.top(top_k),
+            'max_count_error': math.ceil(self.error * self.total_words),
+        }
+
+    def memory_bytes(self) -> int:
+        return self.heavy_hitters.memory_bytes() + self.distinct.memory_bytes()
+
+
+def sketch_chunk(text: str, error: float = 0.01) -> WordSketch:
+    """Build a sketch for one chunk of text."""
+    return WordSketch(error).add_text(text)
+
+
+def approximate_words_in_files(paths: Union[str, Iterable[str]], error: float = 0.01,
+                               top_k: int = 10, chunk_size: int = 8 * 1024 * 1024,
+                               workers: int | None = None) -> dict:
+    """Approximate word statistics for files in fixed memory, merging per-chunk sketches."""
+    if isinstance(paths, str):
+        paths = [paths]
+    chunks = (chunk for path in paths for chunk in iter_text_chunks(path, chunk_size))
+    sketch = WordSketch(error)
+    if workers == 1:
+        for chunk in chunks:
+            sketch.add_text(chunk)
+    else:
+        for partial in ordered_pool_map(_SketchTask(error), chunks, workers):
+            sketch.merge(partial)
+    return sketch.stats(top_k)
+
+
+class _SketchTask:
+    """Picklable callable that sketches a chunk with a fixed error bound."""
+
+    def __init__(self, error: float):
+        self.error = error
+
+    def __call__(self, text: str) -> WordSketch:
+        return sketch_chunk(text, self.error)
+
+
+def benchmark_approximate(words: int = 500_000, vocabulary: int = 200_000,
+                          error: float = 0.01, top_k: int = 10) -> dict:
+    """Compare exact and approximate word stats on a Zipf-like synthetic stream."""
+    rng = random.Random(42)
+    weights = [1 / rank for rank in range(1, vocabulary + 1)]
+    text = " ".join(f"w{index}" for index in rng.choices(range(vocabulary), weights, k=words))
+
+    start = time.perf_counter()
+    exact = word_stats(text)
+    exact_seconds = time.perf_counter() - start
+    exact_memory = sys.getsizeof(exact['frequencies']) + sum(
+        sys.getsizeof(word) for word in exact['frequencies'])
+
+    start = time.perf_counter()
+    sketch = WordSketch(error).add_text(text)
+    approximate = sketch.stats(top_k)
+    approximate_seconds = time.perf_counter() - start
+
+    true_top = {word for word, _ in exact['frequencies'].most_common(top_k)}
+    found_top = {word for word, _ in approximate['most_common']}
+    result = {
+        'words': words,
+        'exact_seconds': exact_seconds,
+        'approximate_seconds': approximate_seconds,
+        'exact_memory': exact_memory,
+        'approximate_memory': sketch.memory_bytes(),
+        'unique_exact': exact['unique_words'],
+        'unique_estimate': approximate['unique_words'],
+        'unique_relative_error': abs(approximate['unique_words'] - exact['unique_words'])
+        / exact['unique_words'],
+        'top_k_recall': len(true_top & found_top) / top_k,
+    }
+    for key, value in result.items():
+        print(f"{key:24}: {value}")
+    return result
@@ -0,0 +1,42 @@
+# ==================================================
+# DM4 PACKAGE
+# The lab scripts as one importable package. Installed, they
+# live in dm4/lab/; in a source checkout, in "butz dm4/".
+# That directory is added to the package path, so every script
+# is dm4.<name> and nothing is added to sys.path. Scripts load
+# on first attribute access; "import dm4" itself imports
+# nothing heavy.
+#
+#   pip install .
+#   import dm4
+#   db = dm4.student_database.StudentDatabase()
+#   dm4 --help            (or python -m dm4 --help)
+# ==================================================
+
+import os
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(_PACKAGE_DIR, "lab")
+if not os.path.isdir(SCRIPTS_DIR):
+    SCRIPTS_DIR = os.path.join(os.path.dirname(_PACKAGE_DIR), "butz dm4")
+__path__.append(SCRIPTS_DIR)
+
+from . import lab_modules  # noqa: E402  (found through __path__)
+
+__all__ = sorted(lab_modules.MODULE_FILES)
+
+
+def load(name: str):
+    """Import one lab script by its package name (cached in sys.modules)."""
+    return lab_modules.load_module(name)
+
+
+def __getattr__(name: str):
+    if name in lab_modules.MODULE_FILES:
+        module = globals()[name] = load(name)
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(lab_modules.MODULE_FILES))
@@ -0,0 +1,5 @@
+import sys
+
+from dm4.cli import main
+
+sys.exit(main())
@@ -0,0 +1,237 @@
+# ==================================================
+# DM4 COMMAND LINE
+#   python -m dm4 ingest --stdin < students.txt
+#   python -m dm4 query students.pkl --major Engineering --grade A A-
+#   python -m dm4 export students.pkl --format csv --output students.csv
+#   python -m dm4 wordcount notes.txt --top 10
+#   python -m dm4 geometry points.txt
+#   python -m dm4 bench-startup
+#
+# Every subcommand imports only the lab modules it uses, inside its
+# handler, so short-lived runs (cron jobs) pay only for what they touch.
+# ==================================================
+
+import argparse
+import contextlib
+import os
+import sys
+from typing import List, Optional
+
+import dm4
+
+# Modules whose import cost matters for short-lived processes.
+HEAVY_MODULES = ('numpy', 'pickle', 'asyncio', 'multiprocessing', 'concurrent.futures.process')
+
+
+def _load_snapshot(path: str) -> dict:
+    """Records from a pickle snapshot (journal replayed if present) or a .scol file."""
+    student_records = dm4.student_records
+    if path.endswith(".scol"):
+        return student_records.read_columnar_records(path)
+    file_system = student_records.StudentFileSystem(
+        path, journal=os.path.exists(path + ".journal"))
+    # Status messages go to stderr so stdout stays machine readable.
+    with contextlib.redirect_stdout(sys.stderr):
+        records = file_system.load_records()
+        file_system.close()
+    if records is None:
+        raise SystemExit(1)
+    return records
+
+
+def cmd_ingest(args, extra: List[str]) -> int:
+    return dm4.ingest_server.main(extra)
+
+
+def cmd_query(args, extra: List[str]) -> int:
+    import json
+
+    database = dm4.student_database.StudentDatabase()
+    database.students = _load_snapshot(args.snapshot)
+    filters = {field: values for field, values in
+               (('major', args.major), ('grade', args.grade)) if values}
+    if args.name:
+        matches = [(student_id, info)
+                   for student_id, info in database.search_names(args.name, limit=len(database.students))
+                   if all(info.get(field) in values for field, values in filters.items())]
+    else:
+        matches = list(database.query(**filters).items())
+    for student_id, info in matches[:args.limit]:
+        print(json.dumps({'student_id': student_id, **info}, ensure_ascii=False))
+    print(f"{len(matches):,} match(es)", file=sys.stderr)
+    return 0
+
+
+def cmd_export(args, extra: List[str]) -> int:
+    records = _load_snapshot(args.snapshot)
+    file_system = dm4.student_records.StudentFileSystem(filename_text=args.output or "students.txt")
+    stats = file_system.export_stream(records, args.format, compress=args.compress,
+                                      filename=args.output)
+    return 0 if stats is not None else 1
+
+
+def cmd_wordcount(args, extra: List[str]) -> int:
+    word_stats = dm4.word_stats
+    if args.approximate:
+        stats = word_stats.approximate_words_in_files(args.files, error=args.error,
+                                                      top_k=args.top, workers=args.workers)
+        top = stats['most_common']
+    else:
+        stats = word_stats.count_words_in_files(args.files, workers=args.workers)
+        top = stats['frequencies'].most_common(args.top)
+    print(f"Total words : {stats['total_words']:,}")
+    print(f"Unique words: {stats['unique_words']:,}{' (estimate)' if args.approximate else ''}")
+    for word, count in top:
+        print(f"  {word:20} {count:,}")
+    return 0
+
+
+def _read_points(path: str) -> list:
+    points = []
+    with (sys.stdin if path == "-" else open(path)) as file:
+        for line in file:
+            fields = line.replace(",", " ").split()
+            if len(fields) >= 2:
+                points.append((float(fields[0]), float(fields[1])))
+    return points
+
+
+def cmd_geometry(args, extra: List[str]) -> int:
+    coordinates = dm4.coordinates
+    if args.random:
+        points = coordinates.random_points(args.random, seed=args.seed)
+    elif args.points:
+        points = _read_points(args.points)
+    else:
+        print("❌ Give a points file (x,y per line, '-' for stdin) or --random N", file=sys.stderr)
+        return 2
+    print(f"Points       : {len(points):,}")
+    if len(points) >= 2:
+        distance, point1, point2 = coordinates.closest_pair(points)
+        print(f"Closest pair : {point1} - {point2} (distance {distance:.4f})")
+    hull = coordinates.convex_hull(points)
+    print(f"Convex hull  : {len(hull)} vertices")
+    return 0
+
+
+def cmd_bench_startup(args, extra: List[str]) -> int:
+    results = benchmark_startup(args.repeat)
+    return 0 if results else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="dm4", description="DM4 student data tools.")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    ingest = commands.add_parser(
+        "ingest", add_help=False,
+        help="run the ingest server (options as for ingest_server.py, e.g. --stdin)")
+    ingest.set_defaults(handler=cmd_ingest)
+
+    query = commands.add_parser("query", help="filter the records of a saved snapshot")
+    query.add_argument("snapshot", help="pickle snapshot or columnar .scol file")
+    query.add_argument("--major", nargs="+")
+    query.add_argument("--grade", nargs="+")
+    query.add_argument("--name", help="prefix or misspelled name")
+    query.add_argument("--limit", type=int, default=20)
+    query.set_defaults(handler=cmd_query)
+
+    export = commands.add_parser("export", help="export a saved snapshot as text, CSV or JSON Lines")
+    export.add_argument("snapshot", help="pickle snapshot or columnar .scol file")
+    export.add_argument("--format", choices=("text", "csv", "jsonl"), default="text")
+    export.add_argument("--output")
+    export.add_argument("--compress", action="store_true", help="gzip the output")
+    export.set_defaults(handler=cmd_export)
+
+    wordcount = commands.add_parser("wordcount", help="word statistics for text files")
+    wordcount.add_argument("files", nargs="+")
+    wordcount.add_argument("--top", type=int, default=10)
+    wordcount.add_argument("--approximate", action="store_true", help="fixed-memory sketch")
+    wordcount.add_argument("--error", type=float, default=0.01)
+    wordcount.add_argument("--workers", type=int, default=1,
+                           help="processes for large inputs (default 1: no pool start-up)")
+    wordcount.set_defaults(handler=cmd_wordcount)
+
+    geometry = commands.add_parser("geometry", help="closest pair and convex hull of 2D points")
+    geometry.add_argument("points", nargs="?", help="file with 'x,y' per line, '-' for stdin")
+    geometry.add_argument("--random", type=int, metavar="N", help="use N random points instead")
+    geometry.add_argument("--seed", type=int, default=0)
+    geometry.set_defaults(handler=cmd_geometry)
+
+    bench = commands.add_parser("bench-startup", help="measure cold-start time of each subcommand")
+    bench.add_argument("--repeat", type=int, default=5)
+    bench.set_defaults(handler=cmd_bench_startup)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command != "ingest":
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    return args.handler(args, extra)
+
+
+# -----------------------------
+# STARTUP BENCHMARK
+# -----------------------------
+
+def _imported_modules(stderr: str) -> set:
+    """Module names from ``python -X importtime`` output."""
+    return {line.rsplit("|", 1)[1].strip() for line in stderr.splitlines()
+            if line.startswith("import time:") and "|" in line}
+
+
+def benchmark_startup(repeat: int = 5) -> dict:
+    """Median wall time of each subcommand in a fresh interpreter, plus heavy imports."""
+    import pickle
+    import statistics
+    import subprocess
+    import tempfile
+    import time
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = os.path.join(directory, "students.pkl")
+        with open(snapshot, "wb") as file:
+            pickle.dump({"S001": {"name": "Alice Johnson", "grade": "A", "major": "Physics"}}, file)
+        text = os.path.join(directory, "notes.txt")
+        with open(text, "w") as file:
+            file.write("Python is fun. Python is easy.\n")
+
+        cases = {
+            "python -c pass": ([sys.executable, "-c", "pass"], None),
+            "--help": ([sys.executable, "-m", "dm4", "--help"], None),
+            "wordcount": ([sys.executable, "-m", "dm4", "wordcount", text], None),
+            "geometry": ([sys.executable, "-m", "dm4", "geometry", "--random", "100"], None),
+            "query": ([sys.executable, "-m", "dm4", "query", snapshot, "--major", "Physics"], None),
+            "export": ([sys.executable, "-m", "dm4", "export", snapshot, "--format", "csv",
+                        "--output", os.path.join(directory, "out.csv")], None),
+            "ingest --stdin": ([sys.executable, "-m", "dm4", "ingest", "--stdin"],
+                               b"ID: 2025-001 | Name: Juan Cruz | Email: juan@school.edu | Age: 20\n"),
+        }
+        for name, (command, stdin) in cases.items():
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                completed = subprocess.run(command, input=stdin or b"", capture_output=True, env=env)
+                samples.append(time.perf_counter() - start)
+                if completed.returncode != 0:
+                    print(f"❌ {name} failed:\n{completed.stderr.decode(errors='replace')}")
+                    return {}
+            traced = subprocess.run([command[0], "-X", "importtime", *command[1:]],
+                                    input=stdin or b"", capture_output=True, env=env)
+            modules = _imported_modules(traced.stderr.decode(errors="replace"))
+            results[name] = {
+                'median_ms': statistics.median(samples) * 1000,
+                'modules': len(modules),
+                'heavy': sorted(modules.intersection(HEAVY_MODULES)),
+            }
+
+    print(f"{'command':16} {'median':>9} {'modules':>8}  heavy imports")
+    for name, result in results.items():
+        print(f"{name:16} {result['median_ms']:7.1f}ms {result['modules']:8}  "
+              f"{', '.join(result['heavy']) or '-'}")
+    return results
@@ -0,0 +1,365 @@
+import csv
+import gzip
+import json
+import os
+import pickle
+
+import pytest
+
+import dm4
+
+student_records = dm4.student_records
+
+RECORDS = {
+    "S001": {"name": "Alice Johnson", "grade": "A", "major": "Computer Science"},
+    "S002": {"name": "Bob Smith", "grade": "B+", "major": "Mathematics"},
+    "S003": {"name": "Charlie Brown", "grade": "A-", "major": "Physics"},
+}
+
+
+def make_file_system(directory, **options) -> "student_records.StudentFileSystem":
+    return student_records.StudentFileSystem(
+        filename_pickle=str(directory / "students.pkl"),
+        filename_text=str(directory / "students.txt"),
+        filename_indexed=str(directory / "students.srec"),
+        filename_columnar=str(directory / "students.scol"),
+        **options)
+
+
+def reload(directory, **options) -> dict:
+    file_system = make_file_system(directory, **options)
+    try:
+        return file_system.load_records()
+    finally:
+        file_system.close()
+
+
+# -----------------------------
+# JOURNAL
+# -----------------------------
+
+def test_journal_replays_changes_after_snapshot(tmp_path):
+    file_system = make_file_system(tmp_path, journal=True)
+    assert file_system.save_records(RECORDS)
+    assert file_system.save_change("S004", {"name": "Diana Prince", "grade": "A", "major": "History"})
+    assert file_system.delete_change("S002")
+    file_system.close()
+
+    expected = {**RECORDS, "S004": {"name": "Diana Prince", "grade": "A", "major": "History"}}
+    del expected["S002"]
+    assert reload(tmp_path, journal=True) == expected
+
+
+@pytest.mark.parametrize("damage", ["torn", "corrupt"])
+def test_journal_stops_at_damaged_frame_and_truncates_it(tmp_path, damage):
+    file_system = make_file_system(tmp_path, journal=True)
+    file_system.save_records(RECORDS)
+    file_system.save_change("S004", {"name": "Diana Prince", "grade": "A", "major": "History"})
+    file_system.save_change("S005", {"name": "Ed Norton", "grade": "C", "major": "Biology"})
+    file_system.close()
+
+    journal = file_system.filename_journal
+    with open(journal, "r+b") as file:
+        data = file.read()
+        if damage == "torn":
+            # A crash mid-append: a frame header promising more than was written.
+            file.write(student_records._FRAME_HEADER.pack(100, 0) + b"partial")
+        else:
+            # Flip the last payload byte of the final frame.
+            file.seek(len(data) - 1)
+            file.write(bytes([data[-1] ^ 0xFF]))
+
+    expected = {**RECORDS, "S004": {"name": "Diana Prince", "grade": "A", "major": "History"}}
+    if damage == "torn":
+        expected["S005"] = {"name": "Ed Norton", "grade": "C", "major": "Biology"}
+    assert reload(tmp_path, journal=True) == expected
+
+    # Appending after the damage must truncate it, or the new frame is unreachable.
+    file_system = make_file_system(tmp_path, journal=True)
+    file_system.save_change("S006", {"name": "Fiona Apple", "grade": "B", "major": "Music"})
+    file_system.close()
+    expected["S006"] = {"name": "Fiona Apple", "grade": "B", "major": "Music"}
+    assert reload(tmp_path, journal=True) == expected
+
+
+def test_journal_for_another_snapshot_is_ignored(tmp_path):
+    file_system = make_file_system(tmp_path, journal=True)
+    file_system.save_records(RECORDS)
+    file_system.save_change("S004", {"name": "Diana Prince", "grade": "A", "major": "History"})
+    file_system.close()
+
+    # The snapshot is replaced behind the journal's back.
+    with open(file_system.filename_pickle, "wb") as file:
+        pickle.dump({"S009": {"name": "Ivan Drago", "grade": "F", "major": "Boxing"}}, file)
+    assert reload(tmp_path, journal=True) == {"S009": {"name": "Ivan Drago", "grade": "F", "major": "Boxing"}}
+
+
+def _crash_on_replace(monkeypatch, destination):
+    """Make os.replace fail when it would rename onto ``destination``."""
+    replace = os.replace
+
+    def failing_replace(source, target):
+        if os.fspath(target) == destination:
+            raise OSError("simulated crash")
+        replace(source, target)
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+
+
+def test_leftover_next_journal_after_snapshot_swap_is_recovered(tmp_path, monkeypatch):
+    file_system = make_file_system(tmp_path, journal=True)
+    file_system.save_records(RECORDS)
+    records = dict(RECORDS)
+
+    # Hold the worker so a change lands between the snapshot copy and its
+    # install; the install must carry it over in the new (.next) journal.
+    with file_system._snapshot_lock:
+        future = file_system.save_records_async(records)
+        records["S004"] = {"name": "Diana Prince", "grade": "A", "major": "History"}
+        file_system.save_change("S004", records["S004"])
+        _crash_on_replace(monkeypatch, file_system.filename_journal)
+    assert future.result() is False
+    monkeypatch.undo()
+    assert os.path.exists(file_system._next_journal())
+
+    assert reload(tmp_path, journal=True) == records
+
+    file_system = make_file_system(tmp_path, journal=True)
+    records["S005"] = {"name": "Ed Norton", "grade": "C", "major": "Biology"}
+    file_system.save_change("S005", records["S005"])
+    file_system.close()
+    assert not os.path.exists(file_system._next_journal())
+    assert reload(tmp_path, journal=True) == records
+
+
+def test_leftover_next_journal_before_snapshot_swap_is_discarded(tmp_path, monkeypatch):
+    file_system = make_file_system(tmp_path, journal=True)
+    file_system.save_records(RECORDS)
+    file_system.save_change("S004", {"name": "Diana Prince", "grade": "A", "major": "History"})
+    _crash_on_replace(monkeypatch, file_system.filename_pickle)
+    assert file_system.save_records({"S009": {"name": "Ivan Drago", "grade": "F", "major": "Boxing"}}) is False
+    monkeypatch.undo()
+    assert os.path.exists(file_system._next_journal())
+
+    expected = {**RECORDS, "S004": {"name": "Diana Prince", "grade": "A", "major": "History"}}
+    assert reload(tmp_path, journal=True) == expected
+
+    file_system = make_file_system(tmp_path, journal=True)
+    file_system.save_change("S005", {"name": "Ed Norton", "grade": "C", "major": "Biology"})
+    file_system.close()
+    assert not os.path.exists(file_system._next_journal())
+    expected["S005"] = {"name": "Ed Norton", "grade": "C", "major": "Biology"}
+    assert reload(tmp_path, journal=True) == expected
+
+
+def test_compaction_keeps_every_change(tmp_path):
+    file_system = make_file_system(tmp_path, journal=True)
+    file_system.save_records(RECORDS)
+    records = dict(RECORDS)
+    for number in range(20):
+        student_id = f"S1{number:02d}"
+        records[student_id] = {"name": f"Student {number}", "grade": "B", "major": "Art"}
+        file_system.save_change(student_id, records[student_id])
+    assert file_system.compact(background=False)
+    records["S200"] = {"name": "Late Change", "grade": "C", "major": "Art"}
+    file_system.save_change("S200", records["S200"])
+    file_system.close()
+    assert reload(tmp_path, journal=True) == records
+
+
+# -----------------------------
+# BACKGROUND SAVES
+# -----------------------------
+
+def test_background_save_keeps_changes_journaled_after_it(tmp_path):
+    file_system = make_file_system(tmp_path, journal=True)
+    file_system.save_records(RECORDS)
+    records = dict(RECORDS)
+
+    with file_system._snapshot_lock:
+        future = file_system.save_records_async(records)
+        records["S004"] = {"name": "Diana Prince", "grade": "A", "major": "History"}
+        file_system.save_change("S004", records["S004"])
+        del records["S001"]
+        file_system.delete_change("S001")
+    assert future.result() is True
+    records["S005"] = {"name": "Ed Norton", "grade": "C", "major": "Biology"}
+    file_system.save_change("S005", records["S005"])
+    file_system.close()
+    assert reload(tmp_path, journal=True) == records
+
+
+def test_background_saves_interleaved_with_changes(tmp_path):
+    file_system = make_file_system(tmp_path, journal=True)
+    file_system.save_records({})
+    records = {}
+    for number in range(200):
+        student_id = f"S{number % 50:03d}"
+        if number % 7 == 3 and student_id in records:
+            del records[student_id]
+            file_system.delete_change(student_id)
+        else:
+            records[student_id] = {"name": f"Student {number}", "grade": "B", "major": "Art"}
+            file_system.save_change(student_id, records[student_id])
+        if number % 10 == 0:
+            file_system.save_records_async(records)
+    assert file_system.flush_saves()
+    file_system.close()
+    assert reload(tmp_path, journal=True) == records
+
+
+def test_save_records_supersedes_pending_background_save(tmp_path):
+    file_system = make_file_system(tmp_path, journal=True)
+    file_system.save_records(RECORDS)
+    with file_system._snapshot_lock:
+        future = file_system.save_records_async({"S009": {"name": "Old", "grade": "F", "major": "Art"}})
+    file_system.save_records(RECORDS)
+    future.result()
+    file_system.close()
+    assert reload(tmp_path, journal=True) == RECORDS
+
+
+@pytest.mark.parametrize("snapshot_format", ["pickle", "columnar"])
+def test_background_save_round_trip(tmp_path, snapshot_format):
+    file_system = make_file_system(tmp_path, snapshot_format=snapshot_format)
+    assert file_system.save_records_async(RECORDS).result() is True
+    file_system.close()
+    assert reload(tmp_path, snapshot_format=snapshot_format) == RECORDS
+
+
+# -----------------------------
+# COLUMNAR AND INDEXED FORMATS
+# -----------------------------
+
+MIXED_RECORDS = {
+    "S001": {"name": "Alice Johnson", "grade": "A", "major": "Computer Science"},
+    "S002": {"name": "", "grade": "A", "major": "Computer Science"},  # empty string
+    "S003": {"name": "Zoë Ångström", "grade": "B"},                   # missing major
+    "S004": {"grade": "A", "major": "Physics", "age": 21},            # extra field
+    "S005": {},                                                       # no fields at all
+    "S006": {"name": None, "grade": "C", "major": "Physics"},
+    "é-07": {"name": "日本 語", "grade": "A", "major": "Physics"},
+}
+
+
+@pytest.mark.parametrize("compression", [None, "zlib", "lzma", {"name": "lzma", "grade": None}])
+@pytest.mark.parametrize("records", [{}, {"S001": {}}, RECORDS, MIXED_RECORDS],
+                         ids=["empty", "no-fields", "plain", "mixed"])
+def test_columnar_round_trip(tmp_path, records, compression):
+    path = str(tmp_path / "students.scol")
+    student_records.write_columnar_records(path, records, compression)
+    assert student_records.read_columnar_records(path) == records
+
+
+def test_columnar_round_trip_high_cardinality(tmp_path):
+    # Enough distinct values to use plain strings and two-byte dictionary codes.
+    records = {f"S{number:05d}": {"name": f"Student {number}", "grade": f"G{number % 300}"}
+               for number in range(2000)}
+    path = str(tmp_path / "students.scol")
+    student_records.write_columnar_records(path, records)
+    assert student_records.read_columnar_records(path) == records
+
+
+def test_columnar_reads_selected_columns(tmp_path):
+    path = str(tmp_path / "students.scol")
+    student_records.write_columnar_records(path, MIXED_RECORDS)
+    assert student_records.read_columnar_records(path, ["major"]) == {
+        student_id: {"major": info["major"]} if "major" in info else {}
+        for student_id, info in MIXED_RECORDS.items()}
+    with pytest.raises(ValueError):
+        student_records.read_columns(path, ["nope"])
+
+
+def test_columnar_mode_round_trip(tmp_path):
+    file_system = make_file_system(tmp_path, snapshot_format="columnar", compression="zlib")
+    assert file_system.save_records(MIXED_RECORDS)
+    assert file_system.load_records() == MIXED_RECORDS
+    file_system.close()
+
+
+@pytest.mark.parametrize("records", [{}, RECORDS, MIXED_RECORDS], ids=["empty", "plain", "mixed"])
+def test_indexed_round_trip(tmp_path, records):
+    path = str(tmp_path / "students.srec")
+    student_records.write_indexed_records(path, records)
+    with student_records.IndexedRecords(path) as indexed:
+        assert len(indexed) == len(records)
+        assert dict(indexed) == records
+        for student_id, info in records.items():
+            assert student_id in indexed
+            assert indexed[student_id] == info
+        assert "S999" not in indexed
+        assert 1 not in indexed
+        with pytest.raises(KeyError):
+            indexed["S999"]
+
+
+def test_indexed_lookup_through_file_system(tmp_path):
+    file_system = make_file_system(tmp_path)
+    assert file_system.save_indexed(MIXED_RECORDS)
+    assert file_system.get("é-07") == MIXED_RECORDS["é-07"]
+    assert file_system.get("S005") == {}
+    assert file_system.get("S999") is None
+    # Saving again replaces the open view.
+    assert file_system.save_indexed(RECORDS)
+    assert file_system.get("S001") == RECORDS["S001"]
+    assert file_system.get("é-07") is None
+    file_system.close()
+
+
+# -----------------------------
+# APPLYING CHANGES AND EXPORTS
+# -----------------------------
+
+CHANGES = [
+    (1, "add", "S004", {"name": "Diana Prince", "grade": "A", "major": "History"}),
+    (2, "update", "S001", {"name": "Alice Johnson", "grade": "A+", "major": "Computer Science"}),
+    (3, "delete", "S002", None),
+]
+
+
+@pytest.mark.parametrize("options", [{}, {"journal": True}, {"snapshot_format": "columnar"}],
+                         ids=["pickle", "journal", "columnar"])
+def test_apply_changes(tmp_path, options):
+    file_system = make_file_system(tmp_path, **options)
+    file_system.save_records(RECORDS)
+    assert file_system.apply_changes(CHANGES)
+    file_system.close()
+
+    expected = {**RECORDS, "S004": CHANGES[0][3], "S001": CHANGES[1][3]}
+    del expected["S002"]
+    assert reload(tmp_path, **options) == expected
+
+
+def test_apply_changes_leaves_unreadable_snapshot_alone(tmp_path):
+    file_system = make_file_system(tmp_path)
+    with open(file_system.filename_pickle, "wb") as file:
+        file.write(b"not a pickle")
+    assert file_system.apply_changes(CHANGES) is False
+    with open(file_system.filename_pickle, "rb") as file:
+        assert file.read() == b"not a pickle"
+
+
+def test_apply_changes_without_snapshot_starts_empty(tmp_path):
+    file_system = make_file_system(tmp_path)
+    assert file_system.apply_changes(CHANGES)
+    assert reload(tmp_path) == {"S004": CHANGES[0][3], "S001": CHANGES[1][3]}
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_export_csv_and_jsonl(tmp_path, compress):
+    records = {**RECORDS, "S004": {"name": 'Diana "DP", Prince', "grade": "A", "major": "History"}}
+    file_system = make_file_system(tmp_path)
+    opener = gzip.open if compress else open
+
+    stats = file_system.export_stream(records, "csv", compress=compress)
+    assert stats["records"] == len(records)
+    with opener(str(tmp_path / ("students.csv.gz" if compress else "students.csv")), "rt",
+                newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert {row.pop("student_id"): row for row in rows} == records
+
+    # Any iterable of pairs works, not only a dict.
+    file_system.export_stream(iter(records.items()), "jsonl", compress=compress)
+    with opener(str(tmp_path / ("students.jsonl.gz" if compress else "students.jsonl")), "rt") as file:
+        rows = [json.loads(line) for line in file]
+    assert {row.pop("student_id"): row for row in rows} == records